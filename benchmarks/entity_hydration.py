@@ -0,0 +1,110 @@
+"""CPU cost of rebuilding the entities loaded from the database.
+
+Compares, per entity, rebuilding orders and customers from their documents with
+validation, as when `DB_REVALIDATE_ON_LOAD` is set, against the trusted hydration
+the repositories use otherwise. Nothing is written, but Beanie still needs the
+database of the settings to be reachable to initialize the documents.
+
+    python -m benchmarks.entity_hydration --entities 20000 --items 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import List
+from unittest.mock import patch
+
+from beanie import PydanticObjectId
+
+from src.domain.__shared.value_objects import CPF, EmailAddress, UniqueEntityId
+from src.domain.customer import Customer
+from src.domain.order import Order
+from src.domain.order.order_item import OrderItem
+from src.infra.config import settings
+from src.infra.gateways.database.models import (
+    CustomerPersistenceModel,
+    OrderPersistenceModel,
+)
+from src.infra.gateways.database.models.base import PersistenceModel
+from src.infra.gateways.database.setup import initialize_database
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--entities", type=int, default=20000)
+    parser.add_argument("--items", type=int, default=5, help="items per order")
+    parser.add_argument("--rounds", type=int, default=5, help="keeping the best one")
+    return parser.parse_args()
+
+
+def create_order_document(items: int) -> OrderPersistenceModel:
+    document = OrderPersistenceModel.from_entity(
+        Order(
+            customer_id=UniqueEntityId(str(PydanticObjectId())),
+            items=[
+                OrderItem(product_id=str(index), quantity=1, value=10.0)
+                for index in range(items)
+            ],
+        )
+    )
+    document.id = PydanticObjectId()
+    return document
+
+
+def create_customer_document() -> CustomerPersistenceModel:
+    document = CustomerPersistenceModel.from_entity(
+        Customer(
+            name="John Doe",
+            email=EmailAddress(address="john.doe@example.com"),
+            cpf=CPF(number="52998224725"),
+        )
+    )
+    document.id = PydanticObjectId()
+    return document
+
+
+def measure(documents: List[PersistenceModel], trusted: bool, rounds: int) -> float:
+    """Returns the best CPU time, in seconds, of rebuilding a single entity."""
+    best = float("inf")
+    with patch.object(settings, "DB_REVALIDATE_ON_LOAD", not trusted):
+        for _ in range(rounds):
+            started = time.process_time()
+            for document in documents:
+                document.to_entity()
+            best = min(best, time.process_time() - started)
+    return best / len(documents)
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with initialize_database(
+        settings.DB_CONNECTION.get_secret_value(), settings.DB_NAME
+    ):
+        cases = [
+            (
+                f"order ({args.items} items)",
+                [create_order_document(args.items) for _ in range(args.entities)],
+            ),
+            (
+                "customer",
+                [create_customer_document() for _ in range(args.entities)],
+            ),
+        ]
+        for name, documents in cases:
+            validated = measure(documents, trusted=False, rounds=args.rounds)
+            trusted = measure(documents, trusted=True, rounds=args.rounds)
+            report(name, validated, trusted)
+
+
+def report(name: str, validated: float, trusted: float) -> None:
+    sys.stdout.write(
+        f"{name}:\n"
+        f"  validated:  {validated * 1e6:.1f}us/entity\n"
+        f"  trusted:    {trusted * 1e6:.1f}us/entity\n"
+        f"  saved:      {(validated - trusted) * 1e6:.1f}us/entity "
+        f"({1 - trusted / validated:.0%})\n"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
@@ -0,0 +1,133 @@
+"""Product lookup throughput against the local product service stand-in.
+
+Simulates concurrent checkouts, each looking up the products of a random order, through
+the product gateway bound in process to the stand-in, and reports the throughput and
+latency percentiles. Runs offline:
+
+    python -m benchmarks.product_lookups --concurrency 64 --latency 0.02 --error-rate 0.01
+
+To load-test the whole checkout instead, run the API with
+`PRODUCT_SERVICE_STAND_IN_ENABLED=true`, or point `PRODUCT_SERVICE_URL` to
+`make product-stand-in`.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from typing import List
+
+import httpx
+
+from src.domain.__shared.error.external_service_error import ExternalServiceError
+from src.domain.__shared.interfaces.product_service import IProductService
+from src.infra.cache import TTLCache
+from src.infra.gateways.external_services.cached_product_service import (
+    CachedProductService,
+)
+from src.infra.gateways.external_services.product_service import ProductServiceImpl
+from src.infra.gateways.external_services.product_service_stand_in import (
+    StandInBehavior,
+    create_product_service_stand_in,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--items", type=int, default=5, help="products per order")
+    parser.add_argument("--catalog-size", type=int, default=1000)
+    parser.add_argument(
+        "--distribution",
+        choices=["constant", "uniform", "exponential", "lognormal"],
+        default="lognormal",
+    )
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--latency-spread", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--no-batch", action="store_true")
+    parser.add_argument("--cache", action="store_true", help="cache the products")
+    parser.add_argument("--seed", type=int, default=42)
+    return parser.parse_args()
+
+
+async def run(args: argparse.Namespace) -> None:
+    stand_in = create_product_service_stand_in(
+        catalog_size=args.catalog_size,
+        behavior=StandInBehavior(
+            latency_distribution=args.distribution,
+            latency=args.latency,
+            latency_spread=args.latency_spread,
+            error_rate=args.error_rate,
+            timeout_rate=args.timeout_rate,
+            batch_enabled=not args.no_batch,
+            seed=args.seed,
+        ),
+    )
+    gateway = ProductServiceImpl(
+        base_url="http://product-service.stand-in",
+        transport=httpx.ASGITransport(app=stand_in),
+        timeout=httpx.Timeout(1.0),
+    )
+    product_service: IProductService = gateway
+    if args.cache:
+        product_service = CachedProductService(
+            gateway, TTLCache(max_entries=args.catalog_size, ttl=300)
+        )
+
+    rng = random.Random(args.seed)
+    orders = [
+        [str(rng.randint(1, args.catalog_size)) for _ in range(args.items)]
+        for _ in range(args.lookups)
+    ]
+    latencies: List[float] = []
+    failures = 0
+    queue: asyncio.Queue = asyncio.Queue()
+    for order in orders:
+        queue.put_nowait(order)
+
+    async def worker() -> None:
+        nonlocal failures
+        while not queue.empty():
+            order = queue.get_nowait()
+            started = time.perf_counter()
+            try:
+                await product_service.fetch_products_by_ids(order)
+            except ExternalServiceError:
+                failures += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+
+    await gateway.open()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    finally:
+        elapsed = time.perf_counter() - started
+        await gateway.close()
+
+    report(args.lookups, failures, elapsed, latencies)
+
+
+def report(lookups: int, failures: int, elapsed: float, latencies: List[float]) -> None:
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    lines = [
+        f"lookups:    {lookups} in {elapsed:.2f}s ({lookups / elapsed:.0f}/s)",
+        f"failures:   {failures}",
+    ]
+    if percentiles:
+        lines.append(
+            "latency:    "
+            f"p50={percentiles[49] * 1000:.1f}ms "
+            f"p95={percentiles[94] * 1000:.1f}ms "
+            f"p99={percentiles[98] * 1000:.1f}ms"
+        )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
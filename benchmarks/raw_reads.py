@@ -0,0 +1,119 @@
+"""CPU cost of mapping the documents read by the repositories to their entities.
+
+Compares, per read, building the Beanie document of a raw document and then its
+entity, as the Beanie repositories do, against mapping the raw document straight to
+its entity, as the raw ones do when `DB_RAW_READS_ENABLED` is set. The database
+round trip is the same either way and is left out: nothing is written, but Beanie
+still needs the database of the settings to be reachable to initialize the
+documents.
+
+    python -m benchmarks.raw_reads --reads 20000 --items 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from beanie import PydanticObjectId
+
+from src.domain.__shared.entity import AggregateRoot
+from src.domain.__shared.value_objects import CPF, EmailAddress, UniqueEntityId
+from src.domain.customer import Customer
+from src.domain.order import Order
+from src.domain.order.order_item import OrderItem
+from src.infra.config import settings
+from src.infra.gateways.database.models import (
+    CustomerPersistenceModel,
+    OrderPersistenceModel,
+)
+from src.infra.gateways.database.setup import initialize_database
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--reads", type=int, default=20000)
+    parser.add_argument("--items", type=int, default=5, help="items per order")
+    parser.add_argument("--rounds", type=int, default=5, help="keeping the best one")
+    return parser.parse_args()
+
+
+def create_order_document(items: int) -> Dict[str, Any]:
+    document = OrderPersistenceModel.from_entity(
+        Order(
+            customer_id=UniqueEntityId(str(PydanticObjectId())),
+            items=[
+                OrderItem(product_id=str(index), quantity=1, value=10.0)
+                for index in range(items)
+            ],
+        )
+    )
+    document.id = PydanticObjectId()
+    return document.model_dump(by_alias=True)
+
+
+def create_customer_document() -> Dict[str, Any]:
+    document = CustomerPersistenceModel.from_entity(
+        Customer(
+            name="John Doe",
+            email=EmailAddress(address="john.doe@example.com"),
+            cpf=CPF(number="52998224725"),
+        )
+    )
+    document.id = PydanticObjectId()
+    return document.model_dump(by_alias=True)
+
+
+def measure(
+    documents: List[Dict[str, Any]],
+    to_entity: Callable[[Dict[str, Any]], AggregateRoot],
+    rounds: int,
+) -> float:
+    """Returns the best CPU time, in seconds, of mapping a single document."""
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.process_time()
+        for document in documents:
+            to_entity(document)
+        best = min(best, time.process_time() - started)
+    return best / len(documents)
+
+
+async def run(args: argparse.Namespace) -> None:
+    async with initialize_database(
+        settings.DB_CONNECTION.get_secret_value(), settings.DB_NAME
+    ):
+        cases = [
+            (
+                f"order ({args.items} items)",
+                OrderPersistenceModel,
+                [create_order_document(args.items) for _ in range(args.reads)],
+            ),
+            (
+                "customer",
+                CustomerPersistenceModel,
+                [create_customer_document() for _ in range(args.reads)],
+            ),
+        ]
+        for name, model, documents in cases:
+            beanie = measure(
+                documents,
+                lambda document: model.model_validate(document).to_entity(),
+                args.rounds,
+            )
+            raw = measure(documents, model.raw_to_entity, args.rounds)
+            report(name, beanie, raw)
+
+
+def report(name: str, beanie: float, raw: float) -> None:
+    sys.stdout.write(
+        f"{name}:\n"
+        f"  beanie:  {beanie * 1e6:.1f}us/read\n"
+        f"  raw:     {raw * 1e6:.1f}us/read\n"
+        f"  saved:   {(beanie - raw) * 1e6:.1f}us/read ({1 - raw / beanie:.0%})\n"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
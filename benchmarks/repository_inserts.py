@@ -0,0 +1,128 @@
+"""CPU cost of returning inserted aggregates from the repositories.
+
+Compares, per insert, mapping the aggregate to its document and back, as inserts used
+to return them, against mapping it once and assigning the generated identifier to it,
+as they do now. The database round trip is the same either way and is left out:
+nothing is written, but Beanie still needs the database of the settings to be
+reachable to initialize the documents.
+
+    python -m benchmarks.repository_inserts --inserts 20000 --items 5
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from typing import Callable, List
+
+from beanie import PydanticObjectId
+
+from src.domain.__shared.entity import AggregateRoot
+from src.domain.__shared.value_objects import CPF, EmailAddress, UniqueEntityId
+from src.domain.customer import Customer
+from src.domain.order import Order
+from src.domain.order.order_item import OrderItem
+from src.infra.config import settings
+from src.infra.gateways.database.models import (
+    CustomerPersistenceModel,
+    OrderPersistenceModel,
+)
+from src.infra.gateways.database.models.base import PersistenceModel
+from src.infra.gateways.database.setup import initialize_database
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--inserts", type=int, default=20000)
+    parser.add_argument("--items", type=int, default=5, help="items per order")
+    parser.add_argument("--rounds", type=int, default=5, help="keeping the best one")
+    return parser.parse_args()
+
+
+def create_order(items: int) -> Order:
+    return Order(
+        customer_id=UniqueEntityId(str(PydanticObjectId())),
+        items=[
+            OrderItem(product_id=str(index), quantity=1, value=10.0)
+            for index in range(items)
+        ],
+    )
+
+
+def create_customer() -> Customer:
+    return Customer(
+        name="John Doe",
+        email=EmailAddress(address="john.doe@example.com"),
+        cpf=CPF(number="52998224725"),
+    )
+
+
+def rehydrate(
+    aggregate: AggregateRoot, to_document: Callable[..., PersistenceModel]
+) -> AggregateRoot:
+    document = to_document(aggregate)
+    document.id = PydanticObjectId()
+    return document.to_entity()
+
+
+def assign_id(
+    aggregate: AggregateRoot, to_document: Callable[..., PersistenceModel]
+) -> AggregateRoot:
+    document = to_document(aggregate)
+    document.id = PydanticObjectId()
+    aggregate.assign_id(UniqueEntityId(str(document.id)))
+    return aggregate
+
+
+def measure(
+    insert: Callable[[AggregateRoot, Callable[..., PersistenceModel]], AggregateRoot],
+    aggregates: List[AggregateRoot],
+    to_document: Callable[..., PersistenceModel],
+    rounds: int,
+) -> float:
+    """Returns the best CPU time, in seconds, of a single insert."""
+    best = float("inf")
+    for _ in range(rounds):
+        for aggregate in aggregates:
+            aggregate._id = None
+        started = time.process_time()
+        for aggregate in aggregates:
+            insert(aggregate, to_document)
+        best = min(best, time.process_time() - started)
+    return best / len(aggregates)
+
+
+async def run(args: argparse.Namespace) -> None:
+    cases = [
+        (
+            f"order ({args.items} items)",
+            [create_order(args.items) for _ in range(args.inserts)],
+            OrderPersistenceModel.from_entity,
+        ),
+        (
+            "customer",
+            [create_customer() for _ in range(args.inserts)],
+            CustomerPersistenceModel.from_entity,
+        ),
+    ]
+    async with initialize_database(
+        settings.DB_CONNECTION.get_secret_value(), settings.DB_NAME
+    ):
+        for name, aggregates, to_document in cases:
+            rehydrated = measure(rehydrate, aggregates, to_document, args.rounds)
+            assigned = measure(assign_id, aggregates, to_document, args.rounds)
+            report(name, rehydrated, assigned)
+
+
+def report(name: str, rehydrated: float, assigned: float) -> None:
+    sys.stdout.write(
+        f"{name}:\n"
+        f"  rehydrate:  {rehydrated * 1e6:.1f}us/insert\n"
+        f"  assign id:  {assigned * 1e6:.1f}us/insert\n"
+        f"  saved:      {(rehydrated - assigned) * 1e6:.1f}us/insert "
+        f"({1 - assigned / rehydrated:.0%})\n"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(run(parse_args()))
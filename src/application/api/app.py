@@ -10,12 +10,24 @@ from .exception_handlers import (
     general_exception_handler,
     not_found_exception_handler,
 )
-from .middlewares import setup_cors
+from .middlewares import setup_cors, setup_server_timing
 from .routers import register_routes
+from ..di import dependency_injector
+from ..use_cases.order.checkout.checkout_dispatcher import (
+    CheckoutDispatcher,
+    initialize_checkout_dispatcher,
+)
 from ..error import NotFoundError
 from ...domain.__shared.error import DomainError
 from ...domain.__shared.validator import ValidationError as DomainValidationError
 from ...infra.gateways.database.setup import initialize_database
+from ...infra.gateways.external_services.catalog_refresher import CatalogRefresher
+from ...infra.gateways.external_services.product_service import ProductServiceImpl
+from ...infra.gateways.external_services.setup import (
+    initialize_product_catalog,
+    initialize_product_service,
+)
+from ...infra.outbox import OutboxDispatcher, initialize_outbox_dispatcher
 
 
 @asynccontextmanager
@@ -23,11 +35,16 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: RUF029
     """Lifespan context manager for FastAPI application.
 
     This function defines the startup and shutdown logic for the FastAPI application.
-    It connects to the database before the application starts receiving requests,
-    and disconnects from the database after the application has finished handling requests.
+    It connects to the database and opens the product service connection pool before the
+    application starts receiving requests, and releases both after the application has
+    finished handling requests. When enabled, the product catalog is also preloaded
+    before the first request and refreshed periodically afterward, and the workers
+    performing checkouts in the background are run, until the checkouts they accepted
+    are performed. The order events are delivered in the background meanwhile.
 
-    This ensures that the database connection is available for the
-    entire lifespan of the application, and is properly cleaned up afterward.
+    This ensures that the database connection and the pooled product service connections
+    are available for the entire lifespan of the application, and are properly cleaned
+    up afterward.
 
     Args:
         _app (FastAPI): The FastAPI application instance.
@@ -38,8 +55,14 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: RUF029
     For more details, refer to the FastAPI documentation on Lifespan Events:
     https://fastapi.tiangolo.com/advanced/events/#lifespan-events
     """
-    async with initialize_database(
-        settings.DB_CONNECTION.get_secret_value(), settings.DB_NAME
+    async with (
+        initialize_database(
+            settings.DB_CONNECTION.get_secret_value(), settings.DB_NAME
+        ),
+        initialize_product_service(dependency_injector.get(ProductServiceImpl)),
+        initialize_product_catalog(dependency_injector.get(CatalogRefresher)),
+        initialize_outbox_dispatcher(dependency_injector.get(OutboxDispatcher)),
+        initialize_checkout_dispatcher(dependency_injector.get(CheckoutDispatcher)),
     ):
         yield
 
@@ -53,6 +76,8 @@ app = FastAPI(
 
 register_routes(app)
 setup_cors(app, ["*"])  # allow all origins for now
+if settings.SERVER_TIMING_ENABLED:
+    setup_server_timing(app)
 
 app.add_exception_handler(DomainValidationError, domain_validation_exception_handler)
 app.add_exception_handler(NotFoundError, not_found_exception_handler)
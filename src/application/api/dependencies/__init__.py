@@ -0,0 +1,3 @@
+from .request_deadline import request_deadline
+
+__all__ = ["request_deadline"]
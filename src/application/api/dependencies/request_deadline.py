@@ -0,0 +1,39 @@
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Header
+
+from src.infra.deadline import Deadline, start_deadline
+
+
+def request_deadline(
+    default_timeout: Optional[float],
+) -> Callable[..., Awaitable[Optional[Deadline]]]:
+    """Builds the dependency setting the deadline of the requests of a route.
+
+    Clients may shorten the time budget of a request with the `X-Request-Timeout`
+    header, in seconds, typically to the time they are willing to wait for it. They
+    cannot extend it past the default of the route.
+
+    Args:
+        default_timeout: The time budget, in seconds, of the requests of the route,
+         or None for no default.
+
+    Returns:
+        Callable[..., Awaitable[Optional[Deadline]]]: The dependency.
+    """
+
+    async def set_request_deadline(
+        request_timeout: Optional[float] = Header(
+            default=None,
+            alias="X-Request-Timeout",
+            gt=0,
+            description="The time, in seconds, the client waits for the response",
+        ),
+    ) -> Optional[Deadline]:
+        timeouts = [t for t in (request_timeout, default_timeout) if t is not None]
+        return start_deadline(min(timeouts)) if timeouts else None
+
+    return set_request_deadline
+
+
+__all__ = ["request_deadline"]
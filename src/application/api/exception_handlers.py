@@ -1,13 +1,51 @@
 from http import HTTPStatus
+from typing import Any, Tuple
 
 from fastapi import Request
 from starlette.responses import JSONResponse, Response
 
-from src.application.error import NotFoundError
-from src.domain.__shared.error import DomainError
+from src.application.error import NotFoundError, ServiceUnavailableError
+from src.domain.__shared.error import DeadlineExceededError, DomainError
 from src.domain.__shared.validator import ValidationError as DomainValidationError
 
 
+def describe_error(exc: Exception) -> Tuple[HTTPStatus, Any]:
+    """Describes an error as an HTTP status code and error details.
+
+    The description is the one the exception handlers below respond with, so errors
+    reported in the body of a successful response, such as the outcomes of a bulk
+    operation, look the same as errors failing a whole request.
+
+    Args:
+        exc: The error.
+
+    Returns:
+        Tuple[HTTPStatus, Any]: The status code and the `detail` of the error.
+    """
+    if isinstance(exc, DomainValidationError):
+        error_type = "value_error"
+        return HTTPStatus.UNPROCESSABLE_ENTITY, [
+            {
+                "loc": e.loc,
+                "msg": e.msg,
+                "type": error_type,
+            }
+            for e in exc.errors
+        ]
+    if isinstance(exc, NotFoundError):
+        return HTTPStatus.NOT_FOUND, exc.message
+    if isinstance(exc, ServiceUnavailableError):
+        return HTTPStatus.SERVICE_UNAVAILABLE, exc.message
+    if isinstance(exc, DeadlineExceededError):
+        return HTTPStatus.GATEWAY_TIMEOUT, exc.message
+    if isinstance(exc, DomainError):
+        return HTTPStatus.BAD_REQUEST, exc.message
+    return HTTPStatus.INTERNAL_SERVER_ERROR, (
+        "Ocorreu um erro ao processar sua solicitação."
+        " Por favor, tente novamente mais tarde."
+    )
+
+
 def domain_validation_exception_handler(_request: Request, exc: Exception) -> Response:
     """Handles DomainValidationError exceptions.
 
@@ -27,20 +65,7 @@ def domain_validation_exception_handler(_request: Request, exc: Exception) -> Re
         exc: Re-raises any other exception type for further handling.
     """
     if isinstance(exc, DomainValidationError):
-        error_type = "value_error"
-        return JSONResponse(
-            status_code=HTTPStatus.UNPROCESSABLE_ENTITY,
-            content={
-                "detail": [
-                    {
-                        "loc": e.loc,
-                        "msg": e.msg,
-                        "type": error_type,
-                    }
-                    for e in exc.errors
-                ]
-            },
-        )
+        return _error_response(exc)
 
     raise exc
 
@@ -63,10 +88,7 @@ def not_found_exception_handler(_request: Request, exc: Exception) -> Response:
         exc: Re-raises any other exception type for further handling.
     """
     if isinstance(exc, NotFoundError):
-        return JSONResponse(
-            status_code=HTTPStatus.NOT_FOUND,
-            content={"detail": exc.message},
-        )
+        return _error_response(exc)
 
     raise exc
 
@@ -76,7 +98,9 @@ def domain_exception_handler(_request: Request, exc: Exception) -> Response:
 
     This handler is designed to manage `DomainError` exceptions, which
     represent errors specific to the application's domain logic. It generates
-    a JSON response with a 400 Bad Request status code and the error message.
+    a JSON response with a 400 Bad Request status code and the error message,
+    503 Service Unavailable for requests refused because of overload, or 504 Gateway
+    Timeout for requests whose deadline expired.
 
     Args:
         _request: The incoming FastAPI request object (unused in this handler).
@@ -89,15 +113,12 @@ def domain_exception_handler(_request: Request, exc: Exception) -> Response:
         exc: Re-raises any other exception type for further handling.
     """
     if isinstance(exc, DomainError):
-        return JSONResponse(
-            status_code=HTTPStatus.BAD_REQUEST,
-            content={"detail": exc.message},
-        )
+        return _error_response(exc)
 
     raise exc
 
 
-def general_exception_handler(_request: Request, _exc: Exception) -> Response:
+def general_exception_handler(_request: Request, exc: Exception) -> Response:
     """Handles general exceptions.
 
     This handler acts as a catch-all for any unhandled exceptions. It prints
@@ -106,23 +127,21 @@ def general_exception_handler(_request: Request, _exc: Exception) -> Response:
 
     Args:
         _request: The incoming FastAPI request object (unused in this handler).
-        _exc: The exception object.
+        exc: The exception object.
 
     Returns:
         A JSON response indicating an internal server error.
     """
-    return JSONResponse(
-        status_code=HTTPStatus.INTERNAL_SERVER_ERROR,
-        content={
-            "detail": (
-                "Ocorreu um erro ao processar sua solicitação."
-                " Por favor, tente novamente mais tarde."
-            )
-        },
-    )
+    return _error_response(exc)
+
+
+def _error_response(exc: Exception) -> Response:
+    status_code, detail = describe_error(exc)
+    return JSONResponse(status_code=status_code, content={"detail": detail})
 
 
 __all__ = [
+    "describe_error",
     "domain_exception_handler",
     "domain_validation_exception_handler",
     "general_exception_handler",
@@ -1,3 +1,4 @@
 from .cors_middleware import setup_cors
+from .server_timing_middleware import setup_server_timing
 
-__all__ = ["setup_cors"]
+__all__ = ["setup_cors", "setup_server_timing"]
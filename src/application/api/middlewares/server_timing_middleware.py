@@ -0,0 +1,54 @@
+import time
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.application.instrumentation import collect_stage_timings
+
+
+class ServerTimingMiddleware:
+    """Reports the duration of the request stages in the `Server-Timing` header.
+
+    Every stage measured while handling the request is listed, followed by the total
+    time spent until the response started, so the overlap of concurrent stages can be
+    read from any HTTP client or browser developer tools.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        with collect_stage_timings() as timings:
+
+            async def send_with_server_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    total = (time.perf_counter() - started) * 1000
+                    metrics = [f"{name};dur={dur:.1f}" for name, dur in timings.items()]
+                    metrics.append(f"total;dur={total:.1f}")
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", ", ".join(metrics))
+                await send(message)
+
+            await self.app(scope, receive, send_with_server_timing)
+
+
+def setup_server_timing(app: FastAPI) -> None:
+    """Report the duration of the request stages in the `Server-Timing` header.
+
+    Args:
+        app: The FastAPI application instance.
+
+    Returns:
+        None
+    """
+    app.add_middleware(ServerTimingMiddleware)
+
+
+__all__ = ["ServerTimingMiddleware", "setup_server_timing"]
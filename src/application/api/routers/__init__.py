@@ -2,6 +2,7 @@ from fastapi import FastAPI
 
 from .customer import customer_router
 from .health_check_route import router as health_check_router
+from .metrics_route import router as metrics_router
 from .order import order_router
 
 
@@ -14,6 +15,7 @@ def register_routes(app: FastAPI) -> None:
     prefix = "/api/v1"
 
     app.include_router(health_check_router)
+    app.include_router(metrics_router)
     app.include_router(customer_router, prefix=prefix)
     app.include_router(order_router, prefix=prefix)
 
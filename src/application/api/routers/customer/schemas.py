@@ -53,8 +53,8 @@ class CustomerDetailsOut(CustomerSummaryOut):
     def from_dto(dto: CustomerCreatedDTO | CustomerDTO) -> "CustomerDetailsOut":
         return CustomerDetailsOut(
             name=dto.name,
-            cpf=CPFStr(dto.cpf.number),
-            email=dto.email.address,  # type: ignore
+            cpf=CPFStr(str(dto.cpf)),
+            email=str(dto.email),  # type: ignore
             external_id=PydanticExternalEntityId(dto.external_id),
             created_at=dto.created_at,
         )
@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from src.application.di import dependency_injector
+from src.infra.metrics import MetricsRegistry
+
+router = APIRouter()
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    tags=["Health Check"],
+    description="Expõe as métricas da aplicação no formato texto do Prometheus.",
+)
+def metrics(
+    registry: MetricsRegistry = Depends(  # noqa: B008
+        lambda: dependency_injector.get(MetricsRegistry)
+    ),
+) -> str:
+    """Expose the metrics collected by the worker.
+
+    The metrics are rendered in the Prometheus text exposition format, so they can be
+    scraped by Prometheus compatible monitoring systems.
+
+    Returns:
+        str: The current metric samples.
+    """
+    return registry.render()
+
+
+__all__ = ["router"]
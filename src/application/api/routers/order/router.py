@@ -1,27 +1,278 @@
+from datetime import datetime
 from http import HTTPStatus
+from typing import AsyncIterator, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from src.application.api.routers.order.schemas import OrderIn, OrderCreationOut
+from src.application.api.dependencies import request_deadline
+from src.application.api.routers.order.schemas import (
+    BulkOrderCreationOut,
+    BulkOrderIn,
+    BulkOrderResultOut,
+    CheckoutStatusOut,
+    ExportFormat,
+    ExportedOrderOut,
+    OrderIn,
+    OrderCreationOut,
+    OrderSummaryPageOut,
+    QuoteIn,
+    QuoteOut,
+)
+from src.application.api.types import PydanticExternalEntityId
 from src.application.di import dependency_injector
+from src.application.error import NotFoundError
 from src.application.use_cases.order.checkout.checkout import CheckoutUseCase
+from src.application.use_cases.order.checkout.checkout_dispatcher import (
+    CheckoutDispatcher,
+)
+from src.application.use_cases.order.export import (
+    ExportedOrderDTO,
+    ExportOrdersUseCase,
+)
+from src.application.use_cases.order.list_orders import ListOrdersUseCase
+from src.application.use_cases.order.quote.quote import QuoteUseCase
+from src.domain.order.repository import MAX_PAGE_SIZE
+from src.infra.config import settings
 
 router = APIRouter(tags=["Order"], prefix="/orders")
 
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_EXPORT_CHUNK_SIZE = 64 * 1024
+
+
+@router.post(
+    "/quote",
+    response_model=QuoteOut,
+    dependencies=[Depends(request_deadline(settings.ORDER_CHECKOUT_TIMEOUT))],
+)
+async def quote(
+    quote_in: QuoteIn,
+    quote_use_case: QuoteUseCase = Depends(
+        lambda: dependency_injector.get(QuoteUseCase)
+    ),
+    # noqa: B008
+) -> QuoteOut:
+    """Price a cart ahead of its checkout.
+
+    The prices are guaranteed until the quote expires: a checkout of the same
+    products sent with the `quote_token` before then is priced from the quote.
+    """
+    quoted = await quote_use_case.quote(quote_in.items)
+    return QuoteOut.model_validate(quoted, from_attributes=True)
+
 
 @router.post(
-    "/checkout", response_model=OrderCreationOut, status_code=HTTPStatus.CREATED
+    "/checkout",
+    response_model=OrderCreationOut,
+    status_code=HTTPStatus.CREATED,
+    responses={HTTPStatus.ACCEPTED: {"model": OrderCreationOut}},
+    dependencies=[Depends(request_deadline(settings.ORDER_CHECKOUT_TIMEOUT))],
 )
 async def checkout(
     order_in: OrderIn,
+    request: Request,
+    response: Response,
+    idempotency_key: Optional[str] = Header(
+        default=None,
+        alias="Idempotency-Key",
+        max_length=255,
+        description="Identifies the checkout across retries, so it is made only once",
+    ),
+    prefer: Optional[str] = Header(
+        default=None,
+        description="`respond-async` to have the checkout performed in the background",
+    ),
     checkout_use_case: CheckoutUseCase = Depends(
         lambda: dependency_injector.get(CheckoutUseCase)
     ),
+    checkout_dispatcher: CheckoutDispatcher = Depends(
+        lambda: dependency_injector.get(CheckoutDispatcher)
+    ),
     # noqa: B008
 ) -> OrderCreationOut:
-    """Process a fake checkout by adding selected products to the order queue."""
-    order = await checkout_use_case.checkout(order_in)
+    """Process a fake checkout by adding selected products to the order queue.
+
+    A retry sent with the same `Idempotency-Key` answers with the order created by the
+    first request.
+
+    The checkout fails with `504 Gateway Timeout` once its time budget is spent. The
+    budget may be shortened with the `X-Request-Timeout` header.
+
+    When enabled, a checkout sent with `Prefer: respond-async` is answered right away
+    with `202 Accepted` and the order number, and performed in the background. Its
+    progress is polled at the URL given in the `Location` header.
+    """
+    if settings.ORDER_ASYNC_CHECKOUT_ENABLED and _prefers_async(prefer):
+        status = await checkout_dispatcher.submit(order_in, idempotency_key)
+        response.status_code = HTTPStatus.ACCEPTED
+        response.headers["Preference-Applied"] = "respond-async"
+        response.headers["Location"] = str(
+            request.url_for("get_checkout_status", external_id=status.external_id)
+        )
+        return OrderCreationOut(external_id=status.external_id)
+
+    order = await checkout_use_case.checkout(order_in, idempotency_key)
     return OrderCreationOut.model_validate(order, from_attributes=True)
 
 
+@router.get("", response_model=OrderSummaryPageOut)
+async def list_orders(
+    page_size: int = Query(
+        default=50, ge=1, le=MAX_PAGE_SIZE, description="The number of orders"
+    ),
+    page_token: Optional[str] = Query(
+        default=None,
+        max_length=512,
+        description="The `next_page_token` of the previous page",
+    ),
+    created_from: Optional[datetime] = Query(
+        default=None, description="Only orders created at or after it are listed"
+    ),
+    created_until: Optional[datetime] = Query(
+        default=None, description="Only orders created before it are listed"
+    ),
+    list_orders_use_case: ListOrdersUseCase = Depends(
+        lambda: dependency_injector.get(ListOrdersUseCase)
+    ),
+    # noqa: B008
+) -> OrderSummaryPageOut:
+    """List the orders, sorted by creation, a page at a time.
+
+    The next page is listed by sending the `next_page_token` of the previous one,
+    with the same creation period.
+    """
+    page = await list_orders_use_case.execute(
+        page_size, page_token, created_from, created_until
+    )
+    return OrderSummaryPageOut.from_page(page)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK: {
+            "description": "The orders, as NDJSON or as a JSON array of "
+            "`ExportedOrderOut`",
+            "content": {_NDJSON_MEDIA_TYPE: {}, "application/json": {}},
+        }
+    },
+)
+async def export_orders(
+    created_from: Optional[datetime] = Query(
+        default=None, description="Only orders created at or after it are exported"
+    ),
+    created_until: Optional[datetime] = Query(
+        default=None, description="Only orders created before it are exported"
+    ),
+    export_format: ExportFormat = Query(
+        default=ExportFormat.NDJSON,
+        alias="format",
+        description="`ndjson` for an order per line, `json` for an array",
+    ),
+    export_orders_use_case: ExportOrdersUseCase = Depends(
+        lambda: dependency_injector.get(ExportOrdersUseCase)
+    ),
+    # noqa: B008
+) -> StreamingResponse:
+    """Export the orders created within a period, sorted by creation.
+
+    The orders are streamed as they are read from the database, in batches, and no
+    faster than the client reads them, so the export holds about the same memory
+    however many orders it has.
+
+    Errors raised before the first orders are read are answered as usual. Errors
+    raised later interrupt the response, leaving it truncated.
+    """
+    orders = export_orders_use_case.export(created_from, created_until)
+    if export_format == ExportFormat.JSON:
+        chunks, media_type = _json_array(orders), "application/json"
+    else:
+        chunks, media_type = _ndjson(orders), _NDJSON_MEDIA_TYPE
+
+    chunks = _buffered(chunks, _EXPORT_CHUNK_SIZE)
+    # The first chunk is read upfront, so an error reading it is answered as usual.
+    first = await anext(chunks, b"")
+    return StreamingResponse(_prepend(first, chunks), media_type=media_type)
+
+
+@router.get("/{external_id}/status", response_model=CheckoutStatusOut)
+async def get_checkout_status(
+    external_id: PydanticExternalEntityId,
+    checkout_dispatcher: CheckoutDispatcher = Depends(
+        lambda: dependency_injector.get(CheckoutDispatcher)
+    ),
+    # noqa: B008
+) -> CheckoutStatusOut:
+    """Report the progress of a checkout, made in the background or not."""
+    status = await checkout_dispatcher.get_status(external_id)
+    if status is None:
+        raise NotFoundError(
+            message="Order not found", search_params={"external_id": external_id}
+        )
+    return CheckoutStatusOut.from_status(status)
+
+
+@router.post(
+    "/checkout/bulk",
+    response_model=BulkOrderCreationOut,
+    dependencies=[Depends(request_deadline(settings.ORDER_BULK_CHECKOUT_TIMEOUT))],
+)
+async def checkout_bulk(
+    bulk_in: BulkOrderIn,
+    checkout_use_case: CheckoutUseCase = Depends(
+        lambda: dependency_injector.get(CheckoutUseCase)
+    ),
+    # noqa: B008
+) -> BulkOrderCreationOut:
+    """Process many fake checkouts at once.
+
+    Each order succeeds or fails on its own: the result of each one is reported, in
+    the order they were sent, with the status code it would have been answered with
+    alone.
+    """
+    outcomes = await checkout_use_case.checkout_many(bulk_in.orders)
+    return BulkOrderCreationOut(
+        results=[BulkOrderResultOut.from_outcome(outcome) for outcome in outcomes]
+    )
+
+
+async def _ndjson(orders: AsyncIterator[ExportedOrderDTO]) -> AsyncIterator[bytes]:
+    async for order in orders:
+        yield ExportedOrderOut.from_dto(order).model_dump_json().encode() + b"\n"
+
+
+async def _json_array(orders: AsyncIterator[ExportedOrderDTO]) -> AsyncIterator[bytes]:
+    separator = b"["
+    async for order in orders:
+        yield separator + ExportedOrderOut.from_dto(order).model_dump_json().encode()
+        separator = b","
+    yield b"[]" if separator == b"[" else b"]"
+
+
+async def _buffered(chunks: AsyncIterator[bytes], size: int) -> AsyncIterator[bytes]:
+    """Joins small chunks together, so they are not each sent on their own."""
+    buffer = bytearray()
+    async for chunk in chunks:
+        buffer += chunk
+        if len(buffer) >= size:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def _prepend(first: bytes, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    yield first
+    async for chunk in chunks:
+        yield chunk
+
+
+def _prefers_async(prefer: Optional[str]) -> bool:
+    """Tells whether the `Prefer` header asks for an asynchronous response."""
+    preferences = (p.split(";")[0].strip().lower() for p in (prefer or "").split(","))
+    return "respond-async" in preferences
+
+
 __all__ = ["router"]
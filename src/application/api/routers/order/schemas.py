@@ -1,12 +1,23 @@
-from typing import List
+from datetime import datetime
+from enum import StrEnum
+from http import HTTPStatus
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
+from src.application.api.exception_handlers import describe_error
 from src.application.api.types import PydanticExternalEntityId
 from src.application.use_cases.order.checkout.dto import (
     CheckoutOrderDTO,
     CheckoutItemDTO,
+    CheckoutOutcomeDTO,
+    CheckoutProgress,
+    CheckoutStatusDTO,
 )
+from src.application.use_cases.order.export.dto import ExportedOrderDTO
+from src.domain.order import OrderStatus
+from src.domain.order.repository import OrderSummaryPage
+from src.infra.config import settings
 
 
 class OrderItemIn(BaseModel):
@@ -21,6 +32,11 @@ class OrderIn(BaseModel):
 
     customer_id: PydanticExternalEntityId = Field(description="The customer identifier")
     items: List[OrderItemIn] = Field(description="List of products in the order")
+    quote_token: Optional[str] = Field(
+        default=None,
+        description="The token of a quote of the products, to price them from",
+        max_length=8192,
+    )
 
     def to_checkout_request(self) -> CheckoutOrderDTO:
         """Converts the OrderIn instance to a CheckoutRequest instance."""
@@ -30,13 +46,193 @@ class OrderIn(BaseModel):
                 CheckoutItemDTO(product_id=item.product_id, quantity=item.quantity)
                 for item in self.items
             ],
+            quote_token=self.quote_token,
         )
 
 
+class QuoteIn(BaseModel):
+    """Schema for pricing a cart."""
+
+    items: List[OrderItemIn] = Field(description="List of products in the cart")
+
+
+class QuotedItemOut(BaseModel):
+    """Schema for returning the price of an item of a cart."""
+
+    product_id: str = Field(description="The product id")
+    quantity: int = Field(description="The quantity of the product")
+    unit_price: float = Field(description="The price of a unit of the product")
+
+
+class QuoteOut(BaseModel):
+    """Schema for returning the prices of a cart."""
+
+    items: List[QuotedItemOut] = Field(description="The price of each item")
+    total_value: float = Field(description="The total value of the cart")
+    expires_at: datetime = Field(description="Until when the prices are guaranteed")
+    quote_token: str = Field(
+        description="The token to send at checkout for the products to be priced "
+        "from this quote"
+    )
+
+
 class OrderCreationOut(BaseModel):
     """Schema for returning the result of creating an order."""
 
     external_id: PydanticExternalEntityId = Field(description="The order number")
 
 
-__all__ = ["OrderCreationOut", "OrderIn", "OrderItemIn"]
+class BulkOrderIn(BaseModel):
+    """Schema for creating many orders at once."""
+
+    orders: List[OrderIn] = Field(
+        description="The orders to create",
+        min_length=1,
+        max_length=settings.ORDER_BULK_CHECKOUT_MAX_ORDERS,
+    )
+
+
+class BulkOrderResultOut(BaseModel):
+    """Schema for returning the result of creating one of the orders of a batch."""
+
+    status_code: int = Field(
+        description="The status code the order would have been answered with alone"
+    )
+    external_id: Optional[PydanticExternalEntityId] = Field(
+        default=None, description="The order number, if the order was created"
+    )
+    detail: Any = Field(
+        default=None, description="Why the order was not created, if it was not"
+    )
+
+    @classmethod
+    def from_outcome(cls, outcome: CheckoutOutcomeDTO) -> "BulkOrderResultOut":
+        """Creates the result of an order from the outcome of its checkout."""
+        if outcome.error is not None:
+            status_code, detail = describe_error(outcome.error)
+            return cls(status_code=status_code, detail=detail)
+        return cls(
+            status_code=HTTPStatus.CREATED, external_id=outcome.order.external_id
+        )
+
+
+class BulkOrderCreationOut(BaseModel):
+    """Schema for returning the result of creating many orders at once."""
+
+    results: List[BulkOrderResultOut] = Field(
+        description="The result of each order, in the order they were sent"
+    )
+
+
+class CheckoutStatusOut(BaseModel):
+    """Schema for returning the progress of a checkout performed in the background."""
+
+    external_id: PydanticExternalEntityId = Field(description="The order number")
+    progress: CheckoutProgress = Field(description="The progress of the checkout")
+    order_status: Optional[OrderStatus] = Field(
+        default=None, description="The status of the order, once created"
+    )
+    total_value: Optional[float] = Field(
+        default=None, description="The total value of the order, once created"
+    )
+    status_code: Optional[int] = Field(
+        default=None,
+        description="The status code the checkout would have failed with, if it did",
+    )
+    detail: Any = Field(default=None, description="Why the checkout failed, if it did")
+
+    @classmethod
+    def from_status(cls, status: CheckoutStatusDTO) -> "CheckoutStatusOut":
+        """Creates the schema from the status of a checkout."""
+        checkout_status = cls(external_id=status.external_id, progress=status.progress)
+        if status.order is not None:
+            checkout_status.order_status = status.order.status
+            checkout_status.total_value = status.order.total_value
+        if status.error is not None:
+            checkout_status.status_code, checkout_status.detail = describe_error(
+                status.error
+            )
+        return checkout_status
+
+
+class ExportedOrderItemOut(BaseModel):
+    """Schema for returning an item of an exported order."""
+
+    product_id: str = Field(description="The product id")
+    quantity: int = Field(description="The quantity of the product")
+    value: float = Field(description="The unit price the product was sold for")
+
+
+class ExportedOrderOut(BaseModel):
+    """Schema for returning an exported order."""
+
+    external_id: PydanticExternalEntityId = Field(description="The order number")
+    customer_id: str = Field(description="The internal customer identifier")
+    status: OrderStatus = Field(description="The status of the order")
+    total_value: float = Field(description="The total value of the order")
+    created_at: datetime = Field(description="When the order was created")
+    items: List[ExportedOrderItemOut] = Field(description="The items of the order")
+
+    @classmethod
+    def from_dto(cls, order: ExportedOrderDTO) -> "ExportedOrderOut":
+        """Creates the schema from an exported order."""
+        return cls.model_validate(order, from_attributes=True)
+
+
+class OrderSummaryOut(BaseModel):
+    """Schema for returning the summary of an order."""
+
+    external_id: PydanticExternalEntityId = Field(description="The order number")
+    status: OrderStatus = Field(description="The status of the order")
+    total_value: float = Field(description="The total value of the order")
+    created_at: datetime = Field(description="When the order was created")
+
+
+class OrderSummaryPageOut(BaseModel):
+    """Schema for returning a page of order summaries."""
+
+    orders: List[OrderSummaryOut] = Field(description="The orders of the page")
+    next_page_token: Optional[str] = Field(
+        default=None,
+        description="The token of the next page, if this is not the last one",
+    )
+
+    @classmethod
+    def from_page(cls, page: OrderSummaryPage) -> "OrderSummaryPageOut":
+        """Creates the schema from a page of order summaries."""
+        return cls(
+            orders=[
+                OrderSummaryOut.model_validate(summary, from_attributes=True)
+                for summary in page.summaries
+            ],
+            next_page_token=page.next_page_token,
+        )
+
+
+class ExportFormat(StrEnum):
+    """The formats orders are exported in."""
+
+    NDJSON = "ndjson"
+    """One JSON order per line."""
+
+    JSON = "json"
+    """A JSON array of orders."""
+
+
+__all__ = [
+    "BulkOrderCreationOut",
+    "BulkOrderIn",
+    "BulkOrderResultOut",
+    "CheckoutStatusOut",
+    "ExportFormat",
+    "ExportedOrderItemOut",
+    "ExportedOrderOut",
+    "OrderCreationOut",
+    "OrderIn",
+    "OrderItemIn",
+    "OrderSummaryOut",
+    "OrderSummaryPageOut",
+    "QuoteIn",
+    "QuoteOut",
+    "QuotedItemOut",
+]
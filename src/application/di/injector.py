@@ -1,12 +1,14 @@
 from injector import Binder, Injector
 
 from src.application.di.modules import CustomerModule
+from src.application.di.modules.metrics_module import MetricsModule
 from src.application.di.modules.order_module import OrderModule
 from src.application.di.modules.product_module import ProductModule
 
 
 def configure_injector(binder: Binder) -> None:  # noqa: ARG001
     """Configures the injector by installing the Modules."""
+    binder.install(MetricsModule())
     binder.install(CustomerModule())
     binder.install(ProductModule())
     binder.install(OrderModule())
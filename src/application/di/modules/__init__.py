@@ -1,6 +1,7 @@
 from .customer_module import CustomerModule
+from .metrics_module import MetricsModule
 from .order_module import OrderModule
 from .product_module import ProductModule
 
 
-__all__ = ["CustomerModule", "OrderModule", "ProductModule"]
+__all__ = ["CustomerModule", "MetricsModule", "OrderModule", "ProductModule"]
@@ -2,8 +2,15 @@ from injector import Module, inject, provider, singleton
 
 from src.application.use_cases.customer.create import CreateCustomerUseCase
 from src.application.use_cases.customer.get_by_cpf import GetCustomerByCpfUseCase
-from src.domain.customer import ICustomerRepository
-from src.infra.gateways.database.repositories import MongoCustomerRepository
+from src.domain.customer import ICustomerIdResolver, ICustomerRepository
+from src.infra.cache import TTLCache
+from src.infra.config import settings
+from src.infra.gateways.database.repositories import (
+    MongoCustomerIdResolver,
+    MongoCustomerRepository,
+    RawMongoCustomerRepository,
+)
+from src.infra.metrics import MetricsRegistry
 
 
 class CustomerModule(Module):
@@ -11,9 +18,34 @@ class CustomerModule(Module):
 
     @singleton
     @provider
-    def provide_customer_repository(self) -> ICustomerRepository:
-        """Provide the customer repository."""
-        return MongoCustomerRepository()
+    @inject
+    def provide_customer_id_resolver(
+        self, metrics: MetricsRegistry
+    ) -> ICustomerIdResolver:
+        """Provide the customer id resolver, with its in-process cache if enabled."""
+        customer_id_resolver = MongoCustomerIdResolver(
+            cache=(
+                TTLCache(
+                    max_entries=settings.CUSTOMER_ID_CACHE_MAX_ENTRIES,
+                    ttl=settings.CUSTOMER_ID_CACHE_TTL,
+                )
+                if settings.CUSTOMER_ID_CACHE_ENABLED
+                else None
+            )
+        )
+        metrics.register(customer_id_resolver.collect_metrics)
+        return customer_id_resolver
+
+    @singleton
+    @provider
+    @inject
+    def provide_customer_repository(
+        self, customer_id_resolver: ICustomerIdResolver
+    ) -> ICustomerRepository:
+        """Provide the customer repository, reading raw documents if enabled."""
+        if settings.DB_RAW_READS_ENABLED:
+            return RawMongoCustomerRepository(id_resolver=customer_id_resolver)
+        return MongoCustomerRepository(id_resolver=customer_id_resolver)
 
     @provider
     @inject
@@ -0,0 +1,16 @@
+from injector import Module, provider, singleton
+
+from src.infra.metrics import MetricsRegistry
+
+
+class MetricsModule(Module):
+    """Dependency injection module for the application metrics."""
+
+    @singleton
+    @provider
+    def provide_metrics_registry(self) -> MetricsRegistry:
+        """Provide the registry collecting the metrics of the worker."""
+        return MetricsRegistry()
+
+
+__all__ = ["MetricsModule"]
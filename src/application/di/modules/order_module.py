@@ -1,12 +1,38 @@
+import secrets
+
 from injector import Module, inject, provider, singleton
 
 from src.application.use_cases.order.checkout.checkout import CheckoutUseCase
-from src.domain.__shared.interfaces import IProductService
-from src.domain.customer import ICustomerRepository
+from src.application.use_cases.order.checkout.checkout_dispatcher import (
+    CheckoutDispatcher,
+)
+from src.domain.__shared.interfaces import IIdempotencyStore, IProductService
+from src.domain.customer import ICustomerIdResolver
+from src.application.use_cases.order.export.export import ExportOrdersUseCase
+from src.application.use_cases.order.list_orders import ListOrdersUseCase
+from src.application.use_cases.order.order_event_handler import OrderEventHandler
+from src.application.use_cases.order.quote.quote import QuoteUseCase
+from src.domain.order.outbox import IOrderEventHandler, IOrderOutbox
+from src.domain.order.quote import IQuoteSigner
 from src.domain.order.repository import IOrderRepository
+from src.infra.cache import TTLCache
+from src.infra.config import settings
+from src.infra.gateways.database.repositories.group_commit_order_repository import (
+    GroupCommitOrderRepository,
+)
+from src.infra.gateways.database.repositories.idempotency_store_impl import (
+    MongoIdempotencyStore,
+)
+from src.infra.gateways.database.repositories.order_outbox_impl import (
+    MongoOrderOutbox,
+)
 from src.infra.gateways.database.repositories.order_repository_impl import (
     MongoOrderRepository,
+    RawMongoOrderRepository,
 )
+from src.infra.metrics import MetricsRegistry
+from src.infra.outbox import OutboxDispatcher
+from src.infra.quote import HmacQuoteSigner
 
 
 class OrderModule(Module):
@@ -14,24 +40,171 @@ class OrderModule(Module):
 
     @singleton
     @provider
-    def provide_order_repository(self) -> IOrderRepository:
-        """Provide the order repository."""
-        return MongoOrderRepository()
+    @inject
+    def provide_order_repository(self, metrics: MetricsRegistry) -> IOrderRepository:
+        """Provide the order repository.
+
+        It reads raw documents and group-commits inserts, if enabled.
+        """
+        outbox_enabled = settings.ORDER_OUTBOX_DISPATCHER_ENABLED
+        mongo_order_repository = (
+            RawMongoOrderRepository(outbox_enabled=outbox_enabled)
+            if settings.DB_RAW_READS_ENABLED
+            else MongoOrderRepository(outbox_enabled=outbox_enabled)
+        )
+        if not settings.ORDER_INSERT_GROUP_COMMIT_ENABLED:
+            return mongo_order_repository
+
+        order_repository = GroupCommitOrderRepository(
+            order_repository=mongo_order_repository,
+            max_batch_size=settings.ORDER_INSERT_GROUP_COMMIT_MAX_BATCH_SIZE,
+            max_delay=settings.ORDER_INSERT_GROUP_COMMIT_MAX_DELAY,
+        )
+        metrics.register(order_repository.collect_metrics)
+        return order_repository
+
+    @singleton
+    @provider
+    @inject
+    def provide_idempotency_store(self, metrics: MetricsRegistry) -> IIdempotencyStore:
+        """Provide the idempotency store, with its in-process cache of recent keys."""
+        idempotency_store = MongoIdempotencyStore(
+            ttl=settings.IDEMPOTENCY_KEY_TTL,
+            cache=TTLCache(
+                max_entries=settings.IDEMPOTENCY_CACHE_MAX_ENTRIES,
+                ttl=min(settings.IDEMPOTENCY_CACHE_TTL, settings.IDEMPOTENCY_KEY_TTL),
+            ),
+        )
+        metrics.register(idempotency_store.collect_metrics)
+        return idempotency_store
+
+    @singleton
+    @provider
+    def provide_quote_signer(self) -> IQuoteSigner:
+        """Provide the signer of the quote tokens."""
+        secret = settings.ORDER_QUOTE_SECRET
+        return HmacQuoteSigner(
+            secret=(
+                secret.get_secret_value().encode()
+                if secret
+                else secrets.token_bytes(32)
+            )
+        )
+
+    @provider
+    @inject
+    def provide_export_orders_use_case(
+        self, order_repository: IOrderRepository
+    ) -> ExportOrdersUseCase:
+        """Provide the order export use case."""
+        return ExportOrdersUseCase(
+            order_repository=order_repository,
+            batch_size=settings.ORDER_EXPORT_BATCH_SIZE,
+        )
+
+    @provider
+    @inject
+    def provide_list_orders_use_case(
+        self, order_repository: IOrderRepository
+    ) -> ListOrdersUseCase:
+        """Provide the order listing use case."""
+        return ListOrdersUseCase(order_repository=order_repository)
+
+    @provider
+    @inject
+    def provide_quote_use_case(
+        self, product_service: IProductService, quote_signer: IQuoteSigner
+    ) -> QuoteUseCase:
+        """Provide the quote use case."""
+        return QuoteUseCase(
+            product_service=product_service,
+            quote_signer=quote_signer,
+            ttl=settings.ORDER_QUOTE_TTL,
+        )
 
     @provider
     @inject
     def provide_checkout_use_case(
         self,
         order_repository: IOrderRepository,
-        customer_repository: ICustomerRepository,
+        customer_id_resolver: ICustomerIdResolver,
         product_service: IProductService,
+        idempotency_store: IIdempotencyStore,
+        quote_signer: IQuoteSigner,
     ) -> CheckoutUseCase:
         """Provide the checkout use case."""
         return CheckoutUseCase(
             order_repository=order_repository,
-            customer_repository=customer_repository,
+            customer_id_resolver=customer_id_resolver,
             product_service=product_service,
+            idempotency_store=idempotency_store,
+            quote_signer=quote_signer,
+        )
+
+    @singleton
+    @provider
+    @inject
+    def provide_checkout_dispatcher(
+        self,
+        checkout_use_case: CheckoutUseCase,
+        order_repository: IOrderRepository,
+        metrics: MetricsRegistry,
+    ) -> CheckoutDispatcher:
+        """Provide the dispatcher of background checkouts, idle unless enabled."""
+        checkout_dispatcher = CheckoutDispatcher(
+            checkout_use_case=checkout_use_case,
+            order_repository=order_repository,
+            statuses=TTLCache(
+                max_entries=settings.ORDER_ASYNC_CHECKOUT_STATUS_MAX_ENTRIES,
+                ttl=settings.ORDER_ASYNC_CHECKOUT_STATUS_TTL,
+            ),
+            workers=(
+                settings.ORDER_ASYNC_CHECKOUT_WORKERS
+                if settings.ORDER_ASYNC_CHECKOUT_ENABLED
+                else 0
+            ),
+            queue_size=settings.ORDER_ASYNC_CHECKOUT_QUEUE_SIZE,
+            drain_timeout=settings.ORDER_ASYNC_CHECKOUT_DRAIN_TIMEOUT,
+        )
+        metrics.register(checkout_dispatcher.collect_metrics)
+        return checkout_dispatcher
+
+    @singleton
+    @provider
+    def provide_order_outbox(self) -> IOrderOutbox:
+        """Provide the outbox of the order events."""
+        return MongoOrderOutbox()
+
+    @provider
+    def provide_order_event_handler(self) -> IOrderEventHandler:
+        """Provide the handler of the order events."""
+        return OrderEventHandler()
+
+    @singleton
+    @provider
+    @inject
+    def provide_outbox_dispatcher(
+        self,
+        outbox: IOrderOutbox,
+        handler: IOrderEventHandler,
+        metrics: MetricsRegistry,
+    ) -> OutboxDispatcher:
+        """Provide the dispatcher of the order events, idle unless enabled."""
+        outbox_dispatcher = OutboxDispatcher(
+            outbox=outbox,
+            handler=handler,
+            workers=(
+                settings.ORDER_OUTBOX_WORKERS
+                if settings.ORDER_OUTBOX_DISPATCHER_ENABLED
+                else 0
+            ),
+            batch_size=settings.ORDER_OUTBOX_BATCH_SIZE,
+            queue_size=settings.ORDER_OUTBOX_QUEUE_SIZE,
+            poll_interval=settings.ORDER_OUTBOX_POLL_INTERVAL,
+            lease_duration=settings.ORDER_OUTBOX_LEASE_DURATION,
         )
+        metrics.register(outbox_dispatcher.collect_metrics)
+        return outbox_dispatcher
 
 
 __all__ = ["OrderModule"]
@@ -1,17 +1,176 @@
-from injector import Module, provider, singleton
+import httpx
+from injector import Injector, Module, inject, provider, singleton
 
 from src.domain.__shared.interfaces import IProductService
+from src.infra.cache import TTLCache
+from src.infra.config import settings
+from src.infra.gateways.external_services.cached_product_service import (
+    CachedProductService,
+)
+from src.infra.gateways.external_services.catalog_refresher import CatalogRefresher
 from src.infra.gateways.external_services.product_service import ProductServiceImpl
+from src.infra.gateways.external_services.product_service_stand_in import (
+    create_product_service_stand_in_from_settings,
+)
+from src.infra.gateways.external_services.product_snapshot import ProductSnapshot
+from src.infra.gateways.external_services.snapshot_product_service import (
+    SnapshotFallbackProductService,
+)
+from src.infra.metrics import MetricsRegistry
+from src.infra.resilience import CircuitBreaker, RequestHedger
 
 
 class ProductModule(Module):
-    """Dependency injection module for the Order domain."""
+    """Dependency injection module for the Product domain."""
 
     @singleton
     @provider
-    def provide_product_service(self) -> IProductService:
-        """Provide the order repository."""
-        return ProductServiceImpl()
+    @inject
+    def provide_product_service_impl(
+        self, metrics: MetricsRegistry
+    ) -> ProductServiceImpl:
+        """Provide the product service gateway, shared by the whole worker."""
+        product_service = ProductServiceImpl(
+            base_url=settings.PRODUCT_SERVICE_URL,
+            limits=httpx.Limits(
+                max_connections=settings.PRODUCT_SERVICE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.PRODUCT_SERVICE_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.PRODUCT_SERVICE_KEEPALIVE_EXPIRY,
+            ),
+            timeout=httpx.Timeout(
+                connect=settings.PRODUCT_SERVICE_CONNECT_TIMEOUT,
+                read=settings.PRODUCT_SERVICE_READ_TIMEOUT,
+                write=settings.PRODUCT_SERVICE_READ_TIMEOUT,
+                pool=settings.PRODUCT_SERVICE_POOL_TIMEOUT,
+            ),
+            transport=(
+                httpx.ASGITransport(app=create_product_service_stand_in_from_settings())
+                if settings.PRODUCT_SERVICE_STAND_IN_ENABLED
+                else None
+            ),
+            max_concurrency=settings.PRODUCT_SERVICE_MAX_CONCURRENCY,
+            max_concurrency_per_call=settings.PRODUCT_SERVICE_MAX_CONCURRENCY_PER_CALL,
+            batch_enabled=settings.PRODUCT_SERVICE_BATCH_ENABLED,
+            batch_max_url_length=settings.PRODUCT_SERVICE_BATCH_MAX_URL_LENGTH,
+            batch_retry_interval=settings.PRODUCT_SERVICE_BATCH_RETRY_INTERVAL,
+            circuit_breaker=(
+                CircuitBreaker(
+                    window_size=settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_WINDOW_SIZE,
+                    minimum_calls=settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_MINIMUM_CALLS,
+                    failure_rate_threshold=settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_FAILURE_RATE,
+                    slow_call_duration=settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_SLOW_CALL_DURATION,
+                    slow_call_rate_threshold=settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_SLOW_CALL_RATE,
+                    open_duration=settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_OPEN_DURATION,
+                )
+                if settings.PRODUCT_SERVICE_CIRCUIT_BREAKER_ENABLED
+                else None
+            ),
+            hedger=(
+                RequestHedger(
+                    percentile=settings.PRODUCT_SERVICE_HEDGING_PERCENTILE,
+                    min_delay=settings.PRODUCT_SERVICE_HEDGING_MIN_DELAY,
+                )
+                if settings.PRODUCT_SERVICE_HEDGING_ENABLED
+                else None
+            ),
+        )
+        metrics.register(product_service.collect_metrics)
+        return product_service
+
+    @singleton
+    @provider
+    @inject
+    def provide_cached_product_service(
+        self,
+        product_service: ProductServiceImpl,
+        snapshot: ProductSnapshot,
+        metrics: MetricsRegistry,
+    ) -> CachedProductService:
+        """Provide the product cache, shared by the whole worker, reading the catalog
+        from the snapshot when enabled."""
+        cached_product_service = CachedProductService(
+            product_service=product_service,
+            cache=TTLCache(
+                max_entries=settings.PRODUCT_CACHE_MAX_ENTRIES,
+                ttl=settings.PRODUCT_CACHE_TTL,
+            ),
+            stale_grace=settings.PRODUCT_CACHE_STALE_GRACE,
+            missing_cache=(
+                TTLCache(
+                    max_entries=settings.PRODUCT_CACHE_NEGATIVE_MAX_ENTRIES,
+                    ttl=settings.PRODUCT_CACHE_NEGATIVE_TTL,
+                )
+                if settings.PRODUCT_CACHE_NEGATIVE_TTL > 0
+                else None
+            ),
+            snapshot=snapshot if settings.PRODUCT_SNAPSHOT_ENABLED else None,
+        )
+        metrics.register(cached_product_service.collect_metrics)
+        return cached_product_service
+
+    @singleton
+    @provider
+    @inject
+    def provide_catalog_refresher(
+        self,
+        product_service: ProductServiceImpl,
+        product_cache: CachedProductService,
+        snapshot: ProductSnapshot,
+        metrics: MetricsRegistry,
+    ) -> CatalogRefresher:
+        """Provide the product catalog refresher, idle without the product cache."""
+        cache_enabled = settings.PRODUCT_CACHE_ENABLED
+        catalog_refresher = CatalogRefresher(
+            product_service=product_service,
+            product_cache=product_cache,
+            warm_up_timeout=(
+                settings.PRODUCT_CATALOG_WARM_UP_TIMEOUT
+                if cache_enabled and settings.PRODUCT_CATALOG_WARM_UP_ENABLED
+                else None
+            ),
+            refresh_interval=(
+                settings.PRODUCT_CATALOG_REFRESH_INTERVAL if cache_enabled else 0.0
+            ),
+            snapshot=snapshot if settings.PRODUCT_SNAPSHOT_ENABLED else None,
+        )
+        metrics.register(catalog_refresher.collect_metrics)
+        return catalog_refresher
+
+    @singleton
+    @provider
+    def provide_product_snapshot(self) -> ProductSnapshot:
+        """Provide the product catalog snapshot, shared by the whole worker."""
+        return ProductSnapshot(settings.PRODUCT_SNAPSHOT_PATH)
+
+    @singleton
+    @provider
+    @inject
+    def provide_snapshot_fallback_product_service(
+        self, injector: Injector, snapshot: ProductSnapshot, metrics: MetricsRegistry
+    ) -> SnapshotFallbackProductService:
+        """Provide the product service falling back to the snapshot when degraded."""
+        product_service = SnapshotFallbackProductService(
+            product_service=self._primary_product_service(injector),
+            snapshot=snapshot,
+        )
+        metrics.register(product_service.collect_metrics)
+        return product_service
+
+    @singleton
+    @provider
+    @inject
+    def provide_product_service(self, injector: Injector) -> IProductService:
+        """Provide the product service, cached when the product cache is enabled, and
+        falling back to the snapshot when the degraded mode is."""
+        if settings.PRODUCT_SNAPSHOT_DEGRADED_MODE_ENABLED:
+            return injector.get(SnapshotFallbackProductService)
+        return self._primary_product_service(injector)
+
+    @staticmethod
+    def _primary_product_service(injector: Injector) -> IProductService:
+        if settings.PRODUCT_CACHE_ENABLED:
+            return injector.get(CachedProductService)
+        return injector.get(ProductServiceImpl)
 
 
 __all__ = ["ProductModule"]
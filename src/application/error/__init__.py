@@ -1,4 +1,5 @@
 from .not_found_error import NotFoundError
+from .service_unavailable_error import ServiceUnavailableError
 
 
-__all__ = ["NotFoundError"]
+__all__ = ["NotFoundError", "ServiceUnavailableError"]
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from src.domain.__shared.error import DomainError
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class ServiceUnavailableError(DomainError):
+    """Base class for errors where a request is refused because of overload."""
+
+    message: str = "Service unavailable"
+
+
+__all__ = ["ServiceUnavailableError"]
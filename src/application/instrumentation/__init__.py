@@ -0,0 +1,3 @@
+from .stage_timings import collect_stage_timings, measure_stage
+
+__all__ = ["collect_stage_timings", "measure_stage"]
@@ -0,0 +1,48 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Dict, Iterator, Optional
+
+_stage_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "stage_timings", default=None
+)
+
+
+@contextmanager
+def collect_stage_timings() -> Iterator[Dict[str, float]]:
+    """Collect the duration of every stage measured within the context.
+
+    Stages measured by tasks spawned within the context are collected as well, since
+    tasks inherit the context they are created from.
+
+    Yields:
+        Dict[str, float]: The duration of each stage, in milliseconds, keyed by name.
+         It is filled as the stages complete.
+    """
+    timings: Dict[str, float] = {}
+    token = _stage_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _stage_timings.reset(token)
+
+
+async def measure_stage[T](name: str, awaitable: Awaitable[T]) -> T:
+    """Await the stage, recording its duration when timings are being collected.
+
+    Args:
+        name: The name of the stage.
+        awaitable: The work of the stage.
+
+    Returns:
+        T: The result of the stage.
+    """
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        if (timings := _stage_timings.get()) is not None:
+            timings[name] = (time.perf_counter() - started) * 1000
+
+
+__all__ = ["collect_stage_timings", "measure_stage"]
@@ -1,8 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.domain.__shared.value_objects import EmailAddress, CPF
-
 
 @dataclass
 class CustomerDTO:
@@ -17,8 +15,8 @@ class CustomerDTO:
     """
 
     name: str
-    cpf: CPF
-    email: EmailAddress
+    cpf: str
+    email: str
     external_id: str
     created_at: datetime
 
@@ -16,13 +16,15 @@ class GetCustomerByCpfUseCase:
         Args:
             cpf: The customer's CPF.
 
+        Only the identity of the customer is read: the customer itself is not loaded.
+
         Returns:
             Customer: The customer data if found.
 
         Raises:
             CustomerNotFoundError: If the customer is not found.
         """
-        customer = await self.customer_repository.get_by_cpf(CPF(number=cpf))
+        customer = await self.customer_repository.find_identity_by_cpf(CPF(number=cpf))
 
         if not customer:
             raise CustomerNotFoundError(
@@ -34,7 +36,7 @@ class GetCustomerByCpfUseCase:
             cpf=customer.cpf,
             email=customer.email,
             created_at=customer.created_at,
-            external_id=str(customer.external_id),
+            external_id=customer.external_id,
         )
 
 
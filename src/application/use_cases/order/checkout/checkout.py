@@ -1,18 +1,39 @@
-from typing import Iterable, List, Dict
+import asyncio
+import hashlib
+import json
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
+from src.application.instrumentation import measure_stage
 from src.application.use_cases.order.checkout.dto import (
     CheckoutOrderDTO,
+    CheckoutOutcomeDTO,
     CheckedOutOrderDTO,
     CheckoutItemDTO,
 )
-from src.domain.__shared.interfaces import IProductService
+from src.domain.__shared.error import DomainError
+from src.domain.__shared.error.repository_error import (
+    DuplicateKeyError,
+    RecordNotFoundError,
+)
+from src.domain.__shared.interfaces import (
+    IdempotencyRecord,
+    IIdempotencyStore,
+    IProductService,
+)
 from src.domain.__shared.interfaces.product_service import Product
-from src.domain.customer import ICustomerRepository, Customer
+from src.domain.customer import ICustomerIdResolver
+from src.domain.__shared.value_objects import ExternalEntityId, UniqueEntityId
 from src.domain.customer_error import CustomerNotFoundError
 from src.domain.order import Order
-from src.domain.order.error import EmptyOrderError
+from src.domain.order.error import (
+    EmptyOrderError,
+    IdempotencyKeyReusedError,
+    OrderCreationFailedDueToMissingProductsError,
+)
 from src.domain.order.order_item import OrderItem
+from src.domain.order.quote import IQuoteSigner, PriceQuote
 from src.domain.order.repository import IOrderRepository
+from src.infra.deadline import check_deadline
 
 
 class CheckoutUseCase:
@@ -21,96 +42,471 @@ class CheckoutUseCase:
     def __init__(
         self,
         order_repository: IOrderRepository,
-        customer_repository: ICustomerRepository,
+        customer_id_resolver: ICustomerIdResolver,
         product_service: IProductService,
+        idempotency_store: Optional[IIdempotencyStore] = None,
+        quote_signer: Optional[IQuoteSigner] = None,
     ) -> None:
         """Initializes a new instance of the CheckoutUseCase class.
 
         Args:
             order_repository: The repository instance for order persistence operations.
-            customer_repository: The repository instance for customer persistence operations.
+            customer_id_resolver: The resolver of the customers' internal identifiers.
             product_service: The service for product operations.
+            idempotency_store: The store remembering the results of checkouts made
+             with an idempotency key. Without it, idempotency keys are ignored.
+            quote_signer: The signer of the quote tokens checkouts may be priced
+             from. Without it, quote tokens are ignored.
         """
 
         self._order_repository = order_repository
-        self._customer_repository = customer_repository
+        self._customer_id_resolver = customer_id_resolver
         self._product_service = product_service
+        self._idempotency_store = idempotency_store
+        self._quote_signer = quote_signer
 
-    async def checkout(self, request: CheckoutOrderDTO) -> CheckedOutOrderDTO:
+    async def checkout(
+        self,
+        request: CheckoutOrderDTO,
+        idempotency_key: Optional[str] = None,
+        external_id: Optional[ExternalEntityId] = None,
+    ) -> CheckedOutOrderDTO:
         """Creates a new order in the system.
 
+        The customer and the products are looked up concurrently, and a failure of
+        either lookup cancels the other one. Errors are raised in a deterministic
+        order: a missing customer first, then an empty order, then missing products.
+
+        A retry with the same idempotency key returns the order created by the first
+        request, without looking up the customer and the products again. The key is
+        reserved before the order is created, with a random order external id, so
+        concurrent retries cannot create the order twice either. Once the key expires,
+        it may be used again for a new order.
+
+        A request sent with a valid quote token covering all of its products is
+        priced from the quote, without looking up the products. Otherwise, including
+        when the quote has expired, the products are looked up as usual.
+
+        Every lookup and write is bounded by the time left before the deadline of
+        the request, if any, and no further work is started once it has expired.
+
         Args:
             request: The checkout request data.
+            idempotency_key: The key identifying the request across retries, if any.
+            external_id: The external id assigned to the order beforehand, by
+             `assign_external_id`, if any.
 
         Returns:
             CheckoutResponse: The response containing the order number.
 
         Raises:
+            CustomerNotFoundError: If the customer is not found.
             EmptyOrderError: If the order has no items.
             OrderCreationFailedDueToMissingProductsError: If any product is not found.
-            CustomerNotFoundError: If the customer is not found.
+            ExternalServiceError: If the products could not be fetched.
+            IdempotencyKeyReusedError: If the idempotency key was already used for a
+             different request.
+            DeadlineExceededError: If the deadline expires before the order is created.
         """
-        if not request.items:
-            raise EmptyOrderError()
+        check_deadline("checkout")
+        items = list(request.items)
+        quote = self._verify_quote(request.quote_token)
+        if idempotency_key is not None and self._idempotency_store is not None:
+            return await self._checkout_idempotently(
+                request.customer_id, items, idempotency_key, quote
+            )
+
+        return await self._place_order(request.customer_id, items, external_id, quote)
+
+    async def assign_external_id(
+        self, request: CheckoutOrderDTO, idempotency_key: Optional[str] = None
+    ) -> ExternalEntityId:
+        """Assigns the external id of an order before it is created.
+
+        Args:
+            request: The checkout request data.
+            idempotency_key: The key identifying the request across retries, if any.
+             It is reserved for the request.
+
+        Returns:
+            ExternalEntityId: The external id the order will be created with, which is
+             the same for every retry with the idempotency key.
+
+        Raises:
+            IdempotencyKeyReusedError: If the idempotency key was already used for a
+             different request.
+        """
+        if idempotency_key is None or self._idempotency_store is None:
+            return ExternalEntityId()
+
+        record, _ = await self._reserve(
+            request.customer_id, list(request.items), idempotency_key
+        )
+        return ExternalEntityId(record.order_external_id)
+
+    async def checkout_many(
+        self, requests: Iterable[CheckoutOrderDTO]
+    ) -> List[CheckoutOutcomeDTO]:
+        """Creates many orders at once.
+
+        All the customers are resolved in a single lookup and all the products in a
+        single pricing pass, concurrently, and the valid orders are then created with
+        a single bulk insert. An invalid order does not prevent the others from
+        being created: its error is reported in its outcome instead. Quote tokens
+        are ignored, since the products are priced in a single pass anyway.
+
+        Args:
+            requests: The checkout requests.
+
+        Returns:
+            List[CheckoutOutcomeDTO]: The outcome of each request, in the order given.
+
+        Raises:
+            ExternalServiceError: If the products could not be fetched.
+            DeadlineExceededError: If the deadline expires before the orders are
+             created.
+        """
+        check_deadline("checkout")
+        orders_in = [(str(r.customer_id), list(r.items)) for r in requests]
+        customer_ids, product_map = await self._resolve_many(orders_in)
+
+        results: List[Order | DomainError] = [
+            self._try_create_order(customer_ids[customer_id], items, product_map)
+            if customer_id in customer_ids
+            else CustomerNotFoundError(search_params={"external_id": customer_id})
+            for customer_id, items in orders_in
+        ]
+
+        orders = [result for result in results if isinstance(result, Order)]
+        created = iter(
+            await measure_stage("insert", self._order_repository.insert_many(orders))
+        )
 
-        customer = await self._get_customer(request.customer_id)
-        product_map = self._product_service.fetch_products_by_ids(
-            [item.product_id for item in request.items]
+        return [
+            CheckoutOutcomeDTO.from_result(
+                next(created) if isinstance(result, Order) else result
+            )
+            for result in results
+        ]
+
+    async def _place_order(
+        self,
+        customer_external_id: str,
+        items: List[CheckoutItemDTO],
+        external_id: Optional[ExternalEntityId] = None,
+        quote: Optional[PriceQuote] = None,
+    ) -> CheckedOutOrderDTO:
+        """Looks up the customer and the products, then creates the order."""
+        customer_id, product_map = await self._resolve(
+            customer_external_id, items, quote
         )
 
-        order_items = self._create_order_items(request.items, product_map)
-        order = Order(customer_id=customer.id, items=list(order_items))
-        created_order = await self._order_repository.insert(order)
+        order = self._create_order(customer_id, items, product_map, external_id)
+        created_order = await measure_stage(
+            "insert", self._order_repository.insert(order)
+        )
 
-        # TODO: Implement order production and payment request
+        # Production and payment are requested by the OrderEventHandler, from the
+        # event written with the order.
 
         return CheckedOutOrderDTO.from_entity(created_order)
 
-    async def _get_customer(self, customer_external_id: str) -> Customer:
-        """Gets a customer by external id.
+    async def _checkout_idempotently(
+        self,
+        customer_external_id: str,
+        items: List[CheckoutItemDTO],
+        idempotency_key: str,
+        quote: Optional[PriceQuote] = None,
+    ) -> CheckedOutOrderDTO:
+        """Creates the order once per idempotency key, replaying it on retries."""
+        record, reserved = await self._reserve(
+            customer_external_id, items, idempotency_key
+        )
+        if not reserved and (
+            order := await self._order_repository.find_by_external_id(
+                record.order_external_id
+            )
+        ):
+            return CheckedOutOrderDTO.from_entity(order)
+
+        # Either the key was just reserved, or the request that reserved it has not
+        # created the order yet, or failed to: the order is created with the reserved
+        # external id, whose unique index lets a single request create it.
+        try:
+            return await self._place_order(
+                customer_external_id,
+                items,
+                ExternalEntityId(record.order_external_id),
+                quote,
+            )
+        except DuplicateKeyError:
+            # A concurrent retry created the order first.
+            return await self._replay(record)
+
+    async def _reserve(
+        self,
+        customer_external_id: str,
+        items: List[CheckoutItemDTO],
+        idempotency_key: str,
+    ) -> Tuple[IdempotencyRecord, bool]:
+        """Reserves an idempotency key for a request, with a random order external id.
+
+        Returns:
+            Tuple[IdempotencyRecord, bool]: The record of the key, and whether it was
+             reserved by this call rather than by an earlier request.
+
+        Raises:
+            IdempotencyKeyReusedError: If the key is reserved for a different request.
+        """
+        key = self._idempotency_scope(customer_external_id, idempotency_key)
+        digest = self._request_digest(customer_external_id, items)
+
+        if not (record := await self._idempotency_store.get(key)):
+            reservation = IdempotencyRecord(key, digest, str(ExternalEntityId()))
+            record = await self._idempotency_store.save(reservation)
+            if record == reservation:
+                return record, True
+
+        self._ensure_same_request(record, digest, idempotency_key)
+        return record, False
+
+    async def _replay(self, record: IdempotencyRecord) -> CheckedOutOrderDTO:
+        """Gets the order created by the request the record was stored for.
+
+        Raises:
+            RecordNotFoundError: If the order no longer exists.
+        """
+        order = await self._order_repository.find_by_external_id(
+            record.order_external_id
+        )
+        if not order:
+            raise RecordNotFoundError(
+                entity_class=Order,
+                search_params={"external_id": record.order_external_id},
+            )
+
+        return CheckedOutOrderDTO.from_entity(order)
+
+    @staticmethod
+    def _idempotency_scope(customer_external_id: str, idempotency_key: str) -> str:
+        """Scopes an idempotency key to the customer, so clients cannot collide."""
+        return f"{customer_external_id}:{idempotency_key}"
+
+    @staticmethod
+    def _request_digest(customer_external_id: str, items: List[CheckoutItemDTO]) -> str:
+        """Digests a checkout request, to tell retries from reused idempotency keys."""
+        content = [
+            str(customer_external_id),
+            [[item.product_id, item.quantity] for item in items],
+        ]
+        return hashlib.sha256(json.dumps(content).encode()).hexdigest()
+
+    @staticmethod
+    def _ensure_same_request(
+        record: IdempotencyRecord, digest: str, idempotency_key: str
+    ) -> None:
+        """Raises IdempotencyKeyReusedError if the record is for another request."""
+        if record.fingerprint != digest:
+            raise IdempotencyKeyReusedError(idempotency_key=idempotency_key)
+
+    def _verify_quote(self, quote_token: Optional[str]) -> Optional[PriceQuote]:
+        """Reads the quote of a token, if any, ignoring invalid or expired ones."""
+        if quote_token is None or self._quote_signer is None:
+            return None
+        return self._quote_signer.verify(quote_token)
+
+    async def _resolve(
+        self,
+        customer_external_id: str,
+        items: List[CheckoutItemDTO],
+        quote: Optional[PriceQuote] = None,
+    ) -> Tuple[UniqueEntityId, Dict[str, Product]]:
+        """Resolves the customer and looks up the ordered products concurrently.
+
+        Products covered by the quote are not looked up at all.
 
         Args:
             customer_external_id: The customer's external identifier.
+            items: The ordered items.
+            quote: The quote the products may be priced from, if any.
 
         Returns:
-            Customer: The customer entity if found.
+            Tuple[UniqueEntityId, Dict[str, Product]]: The customer's internal
+             identifier, and the products found, keyed by id.
 
         Raises:
             CustomerNotFoundError: If the customer is not found.
+            ExternalServiceError: If the products could not be fetched.
+        """
+        product_ids = list(dict.fromkeys(item.product_id for item in items))
+        if quote is not None and quote.covers(product_ids):
+            customer_id = await measure_stage(
+                "customer", self._get_customer_id(customer_external_id)
+            )
+            return customer_id, quote.products
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                customer_id = group.create_task(
+                    measure_stage(
+                        "customer", self._get_customer_id(customer_external_id)
+                    )
+                )
+                products = group.create_task(
+                    measure_stage("products", self._get_products(product_ids))
+                )
+        except* Exception as error_group:
+            raise self._first_error(error_group) from None
+
+        return customer_id.result(), products.result()
+
+    async def _resolve_many(
+        self, orders_in: Sequence[Tuple[str, List[CheckoutItemDTO]]]
+    ) -> Tuple[Dict[str, UniqueEntityId], Dict[str, Product]]:
+        """Resolves the customers and looks up the products of many orders concurrently.
+
+        Args:
+            orders_in: The customer's external identifier and the items of each
+             order.
+
+        Returns:
+            Tuple[Dict[str, UniqueEntityId], Dict[str, Product]]: The internal
+             identifiers of the customers found, keyed by external identifier, and the
+             products found, keyed by id.
+
+        Raises:
+            ExternalServiceError: If the products could not be fetched.
         """
-        customer = await self._customer_repository.find_by_external_id(
-            customer_external_id
+        customer_ids = [customer_id for customer_id, _ in orders_in]
+        product_ids = list(
+            dict.fromkeys(item.product_id for _, items in orders_in for item in items)
         )
-        if not customer:
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                customers = group.create_task(
+                    measure_stage(
+                        "customer",
+                        self._customer_id_resolver.resolve_many(customer_ids),
+                    )
+                )
+                products = group.create_task(
+                    measure_stage("products", self._get_products(product_ids))
+                )
+        except* Exception as error_group:
+            raise self._first_error(error_group) from None
+
+        return customers.result(), products.result()
+
+    @staticmethod
+    def _first_error(error_group: BaseExceptionGroup) -> BaseException:
+        """Picks the error to raise when the checkout stages fail.
+
+        A missing customer always wins, so the error does not depend on which stage
+        happened to fail first.
+        """
+        errors = error_group.exceptions
+        customer_errors = [e for e in errors if isinstance(e, CustomerNotFoundError)]
+        return (customer_errors or errors)[0]
+
+    async def _get_customer_id(self, customer_external_id: str) -> UniqueEntityId:
+        """Gets the internal identifier of a customer by external id.
+
+        Only the identifier is needed to create the order, so the customer is not
+        loaded.
+
+        Args:
+            customer_external_id: The customer's external identifier.
+
+        Returns:
+            UniqueEntityId: The customer's internal identifier if found.
+
+        Raises:
+            CustomerNotFoundError: If the customer is not found.
+        """
+        customer_id = await self._customer_id_resolver.resolve(customer_external_id)
+        if not customer_id:
             raise CustomerNotFoundError(
                 search_params={"external_id": customer_external_id}
             )
 
-        return customer
+        return customer_id
+
+    async def _get_products(self, product_ids: List[str]) -> Dict[str, Product]:
+        """Gets the products found among the given ids, keyed by id.
+
+        Products not found are left out rather than raised, so they cannot take
+        precedence over a missing customer.
+        """
+        if not product_ids:
+            return {}
+        return await self._product_service.fetch_product_map(product_ids)
+
+    @classmethod
+    def _create_order(
+        cls,
+        customer_id: UniqueEntityId,
+        items: List[CheckoutItemDTO],
+        product_map: Dict[str, Product],
+        external_id: Optional[ExternalEntityId] = None,
+    ) -> Order:
+        """Creates the order of the customer, pricing the ordered items.
+
+        Raises:
+            EmptyOrderError: If the order has no items.
+            OrderCreationFailedDueToMissingProductsError: If any product is not found.
+        """
+        if not items:
+            raise EmptyOrderError()
+
+        order_items = cls._create_order_items(items, product_map)
+        return Order(
+            customer_id=customer_id,
+            items=list(order_items),
+            external_id=external_id or ExternalEntityId(),
+        )
+
+    @classmethod
+    def _try_create_order(
+        cls,
+        customer_id: UniqueEntityId,
+        items: List[CheckoutItemDTO],
+        product_map: Dict[str, Product],
+    ) -> Order | DomainError:
+        """Creates the order of the customer, returning the error that prevented it."""
+        try:
+            return cls._create_order(customer_id, items, product_map)
+        except DomainError as error:
+            return error
 
     @staticmethod
     def _create_order_items(
-        checkout_items: Iterable[CheckoutItemDTO], products: List[Product]
+        checkout_items: Iterable[CheckoutItemDTO], product_map: Dict[str, Product]
     ) -> Iterable[OrderItem]:
-        product_map: Dict[str, Product] = {product.id: product for product in products}
+        """Prices the ordered items.
 
-        order_items: List[OrderItem] = []
+        Raises:
+            OrderCreationFailedDueToMissingProductsError: If any product is not found.
+        """
+        checkout_items = list(checkout_items)
 
-        for checkout_item in checkout_items:
-            if product := product_map.get(checkout_item.product_id):
-                order_items.append(
-                    OrderItem(
-                        product_id=checkout_item.product_id,
-                        quantity=checkout_item.quantity,
-                        value=product.price,
-                    )
-                )
-            else:
-                raise ValueError(
-                    f"Product with ID {checkout_item.product_id} not found."
-                )
+        if missing_ids := [
+            item.product_id
+            for item in checkout_items
+            if item.product_id not in product_map
+        ]:
+            raise OrderCreationFailedDueToMissingProductsError(
+                missing_product_ids=list(dict.fromkeys(missing_ids))
+            )
 
-        return order_items
+        return [
+            OrderItem(
+                product_id=item.product_id,
+                quantity=item.quantity,
+                value=product_map[item.product_id].price,
+            )
+            for item in checkout_items
+        ]
 
 
 __all__ = ["CheckoutUseCase"]
@@ -0,0 +1,249 @@
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncGenerator, List, Optional, Tuple
+
+from src.application.error import ServiceUnavailableError
+from src.application.use_cases.order.checkout.checkout import CheckoutUseCase
+from src.application.use_cases.order.checkout.dto import (
+    CheckedOutOrderDTO,
+    CheckoutOrderDTO,
+    CheckoutProgress,
+    CheckoutStatusDTO,
+)
+from src.domain.__shared.value_objects import ExternalEntityId
+from src.domain.order.error import EmptyOrderError
+from src.domain.order.repository import IOrderRepository
+from src.infra.cache import TTLCache
+from src.infra.metrics import Metric
+
+_Job = Tuple[CheckoutOrderDTO, Optional[str], ExternalEntityId]
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class CheckoutQueueFullError(ServiceUnavailableError):
+    """Raised when a checkout is refused because too many are already waiting."""
+
+    message: str = "Too many checkouts in progress, try again later"
+
+
+class CheckoutDispatcher:
+    """Performs checkouts in the background, on a fixed pool of workers.
+
+    A checkout is accepted as soon as its request is validated and its order external
+    id assigned. It then waits in a bounded queue for a worker to look up the customer
+    and the products and create the order, so the client does not wait on the product
+    service nor on the database.
+
+    The progress of recent checkouts is kept in process. Once it is forgotten, or when
+    polled from another worker, the progress of a completed checkout is read from the
+    summary of its order in the order repository.
+    """
+
+    def __init__(
+        self,
+        checkout_use_case: CheckoutUseCase,
+        order_repository: IOrderRepository,
+        statuses: TTLCache[str, CheckoutStatusDTO],
+        workers: int = 8,
+        queue_size: int = 1000,
+        drain_timeout: float = 10.0,
+    ) -> None:
+        """Initializes a new instance of the CheckoutDispatcher class.
+
+        Args:
+            checkout_use_case: The use case performing the checkouts.
+            order_repository: The repository the created orders are read from.
+            statuses: The cache holding the progress of recent checkouts.
+            workers: The number of checkouts performed concurrently.
+            queue_size: The maximum number of accepted checkouts waiting for a worker.
+            drain_timeout: For how long, in seconds, stopping waits for the accepted
+             checkouts to be performed.
+        """
+        self._checkout_use_case = checkout_use_case
+        self._order_repository = order_repository
+        self._statuses = statuses
+        self._worker_count = workers
+        self._queue: asyncio.Queue[_Job] = asyncio.Queue(maxsize=queue_size)
+        self._drain_timeout = drain_timeout
+        self._workers: List[asyncio.Task] = []
+        self._rejected = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers are started."""
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Starts the workers."""
+        if not self._workers:
+            self._workers = [
+                asyncio.create_task(self._work()) for _ in range(self._worker_count)
+            ]
+
+    async def stop(self) -> None:
+        """Waits for the accepted checkouts to be performed, then stops the workers."""
+        if not self._workers:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), self._drain_timeout)
+        except TimeoutError:
+            pass
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(
+        self, request: CheckoutOrderDTO, idempotency_key: Optional[str] = None
+    ) -> CheckoutStatusDTO:
+        """Accepts a checkout, to be performed in the background.
+
+        Args:
+            request: The checkout request data.
+            idempotency_key: The key identifying the request across retries, if any.
+
+        Returns:
+            CheckoutStatusDTO: The status of the accepted checkout, holding the
+             external id the order will be created with.
+
+        Raises:
+            EmptyOrderError: If the order has no items.
+            IdempotencyKeyReusedError: If the idempotency key was already used for a
+             different request.
+            CheckoutQueueFullError: If too many checkouts are already waiting.
+            RuntimeError: If the workers are not started.
+        """
+        if not self._workers:
+            raise RuntimeError("The checkout dispatcher is not running")
+
+        request = CheckoutOrderDTO(
+            customer_id=request.customer_id,
+            items=list(request.items),
+            quote_token=request.quote_token,
+        )
+        if not request.items:
+            raise EmptyOrderError()
+
+        external_id = await self._checkout_use_case.assign_external_id(
+            request, idempotency_key
+        )
+        try:
+            self._queue.put_nowait((request, idempotency_key, external_id))
+        except asyncio.QueueFull:
+            self._rejected += 1
+            raise CheckoutQueueFullError() from None
+
+        return self._set_status(str(external_id), CheckoutProgress.ACCEPTED)
+
+    async def get_status(self, external_id: str) -> Optional[CheckoutStatusDTO]:
+        """Gets the progress of a checkout.
+
+        Args:
+            external_id: The external id of the order.
+
+        Returns:
+            Optional[CheckoutStatusDTO]: The status of the checkout, or None if it is
+             unknown to this worker and the order does not exist.
+        """
+        if status := self._statuses.get(external_id):
+            return status
+
+        summary = await self._order_repository.find_summary_by_external_id(external_id)
+        if not summary:
+            return None
+
+        return CheckoutStatusDTO(
+            external_id=external_id,
+            progress=CheckoutProgress.COMPLETED,
+            order=summary,
+        )
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the queue counters as metric samples."""
+        return [
+            Metric(
+                "checkout_queue_depth",
+                self._queue.qsize(),
+                "Accepted checkouts waiting for a worker.",
+                type="gauge",
+            ),
+            Metric(
+                "checkout_queue_rejected_total",
+                self._rejected,
+                "Checkouts refused because the queue was full.",
+            ),
+        ]
+
+    async def _work(self) -> None:
+        while True:
+            request, idempotency_key, external_id = await self._queue.get()
+            try:
+                await self._perform(request, idempotency_key, external_id)
+            finally:
+                self._queue.task_done()
+
+    async def _perform(
+        self,
+        request: CheckoutOrderDTO,
+        idempotency_key: Optional[str],
+        external_id: ExternalEntityId,
+    ) -> None:
+        key = str(external_id)
+        self._set_status(key, CheckoutProgress.PROCESSING)
+
+        try:
+            order = await self._checkout_use_case.checkout(
+                request, idempotency_key, external_id
+            )
+        except Exception as error:
+            self._set_status(key, CheckoutProgress.FAILED, error=error)
+        else:
+            self._set_status(key, CheckoutProgress.COMPLETED, order=order)
+
+    def _set_status(
+        self,
+        external_id: str,
+        progress: CheckoutProgress,
+        order: Optional[CheckedOutOrderDTO] = None,
+        error: Optional[Exception] = None,
+    ) -> CheckoutStatusDTO:
+        status = CheckoutStatusDTO(
+            external_id=external_id,
+            progress=progress,
+            order=order.summarize() if order else None,
+            error=error,
+        )
+        self._statuses.put(external_id, status)
+        return status
+
+
+@asynccontextmanager
+async def initialize_checkout_dispatcher(
+    checkout_dispatcher: CheckoutDispatcher,
+) -> AsyncGenerator[CheckoutDispatcher, None]:
+    """Run the checkout workers for the duration of the context.
+
+    Exiting the context waits for the accepted checkouts to be performed, so the
+    database and the product service must be available for the whole context.
+
+    Args:
+        checkout_dispatcher: The dispatcher of the background checkouts.
+
+    Yields:
+        CheckoutDispatcher: The started dispatcher.
+    """
+    await checkout_dispatcher.start()
+    try:
+        yield checkout_dispatcher
+    finally:
+        await checkout_dispatcher.stop()
+
+
+__all__ = [
+    "CheckoutDispatcher",
+    "CheckoutQueueFullError",
+    "initialize_checkout_dispatcher",
+]
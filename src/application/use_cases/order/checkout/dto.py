@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable
+from enum import StrEnum, auto
+from typing import Iterable, Optional
 
+from src.domain.__shared.error import DomainError
 from src.domain.order import OrderStatus, Order
+from src.domain.order.read_models import OrderSummary
 
 
 @dataclass(slots=True, frozen=True)
@@ -19,6 +22,7 @@ class CheckoutOrderDTO:
 
     customer_id: str
     items: Iterable[CheckoutItemDTO]
+    quote_token: Optional[str] = None
 
 
 @dataclass
@@ -52,17 +56,71 @@ class CheckedOutOrderDTO:
                 CheckedOutItemDTO(
                     product_id=str(item.product_id),
                     quantity=item.quantity,
-                    unit_price=item.unit_price,
+                    unit_price=item.value,
                 )
                 for item in entity.items
             ],
             customer_id=str(entity.customer_id),
         )
 
+    def summarize(self) -> OrderSummary:
+        """Returns the summary of the order."""
+        return OrderSummary(
+            external_id=self.external_id,
+            status=self.status,
+            total_value=self.total_value,
+            created_at=self.created_at,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class CheckoutOutcomeDTO:
+    """CheckoutOutcome represents the result of one of the orders of a bulk checkout.
+
+    Exactly one of `order` and `error` is set.
+    """
+
+    order: Optional[CheckedOutOrderDTO] = None
+    error: Optional[DomainError] = None
+
+    @classmethod
+    def from_result(
+        cls: "CheckoutOutcomeDTO", result: Order | DomainError
+    ) -> "CheckoutOutcomeDTO":
+        if isinstance(result, DomainError):
+            return cls(error=result)
+        return cls(order=CheckedOutOrderDTO.from_entity(result))
+
+
+class CheckoutProgress(StrEnum):
+    """The progress of a checkout performed in the background."""
+
+    ACCEPTED = auto()
+    PROCESSING = auto()
+    COMPLETED = auto()
+    FAILED = auto()
+
+
+@dataclass(slots=True, frozen=True)
+class CheckoutStatusDTO:
+    """CheckoutStatus represents the progress of a checkout performed in the background.
+
+    The summary of the order is set once the checkout is completed, and the error
+    once it failed.
+    """
+
+    external_id: str
+    progress: CheckoutProgress
+    order: Optional[OrderSummary] = None
+    error: Optional[Exception] = None
+
 
 __all__ = [
     "CheckoutItemDTO",
+    "CheckoutProgress",
+    "CheckoutStatusDTO",
     "CheckoutOrderDTO",
+    "CheckoutOutcomeDTO",
     "CheckedOutItemDTO",
     "CheckedOutOrderDTO",
 ]
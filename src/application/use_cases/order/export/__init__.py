@@ -0,0 +1,4 @@
+from .dto import ExportedOrderDTO, ExportedOrderItemDTO
+from .export import ExportOrdersUseCase
+
+__all__ = ["ExportOrdersUseCase", "ExportedOrderDTO", "ExportedOrderItemDTO"]
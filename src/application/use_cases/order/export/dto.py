@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+from src.domain.order import OrderStatus
+
+
+@dataclass(slots=True, frozen=True)
+class ExportedOrderItemDTO:
+    """ExportedOrderItem represents an item of an exported order."""
+
+    product_id: str
+    quantity: int
+    value: float
+
+
+@dataclass(slots=True, frozen=True)
+class ExportedOrderDTO:
+    """ExportedOrder represents an order, as exported for reconciliation."""
+
+    external_id: str
+    customer_id: str
+    status: OrderStatus
+    total_value: float
+    created_at: datetime
+    items: List[ExportedOrderItemDTO]
+
+
+__all__ = ["ExportedOrderDTO", "ExportedOrderItemDTO"]
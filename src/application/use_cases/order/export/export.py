@@ -0,0 +1,71 @@
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from src.application.use_cases.order.export.dto import (
+    ExportedOrderDTO,
+    ExportedOrderItemDTO,
+)
+from src.domain.order import Order
+from src.domain.order.repository import IOrderRepository
+
+
+class ExportOrdersUseCase:
+    """ExportOrdersUseCase lists the orders created within a period, for reconciliation."""
+
+    def __init__(self, order_repository: IOrderRepository, batch_size: int) -> None:
+        """Initializes a new instance of the ExportOrdersUseCase class.
+
+        Args:
+            order_repository: The repository for order operations.
+            batch_size: The maximum number of orders read from the repository at once.
+        """
+        self._order_repository = order_repository
+        self._batch_size = batch_size
+
+    async def export(
+        self,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> AsyncIterator[ExportedOrderDTO]:
+        """Iterates over the orders created within a period, sorted by creation.
+
+        The orders are read in batches, as they are consumed: a slow consumer slows
+        the reads down, and the orders of at most one batch are held in memory, however
+        long the period.
+
+        Args:
+            created_from: If given, only the orders created at or after it are
+             exported.
+            created_until: If given, only the orders created before it are exported.
+
+        Returns:
+            AsyncIterator[ExportedOrderDTO]: The orders.
+        """
+        orders = self._order_repository.iter_all(
+            batch_size=self._batch_size,
+            created_from=created_from,
+            created_until=created_until,
+        )
+        async for order in orders:
+            yield self._to_dto(order)
+
+    @staticmethod
+    def _to_dto(order: Order) -> ExportedOrderDTO:
+        return ExportedOrderDTO(
+            external_id=str(order.external_id),
+            customer_id=str(order.customer_id),
+            status=order.status,
+            total_value=order.total_value,
+            created_at=order.created_at,
+            items=[
+                ExportedOrderItemDTO(
+                    product_id=item.product_id,
+                    quantity=item.quantity,
+                    value=item.value,
+                )
+                for item in order.items
+            ],
+        )
+
+
+__all__ = ["ExportOrdersUseCase"]
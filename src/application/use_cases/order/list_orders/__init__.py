@@ -0,0 +1,3 @@
+from .list_orders import ListOrdersUseCase
+
+__all__ = ["ListOrdersUseCase"]
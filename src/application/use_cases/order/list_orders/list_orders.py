@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from src.domain.order.repository import IOrderRepository, OrderSummaryPage
+
+
+class ListOrdersUseCase:
+    """ListOrdersUseCase pages through the summaries of the orders."""
+
+    def __init__(self, order_repository: IOrderRepository) -> None:
+        """Initializes a new instance of the ListOrdersUseCase class.
+
+        Args:
+            order_repository: The repository for order operations.
+        """
+        self._order_repository = order_repository
+
+    async def execute(
+        self,
+        page_size: int,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderSummaryPage:
+        """Lists a page of order summaries, sorted by creation.
+
+        Only the fields of the summaries are read: the orders themselves are not
+        loaded.
+
+        Args:
+            page_size: The maximum number of orders of the page.
+            page_token: The token of the page, as returned with the previous one.
+             None for the first page.
+            created_from: If given, only the orders created at or after it are listed.
+            created_until: If given, only the orders created before it are listed.
+
+        Returns:
+            OrderSummaryPage: The summaries of the page, and the token of the next one.
+
+        Raises:
+            InvalidPageTokenError: If the page token is malformed.
+        """
+        return await self._order_repository.list_summaries(
+            page_size=page_size,
+            page_token=page_token,
+            created_from=created_from,
+            created_until=created_until,
+        )
+
+
+__all__ = ["ListOrdersUseCase"]
@@ -0,0 +1,23 @@
+from src.domain.order.events import OrderEvent, OrderEventType
+from src.domain.order.outbox import IOrderEventHandler
+
+
+class OrderEventHandler(IOrderEventHandler):
+    """Performs the work following the order events, out of the checkout request."""
+
+    async def handle(self, event: OrderEvent) -> None:
+        """Handles an order event delivered from the outbox.
+
+        Args:
+            event: The order event.
+        """
+        match event.type:
+            case OrderEventType.ORDER_CREATED:
+                await self._request_production_and_payment(event)
+
+    async def _request_production_and_payment(self, event: OrderEvent) -> None:
+        """Requests the production and the payment of a new order."""
+        # TODO: Implement order production and payment request
+
+
+__all__ = ["OrderEventHandler"]
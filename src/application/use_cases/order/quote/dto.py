@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+
+@dataclass(slots=True, frozen=True)
+class QuotedItemDTO:
+    """QuotedItem represents the price of an item of a cart."""
+
+    product_id: str
+    quantity: int
+    unit_price: float
+
+
+@dataclass(slots=True, frozen=True)
+class QuoteDTO:
+    """Quote represents the prices of a cart, and the token guaranteeing them."""
+
+    items: List[QuotedItemDTO]
+    total_value: float
+    expires_at: datetime
+    quote_token: str
+
+
+__all__ = ["QuoteDTO", "QuotedItemDTO"]
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+from typing import Iterable
+
+from src.application.use_cases.order.checkout.dto import CheckoutItemDTO
+from src.application.use_cases.order.quote.dto import QuoteDTO, QuotedItemDTO
+from src.domain.__shared.interfaces import IProductService
+from src.domain.order.error import (
+    EmptyOrderError,
+    OrderCreationFailedDueToMissingProductsError,
+)
+from src.domain.order.quote import IQuoteSigner, PriceQuote
+
+
+class QuoteUseCase:
+    """QuoteUseCase prices carts ahead of their checkout."""
+
+    def __init__(
+        self, product_service: IProductService, quote_signer: IQuoteSigner, ttl: float
+    ) -> None:
+        """Initializes a new instance of the QuoteUseCase class.
+
+        Args:
+            product_service: The service for product operations.
+            quote_signer: The signer of the quote tokens.
+            ttl: For how long, in seconds, the quoted prices are guaranteed.
+        """
+        self._product_service = product_service
+        self._quote_signer = quote_signer
+        self._ttl = timedelta(seconds=ttl)
+
+    async def quote(self, items: Iterable[CheckoutItemDTO]) -> QuoteDTO:
+        """Prices a cart.
+
+        The prices are returned with a signed quote token. A checkout of the same
+        products sent with the token before it expires is priced from the token,
+        without looking up the products again.
+
+        Args:
+            items: The items of the cart.
+
+        Returns:
+            QuoteDTO: The price of each item, the total value of the cart, and the
+             quote token.
+
+        Raises:
+            EmptyOrderError: If the cart has no items.
+            OrderCreationFailedDueToMissingProductsError: If any product is not found.
+            ExternalServiceError: If the products could not be fetched.
+        """
+        items = list(items)
+        if not items:
+            raise EmptyOrderError()
+
+        product_ids = list(dict.fromkeys(item.product_id for item in items))
+        product_map = await self._product_service.fetch_product_map(product_ids)
+        if missing_ids := [i for i in product_ids if i not in product_map]:
+            raise OrderCreationFailedDueToMissingProductsError(
+                missing_product_ids=missing_ids
+            )
+
+        quote = PriceQuote(
+            products=product_map, expires_at=datetime.now(timezone.utc) + self._ttl
+        )
+        quoted_items = [
+            QuotedItemDTO(
+                product_id=item.product_id,
+                quantity=item.quantity,
+                unit_price=product_map[item.product_id].price,
+            )
+            for item in items
+        ]
+        return QuoteDTO(
+            items=quoted_items,
+            total_value=sum(item.unit_price * item.quantity for item in quoted_items),
+            expires_at=quote.expires_at,
+            quote_token=self._quote_signer.sign(quote),
+        )
+
+
+__all__ = ["QuoteUseCase"]
@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
-from ..validator import ValidationError, ValidationErrorDetails
+from ..validator import ValidationError, ValidationErrorDetails, is_hydration_trusted
 from ..validator.validator_interface import ValidationResult
 from ..value_objects import ExternalEntityId, UniqueEntityId
 
@@ -27,6 +27,19 @@ class AggregateRoot(ABC):
         """Property to get the unique identifier."""
         return self._id
 
+    def assign_id(self, identifier: UniqueEntityId) -> None:
+        """Assigns the unique identifier generated when the aggregate root is stored.
+
+        Args:
+            identifier: The unique identifier.
+
+        Raises:
+            ValueError: If the aggregate root already has another identifier.
+        """
+        if self._id is not None and self._id != identifier:
+            raise ValueError("The aggregate root already has an identifier")
+        self._id = identifier
+
     @abstractmethod
     def validate(self) -> ValidationResult:
         """Validate the aggregate root.
@@ -36,7 +49,13 @@ class AggregateRoot(ABC):
         """
 
     def __post_init__(self) -> None:
-        """Post-initialization processing to validate the aggregate root."""
+        """Post-initialization processing to validate the aggregate root.
+
+        Aggregate roots built within `trusted_hydration` are not validated.
+        """
+        if is_hydration_trusted():
+            return
+
         validation_result = self.validate()
 
         additional_validations = [
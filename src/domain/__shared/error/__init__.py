@@ -1,8 +1,10 @@
 from .domain_error import DomainError
+from .deadline_exceeded_error import DeadlineExceededError
 from .entity_conflict_error import EntityConflictError
 from .entity_not_found_error import EntityNotFoundError
 
 __all__ = [
+    "DeadlineExceededError",
     "DomainError",
     "EntityConflictError",
     "EntityNotFoundError",
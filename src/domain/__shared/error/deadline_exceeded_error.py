@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from .domain_error import DomainError
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class DeadlineExceededError(DomainError):
+    """Raised when the time budget of a request is spent before its work is done.
+
+    Attributes:
+        stage: The stage of the work the budget ran out at, if known.
+    """
+
+    message: str = "Tempo limite da requisição excedido"
+    stage: Optional[str] = None
+
+
+__all__ = ["DeadlineExceededError"]
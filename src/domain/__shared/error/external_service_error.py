@@ -1,3 +1,6 @@
+from typing import Optional, Sequence
+
+
 class ExternalServiceError(Exception):
     def __init__(self, message: str, status_code: int):
         self.message = message
@@ -5,4 +8,51 @@ class ExternalServiceError(Exception):
         super().__init__(f"{message} (Status code: {status_code})")
 
 
-__all__ = ["ExternalServiceError"]
+class ProductLookupError(ExternalServiceError):
+    """Raised when some of the requested products could not be fetched.
+
+    Attributes:
+        missing_ids: The ids the product service reported as not found.
+        failed_ids: The ids whose lookup failed for any other reason.
+    """
+
+    def __init__(
+        self,
+        missing_ids: Sequence[str] = (),
+        failed_ids: Sequence[str] = (),
+        status_code: int = 404,
+        message: Optional[str] = None,
+    ):
+        self.missing_ids = list(missing_ids)
+        self.failed_ids = list(failed_ids)
+        super().__init__(
+            message=message or self._build_message(self.missing_ids, self.failed_ids),
+            status_code=status_code,
+        )
+
+    @classmethod
+    def combine(
+        cls, missing_ids: Sequence[str], errors: Sequence["ProductLookupError"]
+    ) -> "ProductLookupError":
+        """Merges the missing ids and the failed lookups into a single error.
+
+        The status code of the first failed lookup wins; when no lookup failed, the
+        products are just missing and the status code is 404.
+        """
+        return cls(
+            missing_ids=[*missing_ids, *(i for e in errors for i in e.missing_ids)],
+            failed_ids=[i for e in errors for i in e.failed_ids],
+            status_code=errors[0].status_code if errors else 404,
+        )
+
+    @staticmethod
+    def _build_message(missing_ids: Sequence[str], failed_ids: Sequence[str]) -> str:
+        details = []
+        if missing_ids:
+            details.append(f"not found: {', '.join(missing_ids)}")
+        if failed_ids:
+            details.append(f"failed: {', '.join(failed_ids)}")
+        return f"Failed to fetch products ({'; '.join(details)})"
+
+
+__all__ = ["ExternalServiceError", "ProductLookupError"]
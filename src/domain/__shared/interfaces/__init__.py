@@ -1,4 +1,5 @@
+from .idempotency_store import IIdempotencyStore, IdempotencyRecord
 from .repository_interface import IRepository
 from .product_service import IProductService
 
-__all__ = ["IRepository", "IProductService"]
+__all__ = ["IIdempotencyStore", "IdempotencyRecord", "IRepository", "IProductService"]
@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class IdempotencyRecord:
+    """The reservation of an idempotency key by a request.
+
+    Attributes:
+        key: The idempotency key, scoped to the client that sent it.
+        fingerprint: A digest of the request, so a key reused for a different request
+         can be told apart from a retry.
+        order_external_id: The external identifier of the order the request creates,
+         reserved with the key.
+    """
+
+    key: str
+    fingerprint: str
+    order_external_id: str
+
+
+class IIdempotencyStore(ABC):
+    """Remembers, for a bounded time, the results of requests with idempotency keys."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[IdempotencyRecord]:
+        """Gets the record stored under the given key.
+
+        Args:
+            key: The idempotency key.
+
+        Returns:
+            Optional[IdempotencyRecord]: The record, or None if the key is unknown or
+             expired.
+        """
+        pass
+
+    @abstractmethod
+    async def save(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        """Stores a record, unless its key is already taken by a record not expired.
+
+        Args:
+            record: The record to store.
+
+        Returns:
+            IdempotencyRecord: The record stored under the key, which is the one given
+             unless another one was stored first and has not expired.
+        """
+        pass
+
+
+__all__ = ["IIdempotencyStore", "IdempotencyRecord"]
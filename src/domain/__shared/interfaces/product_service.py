@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List
+from typing import Dict, List
+
+from src.domain.__shared.error.external_service_error import ProductLookupError
 
 
 @dataclass(frozen=True)
@@ -12,8 +14,41 @@ class Product:
 
 class IProductService(ABC):
     @abstractmethod
-    def fetch_products_by_ids(self, ids: List[str]) -> List[Product]:
+    async def fetch_product_map(self, ids: List[str]) -> Dict[str, Product]:
+        """Fetch, in bulk, the products identified by the given ids.
+
+        Args:
+            ids: The product identifiers. Repeated ids are fetched once.
+
+        Returns:
+            Dict[str, Product]: The products found, keyed by id. Ids that do not
+             match any product are absent from the mapping.
+
+        Raises:
+            ExternalServiceError: If the products could not be fetched.
+        """
         pass
 
+    async def fetch_products_by_ids(self, ids: List[str]) -> List[Product]:
+        """Fetch the products identified by the given ids.
+
+        Args:
+            ids: The product identifiers.
+
+        Returns:
+            List[Product]: The distinct products, in the order they were requested.
+
+        Raises:
+            ProductLookupError: If any of the products does not exist.
+            ExternalServiceError: If the products could not be fetched.
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        product_map = await self.fetch_product_map(unique_ids)
+
+        if missing_ids := [i for i in unique_ids if i not in product_map]:
+            raise ProductLookupError(missing_ids=missing_ids)
+
+        return [product_map[product_id] for product_id in unique_ids]
+
 
 __all__ = ["IProductService", "Product"]
@@ -1,6 +1,7 @@
 from .error import ValidationError
 from .error_details import ValidationErrorDetails
 from .pydantic_validator import IPydanticValidator
+from .trusted_hydration import is_hydration_trusted, trusted_hydration
 from .validator_interface import IValidator, ValidationResult
 
 __all__ = [
@@ -9,4 +10,6 @@ __all__ = [
     "ValidationError",
     "ValidationErrorDetails",
     "ValidationResult",
+    "is_hydration_trusted",
+    "trusted_hydration",
 ]
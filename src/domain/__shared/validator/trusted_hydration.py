@@ -0,0 +1,45 @@
+from contextvars import ContextVar, Token
+from typing import Optional
+
+_trusted: ContextVar[bool] = ContextVar("trusted_hydration", default=False)
+
+
+def trusted_hydration(enabled: bool = True) -> "_TrustedHydration":
+    """Trusts the entities and value objects built within the context.
+
+    Trusted objects are not validated when built. This is meant for objects rebuilt
+    from data validated when it was stored, such as the entities loaded by the
+    repositories, and must never be used for data coming from the outside.
+
+    Normalizations, such as the cleaning of CPF numbers, still apply.
+
+    Args:
+        enabled: Whether the objects are trusted. False validates them as usual,
+         which helps tell whether stored data is still valid.
+
+    Returns:
+        _TrustedHydration: The context manager.
+    """
+    return _TrustedHydration(enabled)
+
+
+def is_hydration_trusted() -> bool:
+    """Whether the objects built in the current context are trusted."""
+    return _trusted.get()
+
+
+# A class rather than a generator: contextlib reassigns the traceback of the errors
+# going through its context managers, which frozen dataclass errors refuse.
+class _TrustedHydration:
+    def __init__(self, enabled: bool) -> None:
+        self._enabled = enabled
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> None:
+        self._token = _trusted.set(self._enabled)
+
+    def __exit__(self, *_exc_info: object) -> None:
+        _trusted.reset(self._token)
+
+
+__all__ = ["is_hydration_trusted", "trusted_hydration"]
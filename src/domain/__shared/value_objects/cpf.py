@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 from .value_object import ValueObject
 from ..error import DomainError
+from ..validator import is_hydration_trusted
 
 
 @dataclass(frozen=True, kw_only=True, slots=True)
@@ -27,7 +28,7 @@ class CPF(ValueObject):
     number: str
 
     def __post_init__(self) -> None:
-        if not self._is_valid(self.number):
+        if not is_hydration_trusted() and not self._is_valid(self.number):
             raise InvalidCPFError(cpf=self.number)
 
         object.__setattr__(
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from ...error import DomainError
+from ...validator import is_hydration_trusted
 from ..value_object import ValueObject
 from .validator import EmailAddressValidatorFactory
 
@@ -25,6 +26,9 @@ class EmailAddress(ValueObject):
 
     def __post_init__(self) -> None:
         """Validates the email address after initialization."""
+        if is_hydration_trusted():
+            return
+
         validation_result = EmailAddressValidatorFactory.create().validate(self)
         if not validation_result.is_valid:
             raise InvalidEmailError(address=self.address)
@@ -3,6 +3,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from ..error import DomainError
+from ..validator import is_hydration_trusted
 from .value_object import ValueObject
 
 
@@ -29,7 +30,8 @@ class ExternalEntityId(ValueObject):
         object.__setattr__(
             self, "id", str(self.id) if isinstance(self.id, UUID) else self.id
         )
-        self.__validate()
+        if not is_hydration_trusted():
+            self.__validate()
 
     def __validate(self) -> None:
         """Validates the UUID format of the id.
@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 
 from ...error import DomainError
+from ...validator import is_hydration_trusted
 from ..value_object import ValueObject
 from .validator import UniqueEntityIdValidatorFactory
 
@@ -23,7 +24,8 @@ class UniqueEntityId(ValueObject):
     id: str = field()
 
     def __post_init__(self) -> None:
-        self.__validate()
+        if not is_hydration_trusted():
+            self.__validate()
 
     def __validate(self) -> None:
         result = UniqueEntityIdValidatorFactory.create().validate(self.id)
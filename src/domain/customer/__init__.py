@@ -1,5 +1,7 @@
 from .entity import Customer
+from .id_resolver import ICustomerIdResolver
+from .read_models import CustomerIdentity
 from .repository import ICustomerRepository
 
 
-__all__ = ["Customer", "ICustomerRepository"]
+__all__ = ["Customer", "CustomerIdentity", "ICustomerIdResolver", "ICustomerRepository"]
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
+
+from src.domain.__shared.value_objects import ExternalEntityId, UniqueEntityId
+
+
+class ICustomerIdResolver(ABC):
+    """Resolves the external identifiers of customers to their internal ones.
+
+    Unlike the customer repository, resolvers do not load, nor validate, the whole
+    customer, which makes them the cheaper choice when only the identifier is needed.
+    """
+
+    @abstractmethod
+    async def resolve(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[UniqueEntityId]:
+        """Resolve the internal identifier of a customer.
+
+        Args:
+            external_id: The external identifier of the customer.
+
+        Returns:
+            Optional[UniqueEntityId]: The internal identifier of the customer, or
+             None if there is no such customer.
+        """
+
+    @abstractmethod
+    async def resolve_many(
+        self, external_ids: Iterable[str | ExternalEntityId]
+    ) -> Dict[str, UniqueEntityId]:
+        """Resolve, in a single lookup, the internal identifiers of many customers.
+
+        Args:
+            external_ids: The external identifiers of the customers.
+
+        Returns:
+            Dict[str, UniqueEntityId]: The internal identifiers found, keyed by
+             external identifier. Identifiers that do not match any customer are
+             absent from the mapping.
+        """
+
+    @abstractmethod
+    def invalidate(self, *external_ids: str | ExternalEntityId) -> None:
+        """Forget what is known about customers, after they are created or changed.
+
+        Args:
+            external_ids: The external identifiers of the customers.
+        """
+
+
+__all__ = ["ICustomerIdResolver"]
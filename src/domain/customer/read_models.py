@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True, slots=True)
+class CustomerIdentity:
+    """Who a customer is, read without loading the whole customer.
+
+    Read models are built straight from the stored fields they need, which were
+    validated when the customer was created, so the CPF and email are not validated
+    again.
+
+    Attributes:
+        external_id: The external identifier of the customer.
+        name: The name of the customer.
+        cpf: The CPF number of the customer.
+        email: The email address of the customer.
+        created_at: When the customer was created.
+    """
+
+    external_id: str
+    name: str
+    cpf: str
+    email: str
+    created_at: datetime
+
+
+__all__ = ["CustomerIdentity"]
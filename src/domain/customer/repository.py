@@ -1,8 +1,10 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Optional
 
 from src.domain.__shared.interfaces import IRepository
-from src.domain.__shared.value_objects import CPF, EmailAddress
+from src.domain.__shared.value_objects import CPF, EmailAddress, ExternalEntityId
 from src.domain.customer import Customer
+from src.domain.customer.read_models import CustomerIdentity
 
 
 class ICustomerRepository(IRepository[Customer], ABC):
@@ -22,6 +24,32 @@ class ICustomerRepository(IRepository[Customer], ABC):
             bool: True if the customer exists, False otherwise.
         """
 
+    @abstractmethod
+    async def find_by_external_ids(
+        self, external_ids: Iterable[str | ExternalEntityId]
+    ) -> Dict[str, Customer]:
+        """Find, in a single query, the customers with the given external identifiers.
+
+        Args:
+            external_ids: The external identifiers of the customers.
+
+        Returns:
+            Dict[str, Customer]: The customers found, keyed by external identifier.
+             Identifiers that do not match any customer are absent from the mapping.
+        """
+
+    @abstractmethod
+    async def find_identity_by_cpf(self, cpf: CPF) -> Optional[CustomerIdentity]:
+        """Find who the customer with a CPF is, without loading the whole customer.
+
+        Args:
+            cpf: The customer's CPF.
+
+        Returns:
+            Optional[CustomerIdentity]: The identity of the customer, or None if not
+             found.
+        """
+
     async def get_by_cpf(self, cpf: CPF) -> Customer | None:
         """Get a customer by their CPF.
 
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List
 
 from src.domain.__shared.error import DomainError
 from src.domain.order.order_status import OrderStatus
@@ -20,4 +21,33 @@ class EmptyOrderError(DomainError):
     message: str = "Empty order"
 
 
-__all__ = ["InvalidStatusTransitionError", "EmptyOrderError"]
+@dataclass(kw_only=True, frozen=True)
+class OrderCreationFailedDueToMissingProductsError(DomainError):
+    """Raised when an order refers to products that do not exist."""
+
+    missing_product_ids: List[str]
+    message: str = "Order refers to products that do not exist"
+
+
+@dataclass(kw_only=True, frozen=True)
+class IdempotencyKeyReusedError(DomainError):
+    """Raised when an idempotency key is reused for a different checkout request."""
+
+    idempotency_key: str
+    message: str = "Idempotency key already used for a different request"
+
+
+@dataclass(kw_only=True, frozen=True)
+class InvalidPageTokenError(DomainError):
+    """Raised when a page token was not issued for a page of orders."""
+
+    message: str = "Invalid page token"
+
+
+__all__ = [
+    "InvalidStatusTransitionError",
+    "EmptyOrderError",
+    "IdempotencyKeyReusedError",
+    "InvalidPageTokenError",
+    "OrderCreationFailedDueToMissingProductsError",
+]
@@ -0,0 +1,31 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import StrEnum, auto
+from uuid import uuid4
+
+
+class OrderEventType(StrEnum):
+    """An Enum that represents the type of an order event."""
+
+    ORDER_CREATED = auto()
+
+
+@dataclass(frozen=True, kw_only=True, slots=True)
+class OrderEvent:
+    """Something that happened to an order, to be handled outside of the request.
+
+    Attributes:
+        type: What happened.
+        order_external_id: The external identifier of the order.
+        event_id: The unique identifier of the event. An event may be delivered more
+         than once, so handlers use it to tell redeliveries apart.
+        occurred_at: When it happened.
+    """
+
+    type: OrderEventType
+    order_external_id: str
+    event_id: str = field(default_factory=lambda: str(uuid4()))
+    occurred_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+__all__ = ["OrderEvent", "OrderEventType"]
@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List
+
+from src.domain.order.events import OrderEvent
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxDelivery:
+    """The pending events of an order, leased for delivery.
+
+    Attributes:
+        order_id: The identifier of the order.
+        events: The pending events of the order, in the order they occurred.
+        lease_token: Identifies the lease, so a delivery whose lease expired and was
+         taken over cannot be acknowledged.
+    """
+
+    order_id: str
+    events: List[OrderEvent]
+    lease_token: str
+
+
+class IOrderOutbox(ABC):
+    """The order events written with the orders themselves, pending delivery.
+
+    Events are written in the same write as their order, so an order is never created
+    without its events, nor the other way around. They are delivered at least once:
+    a delivery not acknowledged before its lease expires is made again.
+    """
+
+    @abstractmethod
+    async def claim(self, limit: int, lease_duration: float) -> List[OutboxDelivery]:
+        """Leases the pending events of some orders for delivery.
+
+        Args:
+            limit: The maximum number of orders whose events are leased.
+            lease_duration: For how long, in seconds, the events are leased.
+
+        Returns:
+            List[OutboxDelivery]: The leased deliveries, the oldest first.
+        """
+        pass
+
+    @abstractmethod
+    async def acknowledge(self, delivery: OutboxDelivery) -> bool:
+        """Marks the events of a delivery as delivered.
+
+        Returns:
+            bool: Whether the delivery was acknowledged, which it is not if its lease
+             expired and was taken over.
+        """
+        pass
+
+
+class IOrderEventHandler(ABC):
+    """Handles the order events delivered from the outbox."""
+
+    @abstractmethod
+    async def handle(self, event: OrderEvent) -> None:
+        """Handles an order event.
+
+        Events are delivered at least once, so handling the same event twice must
+        have the same effect as handling it once.
+
+        Raises:
+            Exception: If the event could not be handled. It is delivered again later.
+        """
+        pass
+
+
+__all__ = ["IOrderEventHandler", "IOrderOutbox", "OutboxDelivery"]
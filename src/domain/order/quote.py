@@ -0,0 +1,57 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from src.domain.__shared.interfaces.product_service import Product
+
+
+@dataclass(frozen=True, slots=True)
+class PriceQuote:
+    """The prices of a set of products, guaranteed until the quote expires.
+
+    Attributes:
+        products: The quoted products, keyed by id.
+        expires_at: When the quote expires.
+    """
+
+    products: Dict[str, Product]
+    expires_at: datetime
+
+    def covers(self, product_ids: Iterable[str]) -> bool:
+        """Tells whether every one of the given products is quoted."""
+        return all(product_id in self.products for product_id in product_ids)
+
+
+class IQuoteSigner(ABC):
+    """Turns price quotes into tamper-proof tokens, and back.
+
+    Tokens are handed to the clients, which send them back at checkout, so the
+    products do not have to be priced again.
+    """
+
+    @abstractmethod
+    def sign(self, quote: PriceQuote) -> str:
+        """Signs a quote.
+
+        Args:
+            quote: The quote to sign.
+
+        Returns:
+            str: The token carrying the quote.
+        """
+
+    @abstractmethod
+    def verify(self, token: str) -> Optional[PriceQuote]:
+        """Reads the quote carried by a token.
+
+        Args:
+            token: The token, as returned by `sign`.
+
+        Returns:
+            Optional[PriceQuote]: The quote, or None if the token is malformed, was
+             not signed by this signer, or has expired.
+        """
+
+
+__all__ = ["IQuoteSigner", "PriceQuote"]
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+from src.domain.order.order_status import OrderStatus
+
+
+@dataclass(frozen=True, slots=True)
+class OrderSummary:
+    """The outline of an order, read without loading the whole order.
+
+    Read models are built straight from the stored fields they need: neither the
+    items nor the rest of the order are read, and nothing is validated again.
+
+    Attributes:
+        external_id: The order number.
+        status: The status of the order.
+        total_value: The total value of the order.
+        created_at: When the order was created.
+    """
+
+    external_id: str
+    status: OrderStatus
+    total_value: float
+    created_at: datetime
+
+
+__all__ = ["OrderSummary"]
@@ -1,8 +1,44 @@
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
 
+from src.domain.__shared.error.repository_error import RepositoryError
 from src.domain.__shared.interfaces import IRepository
+from src.domain.__shared.value_objects import ExternalEntityId
 from src.domain.order import Order
+from src.domain.order.read_models import OrderSummary
+
+MAX_PAGE_SIZE = 1000
+"""The maximum number of orders of a page, or of a batch read while iterating."""
+
+
+@dataclass(frozen=True, slots=True)
+class OrderPage:
+    """A page of orders, sorted by creation.
+
+    Attributes:
+        orders: The orders of the page.
+        next_page_token: The opaque token of the next page, or None if this is the
+         last one.
+    """
+
+    orders: List[Order]
+    next_page_token: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class OrderSummaryPage:
+    """A page of order summaries, sorted by creation.
+
+    Attributes:
+        summaries: The summaries of the orders of the page.
+        next_page_token: The opaque token of the next page, or None if this is the
+         last one.
+    """
+
+    summaries: List[OrderSummary]
+    next_page_token: Optional[str] = None
 
 
 class IOrderRepository(IRepository[Order], ABC):
@@ -10,10 +46,134 @@ class IOrderRepository(IRepository[Order], ABC):
     async def list_all(self) -> List[Order]:
         """Retrieves all orders from the repository.
 
+        Every order is held in memory at once: prefer `list_page` or `iter_all` for
+        collections of unbounded size.
+
         Returns:
             List[Order]: A list of all orders.
         """
         pass
 
+    @abstractmethod
+    async def list_page(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderPage:
+        """Retrieves a page of orders, sorted by creation.
+
+        Pages are read from where the previous one ended, rather than skipping the
+        orders before them, so reading a page costs the same wherever it is.
+
+        Args:
+            page_size: The maximum number of orders of the page, up to
+             `MAX_PAGE_SIZE`.
+            page_token: The token of the page, as returned with the previous one.
+             None for the first page.
+            created_from: If given, only the orders created at or after it are listed.
+            created_until: If given, only the orders created before it are listed.
+
+        Returns:
+            OrderPage: The orders of the page, and the token of the next one.
+
+        Raises:
+            InvalidPageTokenError: If the page token is malformed.
+            ValueError: If the page size is out of bounds.
+        """
+        pass
+
+    @abstractmethod
+    def iter_all(
+        self,
+        batch_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> AsyncIterator[Order]:
+        """Iterates over the orders, sorted by creation.
+
+        Orders are read in batches as the iteration goes, so at most one batch is
+        held in memory, however many orders there are. The next batch is only read
+        once the previous one has been consumed.
+
+        Args:
+            batch_size: The maximum number of orders read at once, up to
+             `MAX_PAGE_SIZE`.
+            page_token: The token of a page, as returned by `list_page`, to start
+             from. None to start from the first order.
+            created_from: If given, only the orders created at or after it are listed.
+            created_until: If given, only the orders created before it are listed.
+
+        Returns:
+            AsyncIterator[Order]: The orders.
+
+        Raises:
+            InvalidPageTokenError: If the page token is malformed.
+            ValueError: If the batch size is out of bounds.
+        """
+        pass
+
+    @abstractmethod
+    async def list_summaries(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderSummaryPage:
+        """Retrieves a page of order summaries, sorted by creation.
+
+        Like `list_page`, but only the fields of the summaries are read. Page tokens
+        of both are interchangeable.
+
+        Args:
+            page_size: The maximum number of summaries of the page, up to
+             `MAX_PAGE_SIZE`.
+            page_token: The token of the page, as returned with the previous one.
+             None for the first page.
+            created_from: If given, only the orders created at or after it are listed.
+            created_until: If given, only the orders created before it are listed.
+
+        Returns:
+            OrderSummaryPage: The summaries of the page, and the token of the next one.
+
+        Raises:
+            InvalidPageTokenError: If the page token is malformed.
+            ValueError: If the page size is out of bounds.
+        """
+        pass
+
+    @abstractmethod
+    async def find_summary_by_external_id(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[OrderSummary]:
+        """Find the summary of an order by its external identifier.
+
+        Args:
+            external_id: The external identifier of the order.
+
+        Returns:
+            Optional[OrderSummary]: The summary of the order, or None if not found.
+        """
+        pass
+
+    @abstractmethod
+    async def insert_many(self, orders: List[Order]) -> List[Order | RepositoryError]:
+        """Creates many orders at once.
+
+        The orders are written independently of each other: an order that cannot be
+        created does not prevent the others from being created.
+
+        Args:
+            orders: The orders to be created.
+
+        Returns:
+            List[Order | RepositoryError]: For each order, in the order given, either
+             the created order or the error that prevented its creation.
+        """
+        pass
+
 
-__all__ = ["IOrderRepository"]
+__all__ = ["IOrderRepository", "MAX_PAGE_SIZE", "OrderPage", "OrderSummaryPage"]
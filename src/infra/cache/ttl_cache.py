@@ -0,0 +1,142 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+@dataclass(slots=True)
+class CacheStats:
+    """Counters describing how a cache has been used.
+
+    Attributes:
+        hits: Lookups answered by the cache.
+        stale_hits: Lookups answered by the cache with an expired value.
+        misses: Lookups of absent or expired entries.
+        evictions: Entries dropped to keep the cache within its maximum size.
+        size: The number of entries currently held.
+    """
+
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+
+
+@dataclass(slots=True)
+class _Entry:
+    value: Any
+    expires_at: float
+
+
+class TTLCache[K: Hashable, V]:
+    """An in-process cache whose entries expire after a time-to-live.
+
+    The cache holds at most `max_entries` entries. When it is full, the least recently
+    used entry is evicted to make room for a new one.
+
+    The cache is not thread-safe. It is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes a new instance of the TTLCache class.
+
+        Args:
+            max_entries: The maximum number of entries held.
+            ttl: The default time-to-live of an entry, in seconds.
+            clock: The monotonic clock used to expire entries.
+        """
+        if max_entries < 1:
+            raise ValueError("The cache must hold at least one entry")
+
+        self._entries: OrderedDict[K, _Entry] = OrderedDict()
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._stats = CacheStats()
+
+    def get(self, key: K) -> Optional[V]:
+        """Gets the value cached for the key.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            Optional[V]: The cached value, or None when absent or expired.
+        """
+        value, _ = self.get_stale(key, grace=0)
+        return value
+
+    def get_stale(self, key: K, grace: float) -> Tuple[Optional[V], bool]:
+        """Gets the value cached for the key, even if expired within the grace period.
+
+        Args:
+            key: The key to look up.
+            grace: For how long after its expiry a value may still be served, in
+             seconds.
+
+        Returns:
+            Tuple[Optional[V], bool]: The cached value, or None when absent or expired
+             for longer than the grace period, and whether the value is expired.
+        """
+        entry = self._entries.get(key)
+        now = self._clock()
+
+        if entry is None or entry.expires_at + grace <= now:
+            self._stats.misses += 1
+            return None, False
+
+        self._entries.move_to_end(key)
+        if entry.expires_at <= now:
+            self._stats.stale_hits += 1
+            return entry.value, True
+
+        self._stats.hits += 1
+        return entry.value, False
+
+    def put(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """Caches the value for the key, evicting the least recently used entry if full.
+
+        Args:
+            key: The key to cache the value for.
+            value: The value to cache.
+            ttl: The time-to-live of this entry, in seconds. Defaults to the cache TTL.
+        """
+        expires_at = self._clock() + (self._ttl if ttl is None else ttl)
+        self._entries[key] = _Entry(value=value, expires_at=expires_at)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def invalidate(self, *keys: K) -> None:
+        """Removes the entries of the given keys, if cached."""
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        self._entries.clear()
+
+    @property
+    def stats(self) -> CacheStats:
+        """A snapshot of the cache counters."""
+        return CacheStats(
+            hits=self._stats.hits,
+            stale_hits=self._stats.stale_hits,
+            misses=self._stats.misses,
+            evictions=self._stats.evictions,
+            size=len(self._entries),
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+__all__ = ["CacheStats", "TTLCache"]
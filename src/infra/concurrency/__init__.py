@@ -0,0 +1,4 @@
+from .batcher import Batcher
+from .single_flight import SingleFlight
+
+__all__ = ["Batcher", "SingleFlight"]
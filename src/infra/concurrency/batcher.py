@@ -0,0 +1,112 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence, Set, Tuple
+
+from src.infra.deadline import detached_context
+
+
+class Batcher[T, R]:
+    """Gathers the items submitted concurrently into batches processed at once.
+
+    A batch is flushed once it holds `max_batch_size` items, or `max_delay` seconds
+    after its first item was submitted, whichever comes first. The flush returns a
+    result per item, and each caller receives the result of its own item, or raises
+    its own error: an item failing does not affect the others of its batch.
+
+    Batches are processed in the background, detached from the deadline of the
+    callers whose items they hold, since they are shared.
+
+    The batcher is not thread-safe. It is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], Awaitable[Sequence[R | BaseException]]],
+        max_batch_size: int,
+        max_delay: float,
+    ) -> None:
+        """Initializes a new instance of the Batcher class.
+
+        Args:
+            flush: Processes a batch, returning, in the same order, the result of each
+             item or the error it failed with. Raising fails every item of the batch.
+            max_batch_size: The maximum number of items of a batch.
+            max_delay: The maximum time, in seconds, an item waits for its batch to
+             fill up. Zero still gathers the items submitted in the same iteration of
+             the event loop.
+        """
+        if max_batch_size < 1:
+            raise ValueError("A batch must hold at least one item")
+
+        self._flush = flush
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._flushes: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: T) -> R:
+        """Adds an item to the next batch and waits for its result.
+
+        Cancelling the caller does not withdraw the item from its batch.
+
+        Returns:
+            R: The result of the item.
+
+        Raises:
+            BaseException: The error the item failed with.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush_pending()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush_pending)
+
+        return await future
+
+    async def drain(self) -> None:
+        """Flushes the pending items and waits for every batch to be processed."""
+        self._flush_pending()
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush_pending(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        self.batches += 1
+        self.items += len(batch)
+
+        task = asyncio.create_task(self._process(batch), context=detached_context())
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _process(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        try:
+            results = await self._flush([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError("The flush must return a result per item")
+        except Exception as error:
+            results = [error] * len(batch)
+        except BaseException:
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+__all__ = ["Batcher"]
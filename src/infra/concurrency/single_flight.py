@@ -0,0 +1,101 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable, List
+
+
+@dataclass(slots=True, eq=False)
+class _Flight:
+    keys: List[Any]
+    task: asyncio.Task
+    waiters: int = field(default=0)
+
+
+class SingleFlight[K: Hashable, V]:
+    """Coalesces concurrent lookups of the same keys into a single call.
+
+    A key requested while another caller is already fetching it joins the call in
+    flight instead of starting a new one, and every caller sharing a call receives
+    the same result or the same error. Keys are only coalesced while in flight: once
+    a call settles, the next lookup starts a new one.
+
+    Calls run in tasks of their own, so a caller being cancelled does not affect the
+    others sharing its call. A call is only cancelled once every caller waiting on it
+    is gone.
+    """
+
+    def __init__(self) -> None:
+        """Initializes a new instance of the SingleFlight class."""
+        self._flights: Dict[K, _Flight] = {}
+
+    async def run(
+        self,
+        keys: Iterable[K],
+        fetch: Callable[[List[K]], Awaitable[Dict[K, V]]],
+    ) -> Dict[K, V]:
+        """Looks up the keys, sharing the calls already in flight for any of them.
+
+        Args:
+            keys: The keys to look up.
+            fetch: Fetches the keys not in flight yet, returning the values found.
+             Keys absent from its result are absent from the result of every caller.
+
+        Returns:
+            Dict[K, V]: The values found for the keys.
+
+        Raises:
+            BaseExceptionGroup: With the errors raised by every failed call.
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        flights = self._join(unique_keys, fetch)
+
+        try:
+            outcomes = await asyncio.gather(
+                *(asyncio.shield(flight.task) for flight in flights),
+                return_exceptions=True,
+            )
+        finally:
+            for flight in flights:
+                self._leave(flight)
+
+        if errors := [o for o in outcomes if isinstance(o, BaseException)]:
+            raise BaseExceptionGroup("Coalesced lookup failed", errors)
+
+        found = {k: v for outcome in outcomes for k, v in outcome.items()}
+        return {key: found[key] for key in unique_keys if key in found}
+
+    @property
+    def in_flight(self) -> int:
+        """The number of keys currently being fetched."""
+        return len(self._flights)
+
+    def _join(
+        self, keys: List[K], fetch: Callable[[List[K]], Awaitable[Dict[K, V]]]
+    ) -> List[_Flight]:
+        flights = list(
+            dict.fromkeys(self._flights[k] for k in keys if k in self._flights)
+        )
+
+        if new_keys := [key for key in keys if key not in self._flights]:
+            flight = _Flight(keys=new_keys, task=asyncio.create_task(fetch(new_keys)))
+            flight.task.add_done_callback(lambda _: self._forget(flight))
+            self._flights.update(dict.fromkeys(new_keys, flight))
+            flights.append(flight)
+
+        for flight in flights:
+            flight.waiters += 1
+        return flights
+
+    def _leave(self, flight: _Flight) -> None:
+        flight.waiters -= 1
+        if flight.waiters == 0 and not flight.task.done():
+            # Nobody is waiting for the result anymore
+            self._forget(flight)
+            flight.task.cancel()
+
+    def _forget(self, flight: _Flight) -> None:
+        for key in flight.keys:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+
+
+__all__ = ["SingleFlight"]
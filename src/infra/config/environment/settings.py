@@ -1,3 +1,5 @@
+from typing import Literal, Optional
+
 from pydantic import SecretStr
 from pydantic_settings import BaseSettings
 
@@ -25,5 +27,264 @@ class Settings(BaseSettings):
     DB_NAME: str
     """The name of the database."""
 
+    DB_REVALIDATE_ON_LOAD: bool = False
+    """Whether entities loaded from the database are validated again, as when they
+    were created. It slows every read down: meant for telling whether data written
+    outside of the application is valid."""
+
+    DB_RAW_READS_ENABLED: bool = False
+    """Whether the repositories map the documents they read straight to their
+    entities, with Motor, instead of building their Beanie documents first."""
+
+    SERVER_TIMING_ENABLED: bool = True
+    """Whether responses report the duration of the request stages in the
+    `Server-Timing` header."""
+
+    CUSTOMER_ID_CACHE_ENABLED: bool = True
+    """Whether the internal identifiers of customers resolved at checkout are cached
+    in process."""
+
+    CUSTOMER_ID_CACHE_TTL: float = 3600.0
+    """The time, in seconds, a resolved customer identifier is cached."""
+
+    CUSTOMER_ID_CACHE_MAX_ENTRIES: int = 10000
+    """The maximum number of cached customer identifiers. The least recently used are
+    evicted."""
+
+    ORDER_CHECKOUT_TIMEOUT: Optional[float] = 3.0
+    """The time budget, in seconds, of a checkout or quote request. Clients may
+    shorten it with the `X-Request-Timeout` header. None disables the deadline."""
+
+    ORDER_BULK_CHECKOUT_TIMEOUT: Optional[float] = 10.0
+    """The time budget, in seconds, of a bulk checkout request. Clients may shorten it
+    with the `X-Request-Timeout` header. None disables the deadline."""
+
+    ORDER_BULK_CHECKOUT_MAX_ORDERS: int = 100
+    """The maximum number of orders of a single bulk checkout."""
+
+    ORDER_EXPORT_BATCH_SIZE: int = 500
+    """The maximum number of orders read at once while exporting orders, up to 1000.
+    At most one batch is held in memory per export."""
+
+    ORDER_QUOTE_TTL: float = 300.0
+    """The time, in seconds, the prices of a quote are guaranteed for its checkout."""
+
+    ORDER_QUOTE_SECRET: Optional[SecretStr] = None
+    """The key quote tokens are signed with. It must be shared by every worker, for
+    quotes made by one to be honored by the others. Defaults to a random key per
+    worker, in which case checkouts reaching another worker are priced again."""
+
+    ORDER_INSERT_GROUP_COMMIT_ENABLED: bool = True
+    """Whether orders inserted concurrently are written together, with a single bulk
+    insert."""
+
+    ORDER_INSERT_GROUP_COMMIT_MAX_BATCH_SIZE: int = 100
+    """The maximum number of orders written by a single bulk insert."""
+
+    ORDER_INSERT_GROUP_COMMIT_MAX_DELAY: float = 0.002
+    """The maximum time, in seconds, an order insert waits for others to join its
+    bulk insert. Longer delays save more round trips, at the cost of latency."""
+
+    ORDER_OUTBOX_DISPATCHER_ENABLED: bool = False
+    """Whether the orders are written with their events, delivered in the background.
+    Off until the order events are actually handled: events delivered are
+    acknowledged and cleared, and no event is written while it is off."""
+
+    ORDER_OUTBOX_WORKERS: int = 4
+    """The number of orders whose events are handled concurrently."""
+
+    ORDER_OUTBOX_BATCH_SIZE: int = 100
+    """The maximum number of orders whose events are leased at once."""
+
+    ORDER_OUTBOX_QUEUE_SIZE: int = 200
+    """The maximum number of leased deliveries waiting for a worker. No more events
+    are leased while it is full."""
+
+    ORDER_OUTBOX_POLL_INTERVAL: float = 1.0
+    """The time, in seconds, between two reads of an empty outbox."""
+
+    ORDER_OUTBOX_LEASE_DURATION: float = 30.0
+    """The time, in seconds, leased events are not delivered again. Events whose
+    delivery is not acknowledged in time are delivered again."""
+
+    ORDER_ASYNC_CHECKOUT_ENABLED: bool = False
+    """Whether checkouts sent with `Prefer: respond-async` are accepted right away, with
+    `202 Accepted`, and performed in the background."""
+
+    ORDER_ASYNC_CHECKOUT_WORKERS: int = 8
+    """The number of checkouts performed concurrently in the background."""
+
+    ORDER_ASYNC_CHECKOUT_QUEUE_SIZE: int = 1000
+    """The maximum number of accepted checkouts waiting for a worker. Further
+    checkouts are refused with `503 Service Unavailable`."""
+
+    ORDER_ASYNC_CHECKOUT_STATUS_TTL: float = 600.0
+    """The time, in seconds, the progress of a background checkout is kept in
+    process. Completed checkouts are still reported afterward, from the database."""
+
+    ORDER_ASYNC_CHECKOUT_STATUS_MAX_ENTRIES: int = 10000
+    """The maximum number of background checkouts whose progress is kept in
+    process."""
+
+    ORDER_ASYNC_CHECKOUT_DRAIN_TIMEOUT: float = 10.0
+    """The time, in seconds, shutdown waits for the accepted checkouts to be
+    performed."""
+
+    IDEMPOTENCY_KEY_TTL: int = 86400
+    """The time, in seconds, a checkout result is kept for retries with the same
+    `Idempotency-Key`."""
+
+    IDEMPOTENCY_CACHE_TTL: float = 300.0
+    """The time, in seconds, a recent idempotency key is kept in process, sparing
+    retries a database lookup."""
+
+    IDEMPOTENCY_CACHE_MAX_ENTRIES: int = 10000
+    """The maximum number of idempotency keys kept in process. The least recently
+    used are evicted."""
+
+    PRODUCT_SERVICE_URL: str = "http://localhost:8001"
+    """The base URL of the product service."""
+
+    PRODUCT_SERVICE_MAX_CONNECTIONS: int = 100
+    """The maximum number of concurrent connections to the product service host."""
+
+    PRODUCT_SERVICE_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    """The maximum number of idle keep-alive connections kept in the pool."""
+
+    PRODUCT_SERVICE_KEEPALIVE_EXPIRY: float = 30.0
+    """The time, in seconds, an idle keep-alive connection is kept open."""
+
+    PRODUCT_SERVICE_CONNECT_TIMEOUT: float = 1.0
+    """The time, in seconds, to wait for a connection to the product service."""
+
+    PRODUCT_SERVICE_READ_TIMEOUT: float = 3.0
+    """The time, in seconds, to wait for a response chunk from the product service."""
+
+    PRODUCT_SERVICE_POOL_TIMEOUT: float = 1.0
+    """The time, in seconds, to wait for a free connection from the pool."""
+
+    PRODUCT_SERVICE_MAX_CONCURRENCY: int = 64
+    """The maximum number of in-flight product service requests per process."""
+
+    PRODUCT_SERVICE_MAX_CONCURRENCY_PER_CALL: int = 8
+    """The maximum number of in-flight product service requests per lookup."""
+
+    PRODUCT_SERVICE_BATCH_ENABLED: bool = True
+    """Whether products are fetched with the bulk `GET /products?ids=` endpoint."""
+
+    PRODUCT_SERVICE_BATCH_MAX_URL_LENGTH: int = 2048
+    """The maximum length of a bulk lookup URL. Larger id sets are split in chunks."""
+
+    PRODUCT_SERVICE_BATCH_RETRY_INTERVAL: float = 300.0
+    """The time, in seconds, before the bulk endpoint is tried again once the product
+    service answered that it does not support it."""
+
+    PRODUCT_SERVICE_STAND_IN_ENABLED: bool = False
+    """Whether the product service is replaced by an in-process stand-in serving a
+    generated catalog, for offline load tests. Never enable it in production."""
+
+    PRODUCT_SERVICE_STAND_IN_CATALOG_SIZE: int = 1000
+    """The number of products of the stand-in catalog, with ids from "1" onward."""
+
+    PRODUCT_SERVICE_STAND_IN_LATENCY_DISTRIBUTION: Literal[
+        "constant", "uniform", "exponential", "lognormal"
+    ] = "lognormal"
+    """The distribution the latency of the stand-in responses is drawn from."""
+
+    PRODUCT_SERVICE_STAND_IN_LATENCY: float = 0.02
+    """The median latency, in seconds, of the stand-in responses."""
+
+    PRODUCT_SERVICE_STAND_IN_LATENCY_SPREAD: float = 0.5
+    """How spread the stand-in latency is, as the maximum deviation for the uniform
+    distribution and the standard deviation of its logarithm for the log-normal one."""
+
+    PRODUCT_SERVICE_STAND_IN_ERROR_RATE: float = 0.0
+    """The rate, from 0 to 1, of stand-in responses failing with a 503."""
+
+    PRODUCT_SERVICE_STAND_IN_TIMEOUT_RATE: float = 0.0
+    """The rate, from 0 to 1, of stand-in requests left hanging until clients time
+    out."""
+
+    PRODUCT_SERVICE_STAND_IN_BATCH_ENABLED: bool = True
+    """Whether the stand-in serves the bulk `GET /products?ids=` endpoint."""
+
+    PRODUCT_SERVICE_STAND_IN_SEED: Optional[int] = None
+    """The seed of the stand-in catalog, latencies and faults, for reproducible runs."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_ENABLED: bool = True
+    """Whether requests are rejected right away while the product service is failing."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    """The number of latest requests whose outcome decides whether the circuit opens."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_MINIMUM_CALLS: int = 10
+    """The number of requests needed in the window before the circuit may open."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    """The rate of failed requests, from 0 to 1, opening the circuit."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_SLOW_CALL_DURATION: float = 2.0
+    """The time, in seconds, above which a request counts as slow."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_SLOW_CALL_RATE: float = 0.8
+    """The rate of slow requests, from 0 to 1, opening the circuit."""
+
+    PRODUCT_SERVICE_CIRCUIT_BREAKER_OPEN_DURATION: float = 10.0
+    """The time, in seconds, the circuit stays open before a probe request is let
+    through."""
+
+    PRODUCT_SERVICE_HEDGING_ENABLED: bool = False
+    """Whether slow requests are sent again, keeping the first response."""
+
+    PRODUCT_SERVICE_HEDGING_PERCENTILE: float = 0.95
+    """The latency percentile, from 0 to 1, after which a request is sent again."""
+
+    PRODUCT_SERVICE_HEDGING_MIN_DELAY: float = 0.01
+    """The minimum time, in seconds, before a request is sent again."""
+
+    PRODUCT_CACHE_ENABLED: bool = True
+    """Whether products are cached in process."""
+
+    PRODUCT_CACHE_TTL: float = 300.0
+    """The time, in seconds, a cached product is served before being fetched again."""
+
+    PRODUCT_CACHE_MAX_ENTRIES: int = 1024
+    """The maximum number of cached products. The least recently used are evicted."""
+
+    PRODUCT_CACHE_STALE_GRACE: float = 60.0
+    """The time, in seconds, an expired product is still served while it is refreshed
+    in the background. Zero disables stale-while-revalidate."""
+
+    PRODUCT_CACHE_NEGATIVE_TTL: float = 30.0
+    """The time, in seconds, a product id reported as not found is remembered. Zero
+    disables negative caching."""
+
+    PRODUCT_CACHE_NEGATIVE_MAX_ENTRIES: int = 1024
+    """The maximum number of product ids remembered as not found."""
+
+    PRODUCT_CATALOG_WARM_UP_ENABLED: bool = False
+    """Whether the whole product catalog is loaded into the product cache before the
+    worker starts handling requests. Requires the product cache."""
+
+    PRODUCT_CATALOG_WARM_UP_TIMEOUT: float = 5.0
+    """The maximum time, in seconds, the worker startup waits for the catalog."""
+
+    PRODUCT_CATALOG_REFRESH_INTERVAL: float = 0.0
+    """The time, in seconds, between two background reloads of the product catalog.
+    Zero disables the periodic refresh. Requires the product cache."""
+
+    PRODUCT_SNAPSHOT_ENABLED: bool = False
+    """Whether every product catalog loaded is persisted to a memory-mapped snapshot
+    file, shared by the workers of the host and across restarts. The product cache
+    then reads the catalog from the snapshot, kept up to date by the catalog refresh,
+    instead of holding a copy of it in every worker."""
+
+    PRODUCT_SNAPSHOT_PATH: str = "var/product_catalog.snapshot"
+    """The path of the product catalog snapshot file."""
+
+    PRODUCT_SNAPSHOT_DEGRADED_MODE_ENABLED: bool = False
+    """Whether products are priced from the snapshot while the product service fails.
+    Requires the product snapshot."""
+
 
 __all__ = ["Settings"]
@@ -0,0 +1,19 @@
+from .deadline import (
+    Deadline,
+    bounded_by_deadline,
+    check_deadline,
+    current_deadline,
+    deadline_scope,
+    detached_context,
+    start_deadline,
+)
+
+__all__ = [
+    "Deadline",
+    "bounded_by_deadline",
+    "check_deadline",
+    "current_deadline",
+    "deadline_scope",
+    "detached_context",
+    "start_deadline",
+]
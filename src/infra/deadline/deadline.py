@@ -0,0 +1,172 @@
+import asyncio
+import time
+from contextvars import Context, ContextVar, Token, copy_context
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Optional, Type
+
+from src.domain.__shared.error import DeadlineExceededError
+
+
+@dataclass(frozen=True, slots=True)
+class Deadline:
+    """The moment, on the monotonic clock, the work of a request must be done by.
+
+    Attributes:
+        expires_at: When the deadline expires, as a `time.monotonic` reading.
+    """
+
+    expires_at: float
+
+    @classmethod
+    def after(cls, timeout: float) -> "Deadline":
+        """Creates the deadline expiring `timeout` seconds from now."""
+        return cls(expires_at=time.monotonic() + timeout)
+
+    def remaining(self) -> float:
+        """The time left, in seconds, which is negative once expired."""
+        return self.expires_at - time.monotonic()
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has expired."""
+        return self.remaining() <= 0
+
+
+_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """The deadline of the work being done, if any."""
+    return _deadline.get()
+
+
+def start_deadline(timeout: float) -> Deadline:
+    """Sets the deadline of the work done from now on, in the current context.
+
+    A deadline already set is only ever brought forward, never postponed. Tasks
+    spawned from the context afterward inherit the deadline.
+
+    Args:
+        timeout: The time budget, in seconds, from now.
+
+    Returns:
+        Deadline: The deadline in effect.
+    """
+    deadline = Deadline.after(timeout)
+    current = _deadline.get()
+    if current is not None and current.expires_at < deadline.expires_at:
+        deadline = current
+    _deadline.set(deadline)
+    return deadline
+
+
+def deadline_scope(timeout: Optional[float]) -> "_DeadlineScope":
+    """Sets the deadline of the work done within the context.
+
+    Args:
+        timeout: The time budget, in seconds, or None to keep the current deadline.
+
+    Returns:
+        _DeadlineScope: The context manager, entering to the deadline in effect.
+    """
+    return _DeadlineScope(timeout)
+
+
+def detached_context() -> Context:
+    """A copy of the current context without deadline, for background tasks.
+
+    Work outliving the request that spawned it, or shared by many requests, must not
+    be cut short by the deadline of one of them.
+    """
+    context = copy_context()
+    context.run(_deadline.set, None)
+    return context
+
+
+def check_deadline(stage: str) -> None:
+    """Raises DeadlineExceededError if the current deadline has expired.
+
+    Args:
+        stage: The stage of the work about to start.
+    """
+    if (deadline := _deadline.get()) is not None and deadline.expired:
+        raise DeadlineExceededError(stage=stage)
+
+
+def bounded_by_deadline(stage: str) -> "_DeadlineBound":
+    """Bounds the work done within the context by the time left before the deadline.
+
+    The work does not start at all if the deadline has already expired, and is
+    cancelled once it does. Without deadline, the work is not bounded.
+
+    Args:
+        stage: The stage of the work, reported by the error.
+
+    Returns:
+        _DeadlineBound: The async context manager, entering to the time left, in
+         seconds, or to None without deadline. It raises DeadlineExceededError if
+         the deadline expires before the work is done.
+    """
+    return _DeadlineBound(stage)
+
+
+# The context managers below are classes rather than generators: contextlib
+# reassigns the traceback of the errors going through its context managers, which
+# frozen dataclass errors, such as DomainError, refuse.
+
+
+class _DeadlineScope:
+    def __init__(self, timeout: Optional[float]) -> None:
+        self._timeout = timeout
+        self._token: Optional[Token] = None
+
+    def __enter__(self) -> Optional[Deadline]:
+        self._token = _deadline.set(_deadline.get())
+        if self._timeout is None:
+            return _deadline.get()
+        return start_deadline(self._timeout)
+
+    def __exit__(self, *_exc_info: object) -> None:
+        _deadline.reset(self._token)
+
+
+class _DeadlineBound:
+    def __init__(self, stage: str) -> None:
+        self._stage = stage
+        self._timeout: Optional[asyncio.Timeout] = None
+
+    async def __aenter__(self) -> Optional[float]:
+        if (deadline := _deadline.get()) is None:
+            return None
+
+        check_deadline(self._stage)
+        remaining = deadline.remaining()
+        self._timeout = asyncio.timeout(remaining)
+        await self._timeout.__aenter__()
+        return remaining
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        if self._timeout is None:
+            return
+
+        try:
+            await self._timeout.__aexit__(exc_type, exc, traceback)
+        except TimeoutError as err:
+            raise DeadlineExceededError(stage=self._stage) from err
+
+
+__all__ = [
+    "Deadline",
+    "bounded_by_deadline",
+    "check_deadline",
+    "current_deadline",
+    "deadline_scope",
+    "detached_context",
+    "start_deadline",
+]
@@ -0,0 +1,64 @@
+from types import TracebackType
+from typing import ContextManager, Optional, Type
+
+import pymongo
+from pymongo.errors import PyMongoError
+
+from src.domain.__shared.error import DeadlineExceededError
+from src.infra.deadline import bounded_by_deadline
+
+
+def database_deadline(operation: str) -> "_DatabaseDeadline":
+    """Bounds the database operations of the context by the current deadline.
+
+    The time left is also handed to the driver, as a client-side operation timeout,
+    so MongoDB abandons the operations instead of completing them for nobody.
+
+    Args:
+        operation: The name of the operation, reported by the error.
+
+    Returns:
+        _DatabaseDeadline: The async context manager. It raises
+         DeadlineExceededError if the deadline expires before the operations are
+         done.
+    """
+    return _DatabaseDeadline(operation)
+
+
+class _DatabaseDeadline:
+    # Not a generator-based context manager, which would fail to let the frozen
+    # DomainError raised by the repositories through.
+
+    def __init__(self, operation: str) -> None:
+        self._operation = operation
+        self._bound = bounded_by_deadline(operation)
+        self._client_timeout: Optional[ContextManager] = None
+
+    async def __aenter__(self) -> None:
+        if (remaining := await self._bound.__aenter__()) is not None:
+            self._client_timeout = pymongo.timeout(remaining)
+            self._client_timeout.__enter__()
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        # The client timeout was entered last, so it is left first, even if the
+        # bound raises: otherwise the expired timeout outlives the context.
+        try:
+            if self._client_timeout is not None:
+                self._client_timeout.__exit__(exc_type, exc, traceback)
+        finally:
+            await self._bound.__aexit__(exc_type, exc, traceback)
+
+        if (
+            self._client_timeout is not None
+            and isinstance(exc, PyMongoError)
+            and exc.timeout
+        ):
+            raise DeadlineExceededError(stage=self._operation) from exc
+
+
+__all__ = ["database_deadline"]
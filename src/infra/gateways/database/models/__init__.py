@@ -1,4 +1,11 @@
 from .customer_persistence_model import CustomerPersistenceModel
+from .idempotency_key_persistence_model import IdempotencyKeyPersistenceModel
+from .order_persistence_model import OrderPersistenceModel, OrderItemPersistenceModel
 
 
-__all__ = ["CustomerPersistenceModel"]
+__all__ = [
+    "CustomerPersistenceModel",
+    "IdempotencyKeyPersistenceModel",
+    "OrderItemPersistenceModel",
+    "OrderPersistenceModel",
+]
@@ -1,10 +1,12 @@
 from abc import abstractmethod, ABC
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, ContextManager
 
 from beanie import Document, Indexed
 
 from src.domain.__shared.entity import AggregateRoot
+from src.domain.__shared.validator import trusted_hydration
+from src.infra.config import settings
 
 
 class PersistenceModel[E: AggregateRoot](Document, ABC):
@@ -18,7 +20,20 @@ class PersistenceModel[E: AggregateRoot](Document, ABC):
 
     @abstractmethod
     def to_entity(self) -> E:
+        """Rebuilds the entity stored in the document.
+
+        Implementations build it within `hydration`.
+        """
         pass
 
 
-__all__ = ["PersistenceModel"]
+def hydration() -> ContextManager[None]:
+    """The context entities are rebuilt from their documents within.
+
+    Stored entities were validated when they were written, so they are trusted,
+    unless `DB_REVALIDATE_ON_LOAD` is set.
+    """
+    return trusted_hydration(enabled=not settings.DB_REVALIDATE_ON_LOAD)
+
+
+__all__ = ["PersistenceModel", "hydration"]
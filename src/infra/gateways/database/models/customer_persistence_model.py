@@ -1,6 +1,6 @@
-from typing import Annotated
+from typing import Annotated, Any, Mapping
 
-from src.infra.gateways.database.models.base import PersistenceModel
+from src.infra.gateways.database.models.base import PersistenceModel, hydration
 from src.domain.__shared.value_objects import (
     ExternalEntityId,
     UniqueEntityId,
@@ -30,14 +30,28 @@ class CustomerPersistenceModel(PersistenceModel[Customer]):
         )
 
     def to_entity(self) -> Customer:
-        return Customer(
-            _id=UniqueEntityId(str(self.id)),
-            external_id=ExternalEntityId(str(self.external_id)),
-            created_at=self.created_at,
-            email=EmailAddress(address=self.email),
-            name=self.name,
-            cpf=CPF(number=self.cpf),
-        )
+        with hydration():
+            return Customer(
+                _id=UniqueEntityId(str(self.id)),
+                external_id=ExternalEntityId(str(self.external_id)),
+                created_at=self.created_at,
+                email=EmailAddress(address=self.email),
+                name=self.name,
+                cpf=CPF(number=self.cpf),
+            )
+
+    @staticmethod
+    def raw_to_entity(document: Mapping[str, Any]) -> Customer:
+        """Rebuilds the customer stored in a raw document, as `to_entity` does."""
+        with hydration():
+            return Customer(
+                _id=UniqueEntityId(str(document["_id"])),
+                external_id=ExternalEntityId(document["external_id"]),
+                created_at=document["created_at"],
+                email=EmailAddress(address=document["email"]),
+                name=document["name"],
+                cpf=CPF(number=document["cpf"]),
+            )
 
     class Settings:  # noqa: D106
         name = "customers"
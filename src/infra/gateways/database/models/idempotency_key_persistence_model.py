@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from typing import Annotated
+
+from beanie import Document, Indexed
+from pydantic import Field
+from pymongo import ASCENDING, IndexModel
+
+from src.domain.__shared.interfaces import IdempotencyRecord
+from src.infra.config import settings
+
+
+class IdempotencyKeyPersistenceModel(Document):
+    key: Annotated[str, Indexed(unique=True)]
+    fingerprint: str
+    order_external_id: str
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @staticmethod
+    def from_record(record: IdempotencyRecord) -> "IdempotencyKeyPersistenceModel":
+        return IdempotencyKeyPersistenceModel(
+            key=record.key,
+            fingerprint=record.fingerprint,
+            order_external_id=record.order_external_id,
+        )
+
+    def to_record(self) -> IdempotencyRecord:
+        return IdempotencyRecord(
+            key=self.key,
+            fingerprint=self.fingerprint,
+            order_external_id=self.order_external_id,
+        )
+
+    class Settings:  # noqa: D106
+        name = "idempotency_keys"
+        indexes = [
+            IndexModel(
+                [("created_at", ASCENDING)],
+                expireAfterSeconds=settings.IDEMPOTENCY_KEY_TTL,
+            )
+        ]
+
+
+__all__ = ["IdempotencyKeyPersistenceModel"]
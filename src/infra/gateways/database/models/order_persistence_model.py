@@ -1,14 +1,18 @@
-from typing import Annotated, List
+from datetime import datetime
+from typing import Annotated, Any, List, Mapping, Optional
 
 from beanie import Indexed, PydanticObjectId
+from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel
 
 from src.domain.__shared.value_objects import (
     ExternalEntityId,
     UniqueEntityId,
 )
 from src.domain.order import Order, OrderStatus
+from src.domain.order.events import OrderEvent, OrderEventType
 from src.domain.order.order_item import OrderItem
-from src.infra.gateways.database.models.base import PersistenceModel
+from src.infra.gateways.database.models.base import PersistenceModel, hydration
 
 
 class OrderItemPersistenceModel(PersistenceModel[OrderItem]):
@@ -29,12 +33,49 @@ class OrderItemPersistenceModel(PersistenceModel[OrderItem]):
         )
 
     def to_entity(self) -> OrderItem:
-        return OrderItem(
-            product_id=self.product_id,
-            quantity=self.quantity,
-            value=self.value,
-            created_at=self.created_at,
-            external_id=ExternalEntityId(str(self.external_id)),
+        with hydration():
+            return OrderItem(
+                product_id=self.product_id,
+                quantity=self.quantity,
+                value=self.value,
+                created_at=self.created_at,
+                external_id=ExternalEntityId(str(self.external_id)),
+            )
+
+    @staticmethod
+    def raw_to_entity(document: Mapping[str, Any]) -> OrderItem:
+        """Rebuilds the item stored in a raw document, as `to_entity` does."""
+        with hydration():
+            return OrderItem(
+                product_id=document["product_id"],
+                quantity=document["quantity"],
+                value=float(document["value"]),
+                created_at=document["created_at"],
+                external_id=ExternalEntityId(document["external_id"]),
+            )
+
+
+class OrderEventPersistenceModel(BaseModel):
+    event_id: str
+    type: OrderEventType
+    order_external_id: str
+    occurred_at: datetime
+
+    @staticmethod
+    def from_event(event: OrderEvent) -> "OrderEventPersistenceModel":
+        return OrderEventPersistenceModel(
+            event_id=event.event_id,
+            type=event.type,
+            order_external_id=event.order_external_id,
+            occurred_at=event.occurred_at,
+        )
+
+    def to_event(self) -> OrderEvent:
+        return OrderEvent(
+            event_id=self.event_id,
+            type=self.type,
+            order_external_id=self.order_external_id,
+            occurred_at=self.occurred_at,
         )
 
 
@@ -43,6 +84,9 @@ class OrderPersistenceModel(PersistenceModel[Order]):
     total_value: float
     status: OrderStatus
     items: List[OrderItemPersistenceModel]
+    outbox: List[OrderEventPersistenceModel] = Field(default_factory=list)
+    outbox_lease_until: Optional[datetime] = None
+    outbox_lease_token: Optional[str] = None
 
     @staticmethod
     def from_entity(entity: Order) -> "OrderPersistenceModel":
@@ -59,18 +103,44 @@ class OrderPersistenceModel(PersistenceModel[Order]):
         )
 
     def to_entity(self) -> Order:
-        return Order(
-            _id=UniqueEntityId(str(self.id)) if self.id else None,
-            external_id=ExternalEntityId(str(self.external_id)),
-            created_at=self.created_at,
-            customer_id=UniqueEntityId(str(self.customer_id)),
-            total_value=self.total_value,
-            status=self.status,
-            items=[item.to_entity() for item in self.items],
-        )
+        with hydration():
+            return Order(
+                _id=UniqueEntityId(str(self.id)) if self.id else None,
+                external_id=ExternalEntityId(str(self.external_id)),
+                created_at=self.created_at,
+                customer_id=UniqueEntityId(str(self.customer_id)),
+                total_value=self.total_value,
+                status=self.status,
+                items=[item.to_entity() for item in self.items],
+            )
+
+    @staticmethod
+    def raw_to_entity(document: Mapping[str, Any]) -> Order:
+        """Rebuilds the order stored in a raw document, as `to_entity` does."""
+        with hydration():
+            return Order(
+                _id=UniqueEntityId(str(document["_id"])),
+                external_id=ExternalEntityId(document["external_id"]),
+                created_at=document["created_at"],
+                customer_id=UniqueEntityId(str(document["customer_id"])),
+                total_value=float(document["total_value"]),
+                status=OrderStatus(document["status"]),
+                items=[
+                    OrderItemPersistenceModel.raw_to_entity(item)
+                    for item in document["items"]
+                ],
+            )
 
     class Settings:  # noqa: D106
-        name = "customers"
+        name = "orders"
+        indexes = [
+            IndexModel([("outbox_lease_until", ASCENDING)], sparse=True),
+            IndexModel([("created_at", ASCENDING), ("_id", ASCENDING)]),
+        ]
 
 
-__all__ = ["OrderPersistenceModel", "OrderItemPersistenceModel"]
+__all__ = [
+    "OrderEventPersistenceModel",
+    "OrderItemPersistenceModel",
+    "OrderPersistenceModel",
+]
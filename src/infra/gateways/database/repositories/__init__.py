@@ -1,3 +1,11 @@
-from .customer_repository_impl import MongoCustomerRepository
+from .customer_id_resolver_impl import MongoCustomerIdResolver
+from .customer_repository_impl import (
+    MongoCustomerRepository,
+    RawMongoCustomerRepository,
+)
 
-__all__ = ["MongoCustomerRepository"]
+__all__ = [
+    "MongoCustomerIdResolver",
+    "MongoCustomerRepository",
+    "RawMongoCustomerRepository",
+]
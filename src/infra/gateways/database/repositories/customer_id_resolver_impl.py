@@ -0,0 +1,91 @@
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.__shared.value_objects import ExternalEntityId, UniqueEntityId
+from src.domain.customer import ICustomerIdResolver
+from src.infra.cache import TTLCache
+from src.infra.gateways.database.models import CustomerPersistenceModel
+from src.infra.gateways.database.deadline import database_deadline
+from src.infra.metrics import Metric
+
+
+class MongoCustomerIdResolver(ICustomerIdResolver):
+    """Resolves customer identifiers with queries projecting the `_id` only.
+
+    The documents are neither fully read nor turned into entities, so resolving an
+    identifier does not validate the CPF and email of the customer.
+
+    Resolved identifiers can also be kept in process. Only customers found are kept,
+    so a customer created by another worker is never reported missing from the cache.
+    """
+
+    def __init__(self, cache: Optional[TTLCache[str, UniqueEntityId]] = None) -> None:
+        """Initializes a new instance of the MongoCustomerIdResolver class.
+
+        Args:
+            cache: The in-process cache of resolved identifiers, if any.
+        """
+        self._cache = cache
+
+    async def resolve(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[UniqueEntityId]:
+        return (await self.resolve_many([external_id])).get(str(external_id))
+
+    async def resolve_many(
+        self, external_ids: Iterable[str | ExternalEntityId]
+    ) -> Dict[str, UniqueEntityId]:
+        resolved: Dict[str, UniqueEntityId] = {}
+        missing: List[str] = []
+        for external_id in dict.fromkeys(str(e) for e in external_ids):
+            cached = self._cache.get(external_id) if self._cache is not None else None
+            if cached:
+                resolved[external_id] = cached
+            else:
+                missing.append(external_id)
+
+        if missing:
+            found = await self._find(missing)
+            resolved.update(found)
+            if self._cache is not None:
+                for external_id, customer_id in found.items():
+                    self._cache.put(external_id, customer_id)
+
+        return resolved
+
+    def invalidate(self, *external_ids: str | ExternalEntityId) -> None:
+        if self._cache is not None:
+            self._cache.invalidate(*(str(external_id) for external_id in external_ids))
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the in-process cache counters as metric samples."""
+        stats = self._cache.stats if self._cache else None
+        return [
+            Metric(
+                "customer_id_cache_hits_total",
+                stats.hits if stats else 0,
+                "Customer identifiers resolved in process.",
+            ),
+            Metric(
+                "customer_id_cache_misses_total",
+                stats.misses if stats else 0,
+                "Customer identifiers resolved from the database.",
+            ),
+        ]
+
+    @staticmethod
+    async def _find(external_ids: List[str]) -> Dict[str, UniqueEntityId]:
+        async with database_deadline("customer"):
+            documents = (
+                await CustomerPersistenceModel.get_motor_collection()
+                .find(
+                    {"external_id": {"$in": external_ids}}, {"_id": 1, "external_id": 1}
+                )
+                .to_list(len(external_ids))
+            )
+        return {
+            document["external_id"]: UniqueEntityId(str(document["_id"]))
+            for document in documents
+        }
+
+
+__all__ = ["MongoCustomerIdResolver"]
@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from bson import ObjectId
 
 from src.domain.__shared.error.repository_error import DuplicateKeyError
 from src.domain.__shared.value_objects import (
@@ -7,39 +9,70 @@ from src.domain.__shared.value_objects import (
     CPF,
     EmailAddress,
 )
-from src.domain.customer import Customer
+from src.domain.customer import Customer, CustomerIdentity, ICustomerIdResolver
 from src.domain.customer.repository import ICustomerRepository
+from src.infra.gateways.database.deadline import database_deadline
 from src.infra.gateways.database.models import CustomerPersistenceModel
 from pymongo.errors import DuplicateKeyError as MongoDuplicateKeyError
 
 
 class MongoCustomerRepository(ICustomerRepository):
-    """Repository for handling customer-related database operations."""
+    """Repository for handling customer-related database operations.
+
+    Inserted customers are returned as given, with the identifier generated for
+    them: they are not mapped back from their documents, which would validate their
+    CPF and email again.
+
+    Read models are read with queries projecting only their fields, and built
+    straight from the raw documents, skipping both the Beanie documents and the
+    entities.
+    """
+
+    def __init__(self, id_resolver: Optional[ICustomerIdResolver] = None) -> None:
+        """Initializes a new instance of the MongoCustomerRepository class.
+
+        Args:
+            id_resolver: The resolver of customer identifiers to notify of the
+             customers written, if any.
+        """
+        self._id_resolver = id_resolver
 
     async def find(
         self, cpf: CPF | None, email: EmailAddress | None
     ) -> Customer | None:
-        if not cpf and not email:
-            raise ValueError(
-                "At least one search criteria (CPF or email) must be provided"
+        found = await CustomerPersistenceModel.find_one(self._search_query(cpf, email))
+        return found.to_entity() if found else None
+
+    async def find_identity_by_cpf(self, cpf: CPF) -> Optional[CustomerIdentity]:
+        async with database_deadline("customer"):
+            found = await CustomerPersistenceModel.get_motor_collection().find_one(
+                {"cpf": cpf.number}, _IDENTITY_PROJECTION
             )
+        return self._to_identity(found) if found else None
 
-        query = {}
-        if cpf:
-            query["cpf"] = cpf.number
-        if email:
-            query["email"] = email.address
+    async def find_by_external_ids(
+        self, external_ids: Iterable[str | ExternalEntityId]
+    ) -> Dict[str, Customer]:
+        ids = list(dict.fromkeys(str(external_id) for external_id in external_ids))
+        if not ids:
+            return {}
 
-        found = await CustomerPersistenceModel.find_one(query)
-        return found.to_entity() if found else None
+        found = await CustomerPersistenceModel.find(
+            {"external_id": {"$in": ids}}
+        ).to_list()
+        return {customer.external_id: customer.to_entity() for customer in found}
 
     async def insert(self, customer: Customer) -> Customer:
         try:
             persisted = await CustomerPersistenceModel.from_entity(customer).insert()
-            return persisted.to_entity()
         except MongoDuplicateKeyError as e:
             raise DuplicateKeyError(message=str(e)) from e
 
+        if self._id_resolver is not None:
+            self._id_resolver.invalidate(persisted.external_id)
+        customer.assign_id(UniqueEntityId(str(persisted.id)))
+        return customer
+
     async def find_by_id(self, identifier: str | UniqueEntityId) -> Optional[Customer]:
         found = await CustomerPersistenceModel.get(str(identifier))
         return found.to_entity() if found else None
@@ -52,5 +85,82 @@ class MongoCustomerRepository(ICustomerRepository):
         )
         return found.to_entity() if found else None
 
+    @staticmethod
+    def _search_query(cpf: CPF | None, email: EmailAddress | None) -> Dict[str, str]:
+        if not cpf and not email:
+            raise ValueError(
+                "At least one search criteria (CPF or email) must be provided"
+            )
+
+        query = {}
+        if cpf:
+            query["cpf"] = cpf.number
+        if email:
+            query["email"] = email.address
+        return query
+
+    @staticmethod
+    def _to_identity(document: Mapping[str, Any]) -> CustomerIdentity:
+        return CustomerIdentity(
+            external_id=document["external_id"],
+            name=document["name"],
+            cpf=document["cpf"],
+            email=document["email"],
+            created_at=document["created_at"],
+        )
+
+
+class RawMongoCustomerRepository(MongoCustomerRepository):
+    """Customer repository reading the customers straight from their raw documents.
+
+    Customers are read with Motor and mapped to their entities by
+    `CustomerPersistenceModel.raw_to_entity`, without building their Beanie
+    documents first. Everything else is done as by MongoCustomerRepository.
+    """
+
+    async def find(
+        self, cpf: CPF | None, email: EmailAddress | None
+    ) -> Customer | None:
+        return await self._find_one(self._search_query(cpf, email))
+
+    async def find_by_external_ids(
+        self, external_ids: Iterable[str | ExternalEntityId]
+    ) -> Dict[str, Customer]:
+        ids = list(dict.fromkeys(str(external_id) for external_id in external_ids))
+        if not ids:
+            return {}
+
+        found = await (
+            CustomerPersistenceModel.get_motor_collection()
+            .find({"external_id": {"$in": ids}})
+            .to_list(len(ids))
+        )
+        return {
+            document["external_id"]: CustomerPersistenceModel.raw_to_entity(document)
+            for document in found
+        }
+
+    async def find_by_id(self, identifier: str | UniqueEntityId) -> Optional[Customer]:
+        return await self._find_one({"_id": ObjectId(str(identifier))})
+
+    async def find_by_external_id(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[Customer]:
+        return await self._find_one({"external_id": str(external_id)})
+
+    @staticmethod
+    async def _find_one(query: Dict[str, Any]) -> Optional[Customer]:
+        found = await CustomerPersistenceModel.get_motor_collection().find_one(query)
+        return CustomerPersistenceModel.raw_to_entity(found) if found else None
+
+
+_IDENTITY_PROJECTION = {
+    "_id": 0,
+    "external_id": 1,
+    "name": 1,
+    "cpf": 1,
+    "email": 1,
+    "created_at": 1,
+}
 
-__all__ = ["MongoCustomerRepository"]
+__all__ = ["MongoCustomerRepository", "RawMongoCustomerRepository"]
@@ -0,0 +1,121 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+
+from src.domain.__shared.error.repository_error import RepositoryError
+from src.domain.__shared.value_objects import ExternalEntityId, UniqueEntityId
+from src.domain.order import Order
+from src.domain.order.read_models import OrderSummary
+from src.domain.order.repository import IOrderRepository, OrderPage, OrderSummaryPage
+from src.infra.concurrency import Batcher
+from src.infra.deadline import bounded_by_deadline
+from src.infra.metrics import Metric
+
+
+class GroupCommitOrderRepository(IOrderRepository):
+    """Group-commits the orders inserted concurrently into another repository.
+
+    Single inserts are gathered into batches, each written with one bulk insert, so
+    concurrent checkouts share a database round trip. Each insert still returns its
+    own order, or raises its own error, such as a duplicated key.
+
+    Batches are flushed once full, or after a short delay: the larger the batch and
+    the longer the delay, the fewer the round trips, but the longer an insert may
+    wait for its batch.
+    """
+
+    def __init__(
+        self,
+        order_repository: IOrderRepository,
+        max_batch_size: int = 100,
+        max_delay: float = 0.002,
+    ) -> None:
+        """Initializes a new instance of the GroupCommitOrderRepository class.
+
+        Args:
+            order_repository: The repository the orders are written to.
+            max_batch_size: The maximum number of orders written at once.
+            max_delay: The maximum time, in seconds, an insert waits for its batch to
+             fill up.
+        """
+        self._order_repository = order_repository
+        self._batcher: Batcher[Order, Order] = Batcher(
+            flush=order_repository.insert_many,
+            max_batch_size=max_batch_size,
+            max_delay=max_delay,
+        )
+
+    async def insert(self, order: Order) -> Order:
+        # Batches are shared, so they are written regardless of the deadline of
+        # any of their inserts: only the wait for the result is bounded.
+        async with bounded_by_deadline("insert"):
+            return await self._batcher.submit(order)
+
+    async def insert_many(self, orders: List[Order]) -> List[Order | RepositoryError]:
+        return await self._order_repository.insert_many(orders)
+
+    async def list_all(self) -> List[Order]:
+        return await self._order_repository.list_all()
+
+    async def list_page(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderPage:
+        return await self._order_repository.list_page(
+            page_size, page_token, created_from, created_until
+        )
+
+    def iter_all(
+        self,
+        batch_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> AsyncIterator[Order]:
+        return self._order_repository.iter_all(
+            batch_size, page_token, created_from, created_until
+        )
+
+    async def list_summaries(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderSummaryPage:
+        return await self._order_repository.list_summaries(
+            page_size, page_token, created_from, created_until
+        )
+
+    async def find_summary_by_external_id(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[OrderSummary]:
+        return await self._order_repository.find_summary_by_external_id(external_id)
+
+    async def find_by_id(self, identifier: str | UniqueEntityId) -> Optional[Order]:
+        return await self._order_repository.find_by_id(identifier)
+
+    async def find_by_external_id(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[Order]:
+        return await self._order_repository.find_by_external_id(external_id)
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the batching counters as metric samples."""
+        return [
+            Metric(
+                "order_insert_batches_total",
+                self._batcher.batches,
+                "Bulk inserts grouping concurrent order inserts.",
+            ),
+            Metric(
+                "order_insert_batched_total",
+                self._batcher.items,
+                "Order inserts written through a bulk insert.",
+            ),
+        ]
+
+
+__all__ = ["GroupCommitOrderRepository"]
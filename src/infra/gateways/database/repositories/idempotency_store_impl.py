@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from pymongo.errors import DuplicateKeyError as MongoDuplicateKeyError
+
+from src.domain.__shared.interfaces import IdempotencyRecord, IIdempotencyStore
+from src.infra.cache import TTLCache
+from src.infra.gateways.database.models import IdempotencyKeyPersistenceModel
+from src.infra.gateways.database.deadline import database_deadline
+from src.infra.metrics import Metric
+
+
+class MongoIdempotencyStore(IIdempotencyStore):
+    """Stores idempotency records in a collection with a unique index on the key.
+
+    Records expire after `ttl` seconds, through a TTL index. Since MongoDB only purges
+    expired documents periodically, expired records still present are ignored, and
+    replaced when their key is used again.
+
+    Recent records can also be kept in process, so retries reaching the same worker
+    are answered without a database lookup. Records never change once stored, so the
+    cache cannot serve an outdated one.
+    """
+
+    def __init__(
+        self, ttl: float, cache: Optional[TTLCache[str, IdempotencyRecord]] = None
+    ) -> None:
+        """Initializes a new instance of the MongoIdempotencyStore class.
+
+        Args:
+            ttl: The time, in seconds, a record is kept.
+            cache: The in-process cache of recent records, if any.
+        """
+        self._ttl = timedelta(seconds=ttl)
+        self._cache = cache
+
+    async def get(self, key: str) -> Optional[IdempotencyRecord]:
+        if self._cache is not None and (record := self._cache.get(key)):
+            return record
+
+        async with database_deadline("idempotency"):
+            found = await IdempotencyKeyPersistenceModel.find_one(
+                {"key": key, "created_at": {"$gt": self._expiry()}}
+            )
+        if not found:
+            return None
+
+        return self._remember(found.to_record())
+
+    async def save(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        try:
+            async with database_deadline("idempotency"):
+                await IdempotencyKeyPersistenceModel.from_record(record).insert()
+        except MongoDuplicateKeyError:
+            if not (found := await self.get(record.key)):
+                # The record holding the key expired: it is replaced, unless
+                # another request replaces it first.
+                async with database_deadline("idempotency"):
+                    await IdempotencyKeyPersistenceModel.find(
+                        {"key": record.key, "created_at": {"$lte": self._expiry()}}
+                    ).delete()
+                return await self.save(record)
+            return found
+
+        return self._remember(record)
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the in-process cache counters as metric samples."""
+        stats = self._cache.stats if self._cache else None
+        return [
+            Metric(
+                "idempotency_cache_hits_total",
+                stats.hits if stats else 0,
+                "Idempotency keys found in process.",
+            ),
+            Metric(
+                "idempotency_cache_misses_total",
+                stats.misses if stats else 0,
+                "Idempotency keys looked up in the database.",
+            ),
+        ]
+
+    def _expiry(self) -> datetime:
+        """The creation date records created at or before have expired."""
+        return datetime.now(timezone.utc) - self._ttl
+
+    def _remember(self, record: IdempotencyRecord) -> IdempotencyRecord:
+        if self._cache is not None:
+            self._cache.put(record.key, record)
+        return record
+
+
+__all__ = ["MongoIdempotencyStore"]
@@ -0,0 +1,78 @@
+from datetime import datetime, timedelta, timezone
+from typing import List
+from uuid import uuid4
+
+from beanie import PydanticObjectId
+
+from src.domain.order.outbox import IOrderOutbox, OutboxDelivery
+from src.infra.gateways.database.models.order_persistence_model import (
+    OrderEventPersistenceModel,
+    OrderPersistenceModel,
+)
+
+
+class MongoOrderOutbox(IOrderOutbox):
+    """Reads the pending order events from the `outbox` of the order documents.
+
+    Documents with pending events are the ones with an `outbox_lease_until`, and are
+    claimable once it is past. Claiming moves it forward and tags the documents with
+    a lease token, so only the current holder of the lease can acknowledge them.
+    """
+
+    async def claim(self, limit: int, lease_duration: float) -> List[OutboxDelivery]:
+        collection = OrderPersistenceModel.get_motor_collection()
+        now = datetime.now(timezone.utc)
+        claimable = {"outbox_lease_until": {"$lte": now}}
+
+        candidates = (
+            await collection.find(claimable, {"_id": 1})
+            .sort("outbox_lease_until")
+            .limit(limit)
+            .to_list(limit)
+        )
+        if not candidates:
+            return []
+
+        lease_token = str(uuid4())
+        await collection.update_many(
+            {"_id": {"$in": [c["_id"] for c in candidates]}, **claimable},
+            {
+                "$set": {
+                    "outbox_lease_until": now + timedelta(seconds=lease_duration),
+                    "outbox_lease_token": lease_token,
+                }
+            },
+        )
+
+        claimed = (
+            await collection.find({"outbox_lease_token": lease_token}, {"outbox": 1})
+            .sort("_id")
+            .to_list(limit)
+        )
+        return [
+            OutboxDelivery(
+                order_id=str(document["_id"]),
+                events=[
+                    OrderEventPersistenceModel.model_validate(event).to_event()
+                    for event in document["outbox"]
+                ],
+                lease_token=lease_token,
+            )
+            for document in claimed
+        ]
+
+    async def acknowledge(self, delivery: OutboxDelivery) -> bool:
+        result = await OrderPersistenceModel.get_motor_collection().update_one(
+            {
+                "_id": PydanticObjectId(delivery.order_id),
+                "outbox_lease_token": delivery.lease_token,
+            },
+            {
+                "$set": {"outbox": []},
+                "$unset": {"outbox_lease_until": "", "outbox_lease_token": ""},
+            },
+        )
+        return result.modified_count == 1
+
+
+__all__ = ["MongoOrderOutbox"]
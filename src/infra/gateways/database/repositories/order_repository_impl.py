@@ -1,42 +1,344 @@
-from typing import Optional, List
+import base64
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, Mapping, Optional, List
 
-from src.domain.__shared.error.repository_error import DuplicateKeyError
+from beanie import PydanticObjectId
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ASCENDING
+
+from src.domain.__shared.error.repository_error import (
+    DuplicateKeyError,
+    RepositoryError,
+)
 from src.domain.__shared.value_objects import (
     ExternalEntityId,
     UniqueEntityId,
 )
-from src.domain.order import Order
-from src.domain.order.repository import IOrderRepository
-from pymongo.errors import DuplicateKeyError as MongoDuplicateKeyError
+from src.domain.order import Order, OrderStatus
+from src.domain.order.error import InvalidPageTokenError
+from src.domain.order.events import OrderEvent, OrderEventType
+from src.domain.order.read_models import OrderSummary
+from src.domain.order.repository import (
+    IOrderRepository,
+    MAX_PAGE_SIZE,
+    OrderPage,
+    OrderSummaryPage,
+)
+from pymongo.errors import BulkWriteError, DuplicateKeyError as MongoDuplicateKeyError
 
 from src.infra.gateways.database.models.order_persistence_model import (
+    OrderEventPersistenceModel,
     OrderPersistenceModel,
 )
+from src.infra.gateways.database.deadline import database_deadline
 
 
 class MongoOrderRepository(IOrderRepository):
-    """Repository for handling customer-related database operations."""
+    """Repository for handling customer-related database operations.
+
+    Inserted orders are returned as given, with the identifier generated for them:
+    they are not mapped back from their documents, which would validate them again.
+
+    Orders are paged by their creation date and identifier: page tokens carry those
+    of the last order of their page, and the next page starts right after it, along
+    the index on both.
+
+    Read models are read with queries projecting only their fields, and built
+    straight from the raw documents, skipping both the Beanie documents and the
+    entities.
+    """
+
+    def __init__(self, outbox_enabled: bool = True) -> None:
+        """Initializes a new instance of the MongoOrderRepository class.
+
+        Args:
+            outbox_enabled: Whether new orders are written with their creation event
+             in the outbox. Leave it off while no dispatcher delivers the events, so
+             they do not pile up in the order documents.
+        """
+        self._outbox_enabled = outbox_enabled
 
     async def list_all(self) -> List[Order]:
-        found = await OrderPersistenceModel.all().to_list()
+        async with database_deadline("list"):
+            found = await OrderPersistenceModel.all().to_list()
         return [order.to_entity() for order in found]
 
+    async def list_page(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderPage:
+        query = self._page_query(page_token, created_from, created_until)
+        # One more order is read, to tell whether there is a next page.
+        orders = await self._read_page(query, page_size, lookahead=1)
+        if len(orders) <= page_size:
+            return OrderPage(orders=orders)
+
+        orders = orders[:page_size]
+        return OrderPage(
+            orders=orders,
+            next_page_token=self._encode_page_token(
+                orders[-1].created_at, orders[-1].id
+            ),
+        )
+
+    async def iter_all(
+        self,
+        batch_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> AsyncIterator[Order]:
+        while True:
+            query = self._page_query(page_token, created_from, created_until)
+            orders = await self._read_page(query, batch_size)
+            for order in orders:
+                yield order
+            if len(orders) < batch_size:
+                return
+            page_token = self._encode_page_token(orders[-1].created_at, orders[-1].id)
+
+    async def list_summaries(
+        self,
+        page_size: int = 100,
+        page_token: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_until: Optional[datetime] = None,
+    ) -> OrderSummaryPage:
+        self._check_page_size(page_size)
+        query = self._page_query(page_token, created_from, created_until)
+        async with database_deadline("list"):
+            # One more order is read, to tell whether there is a next page.
+            found = (
+                await OrderPersistenceModel.get_motor_collection()
+                .find(query, _SUMMARY_PROJECTION)
+                .sort(_PAGE_SORT)
+                .limit(page_size + 1)
+                .to_list(page_size + 1)
+            )
+
+        next_page_token = None
+        if len(found) > page_size:
+            found = found[:page_size]
+            next_page_token = self._encode_page_token(
+                found[-1]["created_at"], found[-1]["_id"]
+            )
+        return OrderSummaryPage(
+            summaries=[self._to_summary(document) for document in found],
+            next_page_token=next_page_token,
+        )
+
+    async def find_summary_by_external_id(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[OrderSummary]:
+        async with database_deadline("find"):
+            found = await OrderPersistenceModel.get_motor_collection().find_one(
+                {"external_id": str(external_id)}, _SUMMARY_PROJECTION
+            )
+        return self._to_summary(found) if found else None
+
     async def insert(self, order: Order) -> Order:
-        try:
-            persisted = await OrderPersistenceModel.from_entity(order).insert()
-            return persisted.to_entity()
-        except MongoDuplicateKeyError as e:
-            raise DuplicateKeyError(message=str(e)) from e
+        async with database_deadline("insert"):
+            try:
+                persisted = await self._to_document(order).insert()
+            except MongoDuplicateKeyError as e:
+                raise DuplicateKeyError(message=str(e)) from e
+
+        order.assign_id(UniqueEntityId(str(persisted.id)))
+        return order
+
+    async def insert_many(self, orders: List[Order]) -> List[Order | RepositoryError]:
+        if not orders:
+            return []
+
+        documents = [self._to_document(order) for order in orders]
+        for document in documents:
+            # Identifiers are assigned upfront, so the created orders can be returned
+            # without reading them back.
+            document.id = document.id or PydanticObjectId()
+
+        errors: Dict[int, RepositoryError] = {}
+        async with database_deadline("insert"):
+            try:
+                await OrderPersistenceModel.insert_many(documents, ordered=False)
+            except BulkWriteError as e:
+                errors = {
+                    error["index"]: self._to_repository_error(error)
+                    for error in e.details.get("writeErrors", [])
+                }
+
+        for index, (order, document) in enumerate(zip(orders, documents, strict=True)):
+            if index not in errors:
+                order.assign_id(UniqueEntityId(str(document.id)))
+
+        return [errors.get(index, order) for index, order in enumerate(orders)]
 
     async def find_by_id(self, identifier: str | UniqueEntityId) -> Optional[Order]:
-        found = await OrderPersistenceModel.get(str(identifier))
+        async with database_deadline("find"):
+            found = await OrderPersistenceModel.get(str(identifier))
         return found.to_entity() if found else None
 
     async def find_by_external_id(
         self, external_id: str | ExternalEntityId
     ) -> Optional[Order]:
-        found = await OrderPersistenceModel.find_one({"external_id": str(external_id)})
+        async with database_deadline("find"):
+            found = await OrderPersistenceModel.find_one(
+                {"external_id": str(external_id)}
+            )
         return found.to_entity() if found else None
 
+    def _to_document(self, order: Order) -> OrderPersistenceModel:
+        """Maps a new order to its document, with its creation event in the outbox.
+
+        The event is written in the same write as the order, so one is never stored
+        without the other.
+        """
+        document = OrderPersistenceModel.from_entity(order)
+        if not self._outbox_enabled:
+            return document
+
+        event = OrderEvent(
+            type=OrderEventType.ORDER_CREATED, order_external_id=str(order.external_id)
+        )
+        document.outbox = [OrderEventPersistenceModel.from_event(event)]
+        document.outbox_lease_until = event.occurred_at
+        return document
+
+    async def _read_page(
+        self, query: Dict[str, Any], page_size: int, lookahead: int = 0
+    ) -> List[Order]:
+        """Reads the orders of a page, up to `lookahead` orders past its end."""
+        self._check_page_size(page_size)
+        async with database_deadline("list"):
+            found = (
+                await OrderPersistenceModel.find(query)
+                .sort(_PAGE_SORT)
+                .limit(page_size + lookahead)
+                .to_list()
+            )
+        return [order.to_entity() for order in found]
+
+    @staticmethod
+    def _check_page_size(page_size: int) -> None:
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"The page size must be between 1 and {MAX_PAGE_SIZE}")
+
+    def _page_query(
+        self,
+        page_token: Optional[str],
+        created_from: Optional[datetime],
+        created_until: Optional[datetime],
+    ) -> Dict[str, Any]:
+        """Builds the query of the orders of a page, within a creation range."""
+        conditions = [self._decode_page_token(page_token)] if page_token else []
+        if created_from is not None:
+            conditions.append({"created_at": {"$gte": created_from}})
+        if created_until is not None:
+            conditions.append({"created_at": {"$lt": created_until}})
+        return {"$and": conditions} if conditions else {}
+
+    @staticmethod
+    def _encode_page_token(
+        created_at: datetime, identifier: ObjectId | UniqueEntityId
+    ) -> str:
+        """Builds the token of the page after the order with the given sort keys."""
+        payload = json.dumps(
+            {"created_at": created_at.isoformat(), "id": str(identifier)}
+        )
+        return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+    @staticmethod
+    def _decode_page_token(page_token: str) -> Dict[str, Any]:
+        """Turns a page token into the query of the orders after its last one."""
+        try:
+            payload = json.loads(
+                base64.urlsafe_b64decode(page_token + "=" * (-len(page_token) % 4))
+            )
+            created_at = datetime.fromisoformat(payload["created_at"])
+            identifier = PydanticObjectId(payload["id"])
+        except (InvalidId, KeyError, TypeError, ValueError) as e:
+            raise InvalidPageTokenError() from e
+
+        return {
+            "$or": [
+                {"created_at": {"$gt": created_at}},
+                {"created_at": created_at, "_id": {"$gt": identifier}},
+            ]
+        }
+
+    @staticmethod
+    def _to_summary(document: Mapping[str, Any]) -> OrderSummary:
+        return OrderSummary(
+            external_id=document["external_id"],
+            status=OrderStatus(document["status"]),
+            total_value=document["total_value"],
+            created_at=document["created_at"],
+        )
+
+    @staticmethod
+    def _to_repository_error(write_error: Dict[str, object]) -> RepositoryError:
+        message = str(write_error.get("errmsg", ""))
+        if write_error.get("code") == _DUPLICATE_KEY_ERROR_CODE:
+            return DuplicateKeyError(message=message)
+        return RepositoryError(message=message)
+
+
+class RawMongoOrderRepository(MongoOrderRepository):
+    """Order repository reading the orders straight from their raw documents.
+
+    Orders are read with Motor and mapped to their entities by
+    `OrderPersistenceModel.raw_to_entity`, without building their Beanie documents
+    first, and without the outbox they carry. Everything else is done as by
+    MongoOrderRepository.
+    """
+
+    async def list_all(self) -> List[Order]:
+        async with database_deadline("list"):
+            found = await (
+                OrderPersistenceModel.get_motor_collection()
+                .find({}, _ENTITY_PROJECTION)
+                .to_list(None)
+            )
+        return [OrderPersistenceModel.raw_to_entity(document) for document in found]
+
+    async def find_by_id(self, identifier: str | UniqueEntityId) -> Optional[Order]:
+        return await self._find_one({"_id": PydanticObjectId(str(identifier))})
+
+    async def find_by_external_id(
+        self, external_id: str | ExternalEntityId
+    ) -> Optional[Order]:
+        return await self._find_one({"external_id": str(external_id)})
+
+    @staticmethod
+    async def _find_one(query: Dict[str, Any]) -> Optional[Order]:
+        async with database_deadline("find"):
+            found = await OrderPersistenceModel.get_motor_collection().find_one(
+                query, _ENTITY_PROJECTION
+            )
+        return OrderPersistenceModel.raw_to_entity(found) if found else None
+
+    async def _read_page(
+        self, query: Dict[str, Any], page_size: int, lookahead: int = 0
+    ) -> List[Order]:
+        self._check_page_size(page_size)
+        async with database_deadline("list"):
+            found = (
+                await OrderPersistenceModel.get_motor_collection()
+                .find(query, _ENTITY_PROJECTION)
+                .sort(_PAGE_SORT)
+                .limit(page_size + lookahead)
+                .to_list(page_size + lookahead)
+            )
+        return [OrderPersistenceModel.raw_to_entity(document) for document in found]
+
+
+_DUPLICATE_KEY_ERROR_CODE = 11000
+_ENTITY_PROJECTION = {"outbox": 0, "outbox_lease_until": 0, "outbox_lease_token": 0}
+_PAGE_SORT = [("created_at", ASCENDING), ("_id", ASCENDING)]
+_SUMMARY_PROJECTION = {"external_id": 1, "status": 1, "total_value": 1, "created_at": 1}
 
-__all__ = ["MongoOrderRepository"]
+__all__ = ["MongoOrderRepository", "RawMongoOrderRepository"]
@@ -11,9 +11,17 @@ from typing import AsyncContextManager
 from beanie import init_beanie
 from motor.motor_asyncio import AsyncIOMotorClient
 
-from src.infra.gateways.database.models import CustomerPersistenceModel
-
-database_models = [CustomerPersistenceModel]
+from src.infra.gateways.database.models import (
+    CustomerPersistenceModel,
+    IdempotencyKeyPersistenceModel,
+    OrderPersistenceModel,
+)
+
+database_models = [
+    CustomerPersistenceModel,
+    IdempotencyKeyPersistenceModel,
+    OrderPersistenceModel,
+]
 
 
 @asynccontextmanager
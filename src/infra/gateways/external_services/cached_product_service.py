@@ -0,0 +1,174 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.domain.__shared.interfaces.product_service import IProductService, Product
+from src.infra.cache import CacheStats, TTLCache
+from src.infra.deadline import detached_context
+from src.infra.gateways.external_services.product_snapshot import ProductSnapshot
+from src.infra.metrics import Metric
+
+
+class CachedProductService(IProductService):
+    """Caches the products returned by another product service.
+
+    Cached products are served without reaching the wrapped service until they expire.
+    Only the products missing from the cache are fetched, in a single bulk lookup.
+
+    Within the stale grace period, an expired product is still served while a single
+    background task refreshes it, so no caller waits for the wrapped service. Product
+    ids reported as not found can also be remembered for a short while, so invalid ids
+    stop reaching the wrapped service on every lookup.
+
+    With a product snapshot, the products missing from the cache are read from the
+    snapshot before reaching the wrapped service. The snapshot is memory-mapped, so
+    the catalog is held once by the host instead of once per worker; the cache only
+    holds the products fetched on demand.
+    """
+
+    def __init__(
+        self,
+        product_service: IProductService,
+        cache: TTLCache[str, Product],
+        stale_grace: float = 0.0,
+        missing_cache: Optional[TTLCache[str, bool]] = None,
+        snapshot: Optional[ProductSnapshot] = None,
+    ) -> None:
+        """Initializes a new instance of the CachedProductService class.
+
+        Args:
+            product_service: The product service whose products are cached.
+            cache: The cache holding the products, keyed by id.
+            stale_grace: For how long an expired product is still served while being
+             refreshed, in seconds. Zero disables stale-while-revalidate.
+            missing_cache: The cache remembering the ids of products not found, if any.
+            snapshot: The snapshot of the product catalog, kept up to date by the
+             catalog refresher, if any.
+        """
+        self._product_service = product_service
+        self._cache = cache
+        self._stale_grace = stale_grace
+        self._missing_cache = missing_cache
+        self._snapshot = snapshot
+        self._refreshing: Set[str] = set()
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._refresh_failures = 0
+
+    async def fetch_product_map(self, ids: List[str]) -> Dict[str, Product]:
+        found: Dict[str, Product] = {}
+        missed_ids: List[str] = []
+        stale_ids: List[str] = []
+
+        for product_id in dict.fromkeys(ids):
+            product, stale = self._cache.get_stale(product_id, self._stale_grace)
+            if product is not None:
+                found[product_id] = product
+                if stale:
+                    stale_ids.append(product_id)
+            elif (product := self._from_snapshot(product_id)) is not None:
+                found[product_id] = product
+            elif not self._is_known_missing(product_id):
+                missed_ids.append(product_id)
+
+        if stale_ids:
+            self._refresh_in_background(stale_ids)
+
+        if missed_ids:
+            found.update(await self._fetch(missed_ids))
+
+        return found
+
+    def load(self, products: Iterable[Product]) -> None:
+        """Caches the given products, as fresh as if they had just been fetched."""
+        for product in products:
+            self._cache.put(product.id, product)
+            if self._missing_cache is not None:
+                self._missing_cache.invalidate(product.id)
+
+    def invalidate(self, *product_ids: str) -> None:
+        """Drops the given products from the cache, so they are fetched again."""
+        self._cache.invalidate(*product_ids)
+        if self._missing_cache is not None:
+            self._missing_cache.invalidate(*product_ids)
+
+    @property
+    def stats(self) -> CacheStats:
+        """The cache counters."""
+        return self._cache.stats
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the cache counters as metric samples."""
+        stats = self.stats
+        missing_stats = self._missing_cache.stats if self._missing_cache else None
+        return [
+            Metric("product_cache_hits_total", stats.hits, "Product cache hits."),
+            Metric(
+                "product_cache_stale_hits_total",
+                stats.stale_hits,
+                "Expired products served while being refreshed.",
+            ),
+            Metric("product_cache_misses_total", stats.misses, "Product cache misses."),
+            Metric(
+                "product_cache_evictions_total",
+                stats.evictions,
+                "Products evicted from the cache to respect its maximum size.",
+            ),
+            Metric(
+                "product_cache_entries",
+                stats.size,
+                "Products currently cached.",
+                type="gauge",
+            ),
+            Metric(
+                "product_cache_negative_hits_total",
+                missing_stats.hits if missing_stats else 0,
+                "Lookups of product ids remembered as not found.",
+            ),
+            Metric(
+                "product_cache_refresh_failures_total",
+                self._refresh_failures,
+                "Background refreshes of expired products that failed.",
+            ),
+        ]
+
+    async def _fetch(self, product_ids: List[str]) -> Dict[str, Product]:
+        fetched = await self._product_service.fetch_product_map(product_ids)
+
+        for product_id in product_ids:
+            if (product := fetched.get(product_id)) is not None:
+                self._cache.put(product_id, product)
+            else:
+                self._cache.invalidate(product_id)
+                if self._missing_cache is not None:
+                    self._missing_cache.put(product_id, True)
+
+        return fetched
+
+    def _from_snapshot(self, product_id: str) -> Optional[Product]:
+        return self._snapshot.get(product_id) if self._snapshot is not None else None
+
+    def _is_known_missing(self, product_id: str) -> bool:
+        return self._missing_cache is not None and bool(
+            self._missing_cache.get(product_id)
+        )
+
+    def _refresh_in_background(self, product_ids: List[str]) -> None:
+        """Refreshes the expired products, unless a refresh is already running."""
+        if not (ids := [i for i in product_ids if i not in self._refreshing]):
+            return
+
+        self._refreshing.update(ids)
+        task = asyncio.create_task(self._refresh(ids), context=detached_context())
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+
+    async def _refresh(self, product_ids: List[str]) -> None:
+        try:
+            await self._fetch(product_ids)
+        except Exception:  # noqa: BLE001
+            # The stale products keep being served until the grace period ends
+            self._refresh_failures += 1
+        finally:
+            self._refreshing.difference_update(product_ids)
+
+
+__all__ = ["CachedProductService"]
@@ -0,0 +1,181 @@
+import asyncio
+from typing import List, Optional
+
+from src.domain.__shared.interfaces.product_service import Product
+from src.infra.gateways.external_services.cached_product_service import (
+    CachedProductService,
+)
+from src.infra.gateways.external_services.product_service import (
+    ProductCatalog,
+    ProductServiceImpl,
+)
+from src.infra.gateways.external_services.product_snapshot import (
+    ProductSnapshot,
+    write_product_snapshot,
+)
+from src.infra.metrics import Metric
+
+
+class CatalogRefresher:
+    """Keeps the product cache loaded with the whole product catalog.
+
+    The catalog can be preloaded when the worker starts, so the first requests do not
+    pay for the product service latency, and then reloaded periodically in the
+    background. Reloads are conditional requests: while the catalog is unchanged,
+    the product service answers with an empty `304 Not Modified`, and the products
+    already known are just kept fresh in the cache.
+
+    When a snapshot is configured, every new version of the catalog is written to it
+    instead, and the cache reads the catalog from the snapshot, so the workers of the
+    host share a single copy of it. A restarting worker maps the snapshot first, and
+    only asks the product service whether the catalog changed since.
+
+    Failed loads never stop the worker; the cache then keeps fetching the products on
+    demand.
+    """
+
+    def __init__(
+        self,
+        product_service: ProductServiceImpl,
+        product_cache: CachedProductService,
+        warm_up_timeout: Optional[float] = None,
+        refresh_interval: float = 0.0,
+        snapshot: Optional[ProductSnapshot] = None,
+    ) -> None:
+        """Initializes a new instance of the CatalogRefresher class.
+
+        Args:
+            product_service: The gateway the catalog is fetched from.
+            product_cache: The cache the catalog is loaded into.
+            warm_up_timeout: For how long, in seconds, the worker startup waits for the
+             catalog. None disables the warm-up.
+            refresh_interval: The time, in seconds, between two reloads of the catalog.
+             Zero disables the periodic refresh.
+            snapshot: The snapshot the catalog is persisted to, if any. It must be
+             the snapshot the product cache reads.
+        """
+        self._product_service = product_service
+        self._product_cache = product_cache
+        self._warm_up_timeout = warm_up_timeout
+        self._refresh_interval = refresh_interval
+        self._snapshot = snapshot
+        self._products: List[Product] = []
+        self._etag: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+        self._refreshes = 0
+        self._failures = 0
+
+    async def start(self) -> None:
+        """Warms up the cache, if enabled, and starts the periodic refresh."""
+        if self._snapshot is not None:
+            await self._load_snapshot(self._snapshot)
+
+        if self._warm_up_timeout is not None:
+            await self._warm_up(self._warm_up_timeout)
+
+        if self._refresh_interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._refresh_periodically())
+
+    async def stop(self) -> None:
+        """Stops the periodic refresh."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def refresh(self) -> bool:
+        """Loads the catalog into the cache, or into the snapshot, if any.
+
+        Products removed from the catalog are dropped from the cache.
+
+        Returns:
+            bool: Whether the catalog changed since the last load.
+
+        Raises:
+            ProductLookupError: If the catalog could not be fetched.
+        """
+        catalog = await self._product_service.fetch_catalog(self._etag)
+        self._refreshes += 1
+
+        if catalog is None:
+            self._product_cache.load(self._products)
+            return False
+
+        if self._snapshot is not None:
+            await self._save_snapshot(self._snapshot, catalog)
+            return True
+
+        current_ids = {product.id for product in catalog.products}
+        removed_ids = [p.id for p in self._products if p.id not in current_ids]
+        self._product_cache.invalidate(*removed_ids)
+        self._product_cache.load(catalog.products)
+        self._products, self._etag = catalog.products, catalog.etag
+        return True
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the catalog refresh counters as metric samples."""
+        return [
+            Metric(
+                "product_catalog_refreshes_total",
+                self._refreshes,
+                "Loads of the product catalog into the cache.",
+            ),
+            Metric(
+                "product_catalog_refresh_failures_total",
+                self._failures,
+                "Loads of the product catalog that failed.",
+            ),
+            Metric(
+                "product_catalog_products",
+                len(self._snapshot if self._snapshot is not None else self._products),
+                "Products in the last catalog loaded.",
+                type="gauge",
+            ),
+        ]
+
+    async def _load_snapshot(self, snapshot: ProductSnapshot) -> None:
+        try:
+            # Mapped in a worker thread, but installed in this one, between the
+            # lookups reading the mapping it replaces.
+            loaded = snapshot.install(await asyncio.to_thread(snapshot.map_current))
+        except Exception:  # noqa: BLE001
+            # A corrupt snapshot is overwritten by the next catalog fetched
+            self._failures += 1
+            return
+
+        if loaded:
+            self._etag = snapshot.etag
+
+    async def _save_snapshot(
+        self, snapshot: ProductSnapshot, catalog: ProductCatalog
+    ) -> None:
+        await asyncio.to_thread(
+            write_product_snapshot, snapshot.path, catalog.products, catalog.etag
+        )
+        previous_ids = [product.id for product in snapshot]
+        snapshot.install(await asyncio.to_thread(snapshot.map_current))
+        self._etag = catalog.etag
+
+        # Products fetched on demand are dropped, so the cache reads the new snapshot
+        self._product_cache.invalidate(
+            *previous_ids, *(product.id for product in catalog.products)
+        )
+
+    async def _warm_up(self, timeout: float) -> None:
+        try:
+            async with asyncio.timeout(timeout):
+                await self.refresh()
+        except Exception:  # noqa: BLE001
+            # Starting with a cold cache beats not starting at all
+            self._failures += 1
+
+    async def _refresh_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval)
+            try:
+                await self.refresh()
+            except Exception:  # noqa: BLE001
+                self._failures += 1
+
+
+__all__ = ["CatalogRefresher"]
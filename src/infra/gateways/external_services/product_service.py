@@ -1,39 +1,482 @@
-from typing import List
+import asyncio
+import math
+import time
+from dataclasses import dataclass
+from functools import partial
+from http import HTTPStatus
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import quote
 
-import requests
+import httpx
 
-from src.domain.__shared.error.external_service_error import ExternalServiceError
+from src.domain.__shared.error.external_service_error import ProductLookupError
 from src.domain.__shared.interfaces.product_service import IProductService, Product
+from src.infra.concurrency import SingleFlight
+from src.infra.deadline import bounded_by_deadline
+from src.infra.metrics import Metric
+from src.infra.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    CircuitState,
+    RequestHedger,
+)
+
+BATCH_UNSUPPORTED_STATUSES = frozenset(
+    {HTTPStatus.METHOD_NOT_ALLOWED, HTTPStatus.NOT_IMPLEMENTED}
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ProductCatalog:
+    """Every product offered by the product service.
+
+    Attributes:
+        products: The products of the catalog.
+        etag: The version of the catalog, if the product service reports one.
+    """
+
+    products: List[Product]
+    etag: Optional[str] = None
 
 
 class ProductServiceImpl(IProductService):
-    def __init__(self, base_url: str):
+    """HTTP gateway to the product service.
+
+    All requests share a single keep-alive connection pool. The pool is created by
+    `open` and released by `close`, so its lifetime is bound to the application lifespan.
+
+    Products are fetched with the bulk `GET /products?ids=a,b,c` endpoint, split in
+    chunks whose URL fits the configured length. When the product service answers that
+    it has no bulk endpoint, the gateway falls back to one `GET /products/{id}` per
+    product, and tries the bulk endpoint again once the retry interval has elapsed.
+    A 404 with a JSON body comes from the product service itself rather than from a
+    missing route, so it only sends the chunk it answered to the fallback. Requests run concurrently, capped both per lookup and for the whole
+    process, so a large order cannot starve the other requests of connections.
+
+    Concurrent lookups of the same product share a single request: a product already
+    being fetched for another caller is awaited instead of being requested again.
+
+    A lookup waits no longer than the time left before the deadline of the request,
+    if any. The requests it shares with other lookups keep running for them.
+
+    An optional circuit breaker rejects requests right away while the product service
+    keeps failing or answering slowly, and an optional hedger sends a duplicate of the
+    requests slower than usual, keeping the first response.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        limits: Optional[httpx.Limits] = None,
+        timeout: Optional[httpx.Timeout] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        max_concurrency: int = 64,
+        max_concurrency_per_call: int = 8,
+        batch_enabled: bool = True,
+        batch_max_url_length: int = 2048,
+        batch_retry_interval: float = 300.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        hedger: Optional[RequestHedger] = None,
+    ) -> None:
+        """Initializes a new instance of the ProductServiceImpl class.
+
+        Args:
+            base_url: The base URL of the product service.
+            limits: The connection pool limits.
+            timeout: The connect, read, write and pool timeouts.
+            transport: An optional transport, used to route requests somewhere other
+             than the network.
+            max_concurrency: The maximum number of in-flight requests for the process.
+            max_concurrency_per_call: The maximum number of in-flight requests for a
+             single lookup.
+            batch_enabled: Whether the bulk endpoint should be used.
+            batch_max_url_length: The maximum length of a bulk lookup URL.
+            batch_retry_interval: For how long, in seconds, the bulk endpoint is left
+             unused once the product service answered that it does not support it.
+            circuit_breaker: The circuit breaker guarding the product service, if any.
+            hedger: The hedger of slow requests, if any.
+        """
         self.base_url = base_url
+        self._limits = limits or httpx.Limits()
+        self._timeout = timeout or httpx.Timeout(5.0)
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._limiter = asyncio.Semaphore(max_concurrency)
+        self._max_concurrency_per_call = max_concurrency_per_call
+        self._batch_disabled_until = -math.inf if batch_enabled else math.inf
+        self._batch_max_url_length = batch_max_url_length
+        self._batch_retry_interval = batch_retry_interval
+        self._flights = SingleFlight[str, Product]()
+        self._circuit_breaker = circuit_breaker
+        self._hedger = hedger
 
-    def fetch_products_by_ids(self, ids: List[str]) -> List[Product]:
-        products = []
-        for product_id in ids:
+    async def open(self) -> None:
+        """Creates the connection pool, if it is not open yet."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+
+    async def close(self) -> None:
+        """Closes every pooled connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("The product service client is not open")
+        return self._client
+
+    async def fetch_product_map(self, ids: List[str]) -> Dict[str, Product]:
+        """Fetches the distinct products concurrently.
+
+        Products already being fetched for a concurrent lookup are not requested again;
+        both lookups share the same result, or the same error. A single error is raised
+        as is, whatever its type; several errors are raised together in a group, unless
+        they are all product lookup errors.
+
+        Raises:
+            ProductLookupError: Listing every failed product id, along with the ids
+             already known to be missing.
+            DeadlineExceededError: If the deadline expires before the products are
+             fetched.
+        """
+        fetch = partial(self._fetch_ids, self._http)
+
+        async with bounded_by_deadline("products"):
             try:
-                response = requests.get(f"{self.base_url}/products/{product_id}")
-                response.raise_for_status()
-                products.append(
-                    Product(
-                        id=response.json()["id"],
-                        name=response.json()["name"],
-                        price=response.json()["price"],
-                    )
+                return await self._flights.run(ids, fetch)
+            except BaseExceptionGroup as error_group:
+                errors = _leaf_errors(error_group)
+                if len(errors) == 1:
+                    raise errors[0] from None
+                if all(isinstance(error, ProductLookupError) for error in errors):
+                    raise ProductLookupError.combine([], errors) from None
+                raise
+
+    async def fetch_catalog(
+        self, etag: Optional[str] = None
+    ) -> Optional[ProductCatalog]:
+        """Fetches the whole product catalog with `GET /products`.
+
+        Args:
+            etag: The version of the catalog already known. The catalog is only
+             transferred if it changed since.
+
+        Returns:
+            Optional[ProductCatalog]: The catalog, or None when it did not change.
+
+        Raises:
+            ProductLookupError: If the catalog could not be fetched.
+        """
+        headers = {"If-None-Match": etag} if etag else None
+
+        try:
+            async with self._limiter:
+                response = await self._get(self._http, "/products", [], headers=headers)
+
+            if response.status_code == HTTPStatus.NOT_MODIFIED:
+                return None
+
+            self._raise_for_status(response, [])
+            payload = self._parse(response, [])
+            items = payload.values() if isinstance(payload, dict) else payload
+            products = [self._to_product(item, []) for item in items]
+        except ProductLookupError as err:
+            raise ProductLookupError(
+                status_code=err.status_code,
+                message="Failed to fetch the product catalog",
+            ) from err
+
+        return ProductCatalog(products=products, etag=response.headers.get("ETag"))
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the circuit breaker and hedging counters as metric samples."""
+        metrics: List[Metric] = []
+
+        if self._circuit_breaker is not None:
+            metrics += [
+                Metric(
+                    "product_service_circuit_open",
+                    int(self._circuit_breaker.state != CircuitState.CLOSED),
+                    "Whether the product service circuit is open or half-open.",
+                    type="gauge",
+                ),
+                Metric(
+                    "product_service_rejected_requests_total",
+                    self._circuit_breaker.rejected_calls,
+                    "Product service requests rejected by the open circuit.",
+                ),
+            ]
+        if self._hedger is not None:
+            metrics.append(
+                Metric(
+                    "product_service_hedged_requests_total",
+                    self._hedger.hedged_requests,
+                    "Product service requests sent again for being slow.",
                 )
-            except requests.HTTPError as http_err:
-                raise ExternalServiceError(
-                    message=f"Failed to fetch product {product_id}: {http_err}",
-                    status_code=http_err.response.status_code,
-                ) from http_err
-            except requests.RequestException as err:
-                raise ExternalServiceError(
-                    message=f"An error occurred while fetching product {product_id}: {err}",
-                    status_code=500,
-                ) from err
-        return products
-
-
-__all__ = ["ProductServiceImpl"]
+            )
+
+        return metrics
+
+    async def _fetch_ids(
+        self, client: httpx.AsyncClient, ids: List[str]
+    ) -> Dict[str, Product]:
+        """Fetches the distinct products, in chunks fetched concurrently.
+
+        Products reported as not found do not interrupt the other requests. Any other
+        failure settles the outcome, and the requests still running are cancelled.
+        """
+        lookup = _Lookup(
+            client=client,
+            call_limiter=asyncio.Semaphore(self._max_concurrency_per_call),
+        )
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for chunk in self._chunk_ids(ids):
+                    group.create_task(self._fetch_chunk(group, lookup, chunk))
+        except* ProductLookupError as error_group:
+            raise ProductLookupError.combine(
+                lookup.missing_ids, error_group.exceptions
+            ) from None
+
+        return lookup.found
+
+    def _chunk_ids(self, ids: List[str]) -> Iterable[List[str]]:
+        """Splits the ids in chunks whose bulk lookup URL fits the configured length.
+
+        When the bulk endpoint is not used, every id is a chunk of its own.
+        """
+        if not self._batch_supported:
+            yield from ([product_id] for product_id in ids)
+            return
+
+        budget = self._batch_max_url_length - len(self._batch_url_prefix)
+        chunk: List[str] = []
+        size = 0
+
+        for product_id in ids:
+            # Each id is percent-encoded, and separated from the previous one by "%2C"
+            cost = len(quote(product_id, safe="")) + (3 if chunk else 0)
+            if chunk and size + cost > budget:
+                yield chunk
+                chunk, size = [], 0
+                cost -= 3
+            chunk.append(product_id)
+            size += cost
+
+        if chunk:
+            yield chunk
+
+    @property
+    def _batch_supported(self) -> bool:
+        return time.monotonic() >= self._batch_disabled_until
+
+    @property
+    def _batch_url_prefix(self) -> str:
+        return f"{self.base_url.rstrip('/')}/products?ids="
+
+    async def _fetch_chunk(
+        self, group: asyncio.TaskGroup, lookup: "_Lookup", chunk: List[str]
+    ) -> None:
+        if len(chunk) == 1:
+            await self._fetch_single(lookup, chunk[0])
+            return
+
+        if (products := await self._fetch_batch(lookup, chunk)) is not None:
+            lookup.collect(chunk, products)
+            return
+
+        # The bulk lookup was refused: fall back to one request per id
+        for product_id in chunk:
+            group.create_task(self._fetch_single(lookup, product_id))
+
+    async def _fetch_batch(
+        self, lookup: "_Lookup", chunk: List[str]
+    ) -> Optional[List[Product]]:
+        """Fetches a chunk of products with a single bulk request.
+
+        Returns:
+            Optional[List[Product]]: The products found, or None when the product
+             service refused the bulk lookup.
+        """
+        async with lookup.call_limiter, self._limiter:
+            response = await self._get(
+                lookup.client, "/products", chunk, params={"ids": ",".join(chunk)}
+            )
+
+        if self._is_batch_unsupported(response):
+            self._batch_disabled_until = time.monotonic() + self._batch_retry_interval
+            return None
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            return None
+
+        self._raise_for_status(response, chunk)
+        payload = self._parse(response, chunk)
+        items = payload.values() if isinstance(payload, dict) else payload
+        return [self._to_product(item, chunk) for item in items]
+
+    @staticmethod
+    def _is_batch_unsupported(response: httpx.Response) -> bool:
+        """Tells whether a response means the product service has no bulk endpoint.
+
+        A 404 is only taken as such when its body is not JSON, as a missing route
+        answered by a proxy or a web server would be.
+        """
+        if response.status_code in BATCH_UNSUPPORTED_STATUSES:
+            return True
+        return response.status_code == HTTPStatus.NOT_FOUND and (
+            "json" not in response.headers.get("content-type", "")
+        )
+
+    async def _fetch_single(self, lookup: "_Lookup", product_id: str) -> None:
+        async with lookup.call_limiter, self._limiter:
+            response = await self._get(
+                lookup.client, f"/products/{quote(product_id, safe='')}", [product_id]
+            )
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            lookup.collect([product_id], [])
+            return
+
+        self._raise_for_status(response, [product_id])
+        product = self._to_product(self._parse(response, [product_id]), [product_id])
+        lookup.collect([product_id], [product])
+
+    async def _get(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        product_ids: List[str],
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> httpx.Response:
+        probe = self._acquire_circuit(product_ids)
+        started = time.monotonic()
+
+        try:
+            response = await self._send(client, url, params, headers)
+        except httpx.HTTPError as err:
+            self._record(started, failed=True, probe=probe)
+            raise ProductLookupError(
+                failed_ids=product_ids,
+                status_code=500,
+                message=(
+                    f"An error occurred while fetching products "
+                    f"{', '.join(product_ids)}: {err}"
+                ),
+            ) from err
+        except BaseException:
+            # Cancelled, or failed for reasons unrelated to the service, such as a
+            # closed client: the outcome is unknown, but the probe is handed back.
+            if self._circuit_breaker is not None:
+                self._circuit_breaker.release(probe)
+            raise
+
+        self._record(started, failed=response.is_server_error, probe=probe)
+        return response
+
+    async def _send(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        params: Optional[Dict[str, str]],
+        headers: Optional[Dict[str, str]],
+    ) -> httpx.Response:
+        send = partial(client.get, url, params=params, headers=headers)
+        if self._hedger is None:
+            return await send()
+        return await self._hedger.run(send, limiter=self._limiter)
+
+    def _acquire_circuit(self, product_ids: List[str]) -> bool:
+        if self._circuit_breaker is None:
+            return False
+
+        try:
+            return self._circuit_breaker.acquire()
+        except CircuitOpenError as err:
+            raise ProductLookupError(
+                failed_ids=product_ids,
+                status_code=503,
+                message=(
+                    f"The product service is unavailable, products "
+                    f"{', '.join(product_ids)} were not fetched"
+                ),
+            ) from err
+
+    def _record(self, started: float, failed: bool, probe: bool) -> None:
+        duration = time.monotonic() - started
+
+        if self._circuit_breaker is not None:
+            self._circuit_breaker.record(duration, failed, probe)
+        if self._hedger is not None and not failed:
+            self._hedger.record(duration)
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response, product_ids: List[str]) -> None:
+        if response.is_error:
+            raise ProductLookupError(
+                failed_ids=product_ids,
+                status_code=response.status_code,
+                message=f"Failed to fetch products {', '.join(product_ids)}",
+            )
+
+    @staticmethod
+    def _parse(response: httpx.Response, product_ids: List[str]) -> Any:  # noqa: ANN401
+        try:
+            return response.json()
+        except ValueError as err:
+            raise ProductLookupError(
+                failed_ids=product_ids,
+                status_code=502,
+                message=f"Malformed response for products {', '.join(product_ids)}",
+            ) from err
+
+    @staticmethod
+    def _to_product(payload: Any, product_ids: List[str]) -> Product:  # noqa: ANN401
+        try:
+            return Product(
+                id=str(payload["id"]), name=payload["name"], price=payload["price"]
+            )
+        except (KeyError, TypeError) as err:
+            raise ProductLookupError(
+                failed_ids=product_ids,
+                status_code=502,
+                message=f"Malformed product received for {', '.join(product_ids)}",
+            ) from err
+
+
+class _Lookup:
+    """The state shared by the requests of a single product lookup."""
+
+    def __init__(
+        self, client: httpx.AsyncClient, call_limiter: asyncio.Semaphore
+    ) -> None:
+        self.client = client
+        self.call_limiter = call_limiter
+        self.found: Dict[str, Product] = {}
+        self.missing_ids: List[str] = []
+
+    def collect(self, requested_ids: List[str], products: List[Product]) -> None:
+        """Records the products received for the requested ids."""
+        for product in products:
+            if product.id in requested_ids:
+                self.found[product.id] = product
+
+        self.missing_ids.extend(i for i in requested_ids if i not in self.found)
+
+
+def _leaf_errors(error: BaseException) -> List[BaseException]:
+    """Lists the errors of a group, flattening the groups nested in it."""
+    if isinstance(error, BaseExceptionGroup):
+        return [leaf for nested in error.exceptions for leaf in _leaf_errors(nested)]
+    return [error]
+
+
+__all__ = ["ProductCatalog", "ProductServiceImpl"]
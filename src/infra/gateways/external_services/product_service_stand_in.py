@@ -0,0 +1,169 @@
+"""Local stand-in for the product service.
+
+The stand-in is an ASGI application serving the same API as the product service, on a
+generated catalog, with configurable latency and faults. It can be bound in process
+to the product gateway through `httpx.ASGITransport`, or served on its own with:
+
+    make product-stand-in
+
+so checkouts can be load-tested offline, under realistic upstream behavior. Both read
+the `PRODUCT_SERVICE_STAND_IN_*` settings.
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import random
+from dataclasses import dataclass
+from typing import Dict, List, Literal, Optional
+
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from src.domain.__shared.interfaces.product_service import Product
+from src.infra.config import settings
+
+LatencyDistribution = Literal["constant", "uniform", "exponential", "lognormal"]
+
+
+@dataclass(frozen=True, slots=True)
+class StandInBehavior:
+    """How the product service stand-in answers.
+
+    Attributes:
+        latency_distribution: The distribution the latency of each response is drawn
+         from.
+        latency: The median latency, in seconds. For the exponential distribution,
+         the mean latency.
+        latency_spread: How spread the latency is: the maximum deviation from the
+         median, in seconds, for the uniform distribution, and the standard deviation
+         of the latency logarithm for the log-normal distribution.
+        error_rate: The rate, from 0 to 1, of requests answered with `error_status`.
+        error_status: The status code of the failed responses.
+        timeout_rate: The rate, from 0 to 1, of requests left hanging for
+         `timeout_delay` seconds, long enough for clients to time out.
+        timeout_delay: For how long, in seconds, a hanging request is left unanswered.
+        batch_enabled: Whether the bulk `GET /products?ids=` endpoint is available.
+        seed: The seed of the random latencies and faults, for reproducible runs.
+    """
+
+    latency_distribution: LatencyDistribution = "lognormal"
+    latency: float = 0.02
+    latency_spread: float = 0.5
+    error_rate: float = 0.0
+    error_status: int = 503
+    timeout_rate: float = 0.0
+    timeout_delay: float = 30.0
+    batch_enabled: bool = True
+    seed: Optional[int] = None
+
+    def sample_latency(self, rng: random.Random) -> float:
+        """Draws the latency of a response, in seconds."""
+        match self.latency_distribution:
+            case "uniform":
+                return max(0.0, rng.uniform(-1, 1) * self.latency_spread + self.latency)
+            case "exponential":
+                return rng.expovariate(1 / self.latency) if self.latency > 0 else 0.0
+            case "lognormal":
+                if self.latency <= 0:
+                    return 0.0
+                return rng.lognormvariate(math.log(self.latency), self.latency_spread)
+            case _:
+                return self.latency
+
+
+def generate_catalog(size: int, seed: Optional[int] = None) -> List[Product]:
+    """Generates a catalog of products with ids from "1" to `size`."""
+    rng = random.Random(seed)
+    return [
+        Product(id=str(i), name=f"Product {i}", price=round(rng.uniform(1, 100), 2))
+        for i in range(1, size + 1)
+    ]
+
+
+def create_product_service_stand_in(
+    catalog_size: int = 1000,
+    behavior: Optional[StandInBehavior] = None,
+) -> FastAPI:
+    """Creates the product service stand-in application.
+
+    Args:
+        catalog_size: The number of products of the generated catalog.
+        behavior: How the stand-in answers. Defaults to fast and faultless answers.
+
+    Returns:
+        FastAPI: The stand-in application.
+    """
+    behavior = behavior or StandInBehavior()
+    rng = random.Random(behavior.seed)
+    catalog = {
+        p.id: _to_payload(p) for p in generate_catalog(catalog_size, behavior.seed)
+    }
+    catalog_etag = _etag(catalog)
+    app = FastAPI(title="Product service stand-in", docs_url=None, redoc_url=None)
+
+    @app.middleware("http")
+    async def inject_faults(request: Request, call_next):  # noqa: ANN001, ANN202
+        if rng.random() < behavior.timeout_rate:
+            await asyncio.sleep(behavior.timeout_delay)
+        await asyncio.sleep(behavior.sample_latency(rng))
+
+        if rng.random() < behavior.error_rate:
+            return JSONResponse(
+                {"detail": "Injected failure"}, status_code=behavior.error_status
+            )
+        return await call_next(request)
+
+    @app.get("/products")
+    async def list_products(request: Request, ids: Optional[str] = None) -> Response:
+        if ids is None:
+            if request.headers.get("If-None-Match") == catalog_etag:
+                return Response(status_code=304)
+            return JSONResponse(list(catalog.values()), headers={"ETag": catalog_etag})
+
+        if not behavior.batch_enabled:
+            return PlainTextResponse("Not Found", status_code=404)
+        return JSONResponse([catalog[i] for i in ids.split(",") if i in catalog])
+
+    @app.get("/products/{product_id}")
+    async def get_product(product_id: str) -> Response:
+        if (product := catalog.get(product_id)) is None:
+            return JSONResponse({"detail": "Not Found"}, status_code=404)
+        return JSONResponse(product)
+
+    return app
+
+
+def create_product_service_stand_in_from_settings() -> FastAPI:
+    """Creates the product service stand-in application, configured by the settings."""
+    return create_product_service_stand_in(
+        catalog_size=settings.PRODUCT_SERVICE_STAND_IN_CATALOG_SIZE,
+        behavior=StandInBehavior(
+            latency_distribution=settings.PRODUCT_SERVICE_STAND_IN_LATENCY_DISTRIBUTION,
+            latency=settings.PRODUCT_SERVICE_STAND_IN_LATENCY,
+            latency_spread=settings.PRODUCT_SERVICE_STAND_IN_LATENCY_SPREAD,
+            error_rate=settings.PRODUCT_SERVICE_STAND_IN_ERROR_RATE,
+            timeout_rate=settings.PRODUCT_SERVICE_STAND_IN_TIMEOUT_RATE,
+            batch_enabled=settings.PRODUCT_SERVICE_STAND_IN_BATCH_ENABLED,
+            seed=settings.PRODUCT_SERVICE_STAND_IN_SEED,
+        ),
+    )
+
+
+def _to_payload(product: Product) -> Dict[str, object]:
+    return {"id": product.id, "name": product.name, "price": product.price}
+
+
+def _etag(catalog: Dict[str, Dict[str, object]]) -> str:
+    digest = hashlib.sha256(json.dumps(catalog, sort_keys=True).encode()).hexdigest()
+    return f'"{digest[:16]}"'
+
+
+__all__ = [
+    "LatencyDistribution",
+    "StandInBehavior",
+    "create_product_service_stand_in",
+    "create_product_service_stand_in_from_settings",
+    "generate_catalog",
+]
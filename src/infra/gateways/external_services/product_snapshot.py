@@ -0,0 +1,264 @@
+"""Product catalog snapshots.
+
+A snapshot is a compact, read-only file holding a whole product catalog, meant to be
+memory-mapped by every worker of the host, so they share a single copy of it through
+the page cache, and to survive restarts.
+
+All integers are little-endian. The file is made of:
+
+- A header: the magic `PSNP`, the format version (u16), two padding bytes, the number
+  of products (u32), and the offset (u32) and length (u32) of the catalog ETag in the
+  string table.
+- The index: one fixed-width record per product, sorted by the UTF-8 bytes of its id,
+  holding the offset (u32) and length (u32) of the id, the offset (u32) and length (u32)
+  of the name, and the price (f64).
+- The string table: the UTF-8 bytes of every id, name and ETag, concatenated. Offsets
+  are relative to the start of the table.
+"""
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.domain.__shared.interfaces.product_service import Product
+
+MAGIC = b"PSNP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sHxxIII")
+_ENTRY = struct.Struct("<IIIId")
+
+
+class SnapshotFormatError(Exception):
+    """Raised when a file is not a valid product snapshot."""
+
+
+@dataclass(frozen=True, slots=True)
+class MappedSnapshot:
+    """A snapshot file mapped, not yet installed in its ProductSnapshot."""
+
+    mapping: mmap.mmap
+    count: int
+    etag: Optional[str]
+
+
+class ProductSnapshot:
+    """Reads a product snapshot through a read-only memory map.
+
+    Lookups binary search the index in place: only the records visited are decoded,
+    and the catalog is never copied into the worker memory.
+
+    The snapshot file may be replaced at any time by `write_product_snapshot`. The
+    mapping keeps pointing to the file it was opened from until `load` is called again.
+    """
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        """Initializes a new instance of the ProductSnapshot class.
+
+        Args:
+            path: The path of the snapshot file.
+        """
+        self.path = Path(path)
+        self._mapping: Optional[mmap.mmap] = None
+        self._count = 0
+        self._strings_offset = 0
+        self._etag: Optional[str] = None
+
+    def load(self) -> bool:
+        """Maps the current snapshot file, replacing the mapping already open.
+
+        It must not run while the snapshot is read from another thread: the mapping
+        replaced is closed. To map the file in a worker thread, call `map_current`
+        there and `install` the mapping in the thread reading the snapshot.
+
+        Returns:
+            bool: Whether a snapshot is available. The mapping already open, if any,
+             is kept when the file is missing.
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid product snapshot.
+        """
+        return self.install(self.map_current())
+
+    def map_current(self) -> Optional["MappedSnapshot"]:
+        """Maps the current snapshot file, leaving the mapping already open in use.
+
+        It changes nothing the lookups read, so it may run in any thread.
+
+        Returns:
+            Optional[MappedSnapshot]: The new mapping, or None if the file is missing.
+
+        Raises:
+            SnapshotFormatError: If the file is not a valid product snapshot.
+        """
+        try:
+            with open(self.path, "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+
+        try:
+            count, etag = self._read_header(mapping)
+        except SnapshotFormatError:
+            mapping.close()
+            raise
+        return MappedSnapshot(mapping=mapping, count=count, etag=etag)
+
+    def install(self, mapped: Optional["MappedSnapshot"]) -> bool:
+        """Replaces the mapping already open by the one given, closing it.
+
+        It must run in the thread reading the snapshot, between lookups.
+
+        Args:
+            mapped: The mapping returned by `map_current`.
+
+        Returns:
+            bool: Whether a snapshot is available. The mapping already open, if any,
+             is kept when none is given.
+        """
+        if mapped is None:
+            return self._mapping is not None
+
+        self.close()
+        self._mapping = mapped.mapping
+        self._count = mapped.count
+        self._strings_offset = _HEADER.size + mapped.count * _ENTRY.size
+        self._etag = mapped.etag
+        return True
+
+    def close(self) -> None:
+        """Unmaps the snapshot."""
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+            self._count = 0
+            self._etag = None
+
+    @property
+    def etag(self) -> Optional[str]:
+        """The version of the catalog held, if known."""
+        return self._etag
+
+    def get(self, product_id: str) -> Optional[Product]:
+        """Gets the product with the given id.
+
+        Returns:
+            Optional[Product]: The product, or None if absent from the snapshot.
+        """
+        key = product_id.encode()
+        low, high = 0, self._count
+
+        while low < high:
+            middle = (low + high) // 2
+            entry = self._entry(middle)
+            entry_id = self._string(entry[0], entry[1])
+            if entry_id == key:
+                return self._to_product(entry)
+            if entry_id < key:
+                low = middle + 1
+            else:
+                high = middle
+
+        return None
+
+    def get_many(self, product_ids: Iterable[str]) -> Dict[str, Product]:
+        """Gets the products with the given ids, leaving out the ids absent."""
+        products = {i: self.get(i) for i in dict.fromkeys(product_ids)}
+        return {i: product for i, product in products.items() if product is not None}
+
+    def __iter__(self) -> Iterator[Product]:
+        return (self._to_product(self._entry(i)) for i in range(self._count))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _entry(self, index: int) -> Tuple[int, int, int, int, float]:
+        return _ENTRY.unpack_from(self._mapping, _HEADER.size + index * _ENTRY.size)
+
+    def _string(self, offset: int, length: int) -> bytes:
+        start = self._strings_offset + offset
+        return self._mapping[start : start + length]
+
+    def _to_product(self, entry: Tuple[int, int, int, int, float]) -> Product:
+        id_offset, id_length, name_offset, name_length, price = entry
+        return Product(
+            id=self._string(id_offset, id_length).decode(),
+            name=self._string(name_offset, name_length).decode(),
+            price=price,
+        )
+
+    @staticmethod
+    def _read_header(mapping: mmap.mmap) -> Tuple[int, Optional[str]]:
+        if len(mapping) < _HEADER.size:
+            raise SnapshotFormatError("The product snapshot is truncated")
+
+        magic, version, count, etag_offset, etag_length = _HEADER.unpack_from(mapping)
+        if magic != MAGIC or version != VERSION:
+            raise SnapshotFormatError("Unsupported product snapshot format")
+        if len(mapping) < _HEADER.size + count * _ENTRY.size:
+            raise SnapshotFormatError("The product snapshot is truncated")
+
+        if not etag_length:
+            return count, None
+        start = _HEADER.size + count * _ENTRY.size + etag_offset
+        return count, mapping[start : start + etag_length].decode()
+
+
+def write_product_snapshot(
+    path: str | os.PathLike, products: Iterable[Product], etag: Optional[str] = None
+) -> None:
+    """Writes the products to a snapshot file, atomically replacing the current one.
+
+    The snapshot is written to a temporary file in the same directory, flushed to disk,
+    and then renamed over the current one, so readers either see the previous snapshot
+    or the new one, never a partial write.
+
+    Args:
+        path: The path of the snapshot file.
+        products: The products of the catalog.
+        etag: The version of the catalog, if known.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+    try:
+        with open(temporary_path, "wb") as file:
+            _write(file, products, etag)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, path)
+    finally:
+        temporary_path.unlink(missing_ok=True)
+
+
+def _write(file: BinaryIO, products: Iterable[Product], etag: Optional[str]) -> None:
+    encoded = sorted(
+        {p.id.encode(): (p.name.encode(), p.price) for p in products}.items()
+    )
+    strings = bytearray()
+    entries: List[bytes] = []
+
+    def add_string(value: bytes) -> Tuple[int, int]:
+        offset = len(strings)
+        strings.extend(value)
+        return offset, len(value)
+
+    for product_id, (name, price) in encoded:
+        entries.append(_ENTRY.pack(*add_string(product_id), *add_string(name), price))
+
+    etag_offset, etag_length = add_string(etag.encode() if etag else b"")
+    file.write(_HEADER.pack(MAGIC, VERSION, len(entries), etag_offset, etag_length))
+    file.writelines(entries)
+    file.write(strings)
+
+
+__all__ = [
+    "MappedSnapshot",
+    "ProductSnapshot",
+    "SnapshotFormatError",
+    "write_product_snapshot",
+]
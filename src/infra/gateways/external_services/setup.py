@@ -0,0 +1,58 @@
+"""External services.
+
+This module manages the lifetime of the clients used to talk to external services.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator
+
+from src.infra.gateways.external_services.catalog_refresher import CatalogRefresher
+from src.infra.gateways.external_services.product_service import ProductServiceImpl
+
+
+@asynccontextmanager
+async def initialize_product_service(
+    product_service: ProductServiceImpl,
+) -> AsyncGenerator[ProductServiceImpl, None]:
+    """Open the product service connection pool for the duration of the context.
+
+    The pool is shared by every request handled by the worker, and all of its
+    connections are closed when the context exits.
+
+    Args:
+        product_service: The product service gateway to open.
+
+    Yields:
+        ProductServiceImpl: The opened product service gateway.
+    """
+    await product_service.open()
+    try:
+        yield product_service
+    finally:
+        await product_service.close()
+
+
+@asynccontextmanager
+async def initialize_product_catalog(
+    catalog_refresher: CatalogRefresher,
+) -> AsyncGenerator[CatalogRefresher, None]:
+    """Keep the product catalog loaded in the cache for the duration of the context.
+
+    Entering the context waits for the catalog warm-up, if enabled, and starts the
+    periodic refresh, which is stopped when the context exits. The product service
+    connection pool must be open for the whole context.
+
+    Args:
+        catalog_refresher: The refresher of the product catalog.
+
+    Yields:
+        CatalogRefresher: The started catalog refresher.
+    """
+    await catalog_refresher.start()
+    try:
+        yield catalog_refresher
+    finally:
+        await catalog_refresher.stop()
+
+
+__all__ = ["initialize_product_catalog", "initialize_product_service"]
@@ -0,0 +1,66 @@
+from typing import Dict, List
+
+from src.domain.__shared.error.external_service_error import ProductLookupError
+from src.domain.__shared.interfaces.product_service import IProductService, Product
+from src.infra.gateways.external_services.product_snapshot import ProductSnapshot
+from src.infra.metrics import Metric
+
+
+class SnapshotFallbackProductService(IProductService):
+    """Falls back to the last known product catalog while the product service is down.
+
+    This is an explicit degraded mode: when the wrapped service fails with a server
+    error, including a rejection by an open circuit, the products are served from the
+    product snapshot instead, so checkouts keep being priced with the last known
+    catalog. Lookups that fail for any other reason, for products the service reported
+    as not found, or for products absent from the snapshot, still fail.
+    """
+
+    def __init__(
+        self, product_service: IProductService, snapshot: ProductSnapshot
+    ) -> None:
+        """Initializes a new instance of the SnapshotFallbackProductService class.
+
+        Args:
+            product_service: The product service used while it is available.
+            snapshot: The snapshot of the last known product catalog.
+        """
+        self._product_service = product_service
+        self._snapshot = snapshot
+        self._degraded_lookups = 0
+
+    async def fetch_product_map(self, ids: List[str]) -> Dict[str, Product]:
+        try:
+            return await self._product_service.fetch_product_map(ids)
+        except ProductLookupError as err:
+            # Products the service reported as not found are not priced from the
+            # snapshot, even when the lookup of others failed.
+            if err.status_code < 500 or err.missing_ids:
+                raise
+
+            requested_ids = list(dict.fromkeys(ids))
+            products = self._snapshot.get_many(requested_ids)
+            if any(i not in products for i in requested_ids):
+                raise
+
+            self._degraded_lookups += 1
+            return products
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the degraded mode counters as metric samples."""
+        return [
+            Metric(
+                "product_snapshot_degraded_lookups_total",
+                self._degraded_lookups,
+                "Product lookups served from the snapshot while the service failed.",
+            ),
+            Metric(
+                "product_snapshot_products",
+                len(self._snapshot),
+                "Products in the snapshot currently mapped.",
+                type="gauge",
+            ),
+        ]
+
+
+__all__ = ["SnapshotFallbackProductService"]
@@ -0,0 +1,3 @@
+from .registry import Metric, MetricsRegistry
+
+__all__ = ["Metric", "MetricsRegistry"]
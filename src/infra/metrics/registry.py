@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Literal
+
+
+@dataclass(frozen=True, slots=True)
+class Metric:
+    """A single metric sample.
+
+    Attributes:
+        name: The metric name, following the Prometheus naming conventions.
+        value: The current value.
+        description: A short description of what is measured.
+        type: Whether the value only grows (counter) or goes up and down (gauge).
+    """
+
+    name: str
+    value: float
+    description: str
+    type: Literal["counter", "gauge"] = "counter"
+
+
+class MetricsRegistry:
+    """Collects the metrics exposed by the application components.
+
+    Components register a collector, called every time the metrics are scraped, so the
+    values are always read at scrape time.
+    """
+
+    def __init__(self) -> None:
+        self._collectors: List[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """Registers a callable returning the current metric samples."""
+        self._collectors.append(collector)
+
+    def collect(self) -> List[Metric]:
+        """Returns the current samples of every registered collector."""
+        return [metric for collector in self._collectors for metric in collector()]
+
+    def render(self) -> str:
+        """Renders the current samples in the Prometheus text exposition format."""
+        lines = []
+        for metric in self.collect():
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.append(f"{metric.name} {metric.value}")
+        return "\n".join(lines) + "\n"
+
+
+__all__ = ["Metric", "MetricsRegistry"]
@@ -0,0 +1,3 @@
+from .outbox_dispatcher import OutboxDispatcher, initialize_outbox_dispatcher
+
+__all__ = ["OutboxDispatcher", "initialize_outbox_dispatcher"]
@@ -0,0 +1,183 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, List, Optional
+
+from src.domain.order.outbox import IOrderEventHandler, IOrderOutbox, OutboxDelivery
+from src.infra.metrics import Metric
+
+
+class OutboxDispatcher:
+    """Delivers the pending order events of the outbox to a handler, in the background.
+
+    A poller leases the pending events in batches and queues them for a fixed pool of
+    workers. The queue is bounded: while it is full, the poller waits for room instead
+    of leasing more events than the workers can handle before the leases expire.
+
+    Delivery is at least once. The events of an order are acknowledged once all of
+    them are handled; if any fails, or the worker dies, they are delivered again when
+    their lease expires.
+    """
+
+    def __init__(
+        self,
+        outbox: IOrderOutbox,
+        handler: IOrderEventHandler,
+        workers: int = 4,
+        batch_size: int = 100,
+        queue_size: int = 200,
+        poll_interval: float = 1.0,
+        lease_duration: float = 30.0,
+    ) -> None:
+        """Initializes a new instance of the OutboxDispatcher class.
+
+        Args:
+            outbox: The outbox the pending events are leased from.
+            handler: The handler the events are delivered to.
+            workers: The number of orders whose events are handled concurrently.
+            batch_size: The maximum number of orders whose events are leased at once.
+            queue_size: The maximum number of leased deliveries waiting for a worker.
+            poll_interval: For how long, in seconds, the poller waits when the
+             outbox is empty, or fails to be read.
+            lease_duration: For how long, in seconds, leased events are not delivered
+             again.
+        """
+        if queue_size < 1:
+            raise ValueError("The queue must hold at least one delivery")
+
+        self._outbox = outbox
+        self._handler = handler
+        self._worker_count = workers
+        self._batch_size = batch_size
+        self._queue: asyncio.Queue[OutboxDelivery] = asyncio.Queue(maxsize=queue_size)
+        self._room = asyncio.Event()
+        self._poll_interval = poll_interval
+        self._lease_duration = lease_duration
+        self._poller: Optional[asyncio.Task] = None
+        self._workers: List[asyncio.Task] = []
+        self._delivered = 0
+        self._failed = 0
+
+    async def start(self) -> None:
+        """Starts the poller and the workers."""
+        if self._poller is None and self._worker_count > 0:
+            self._poller = asyncio.create_task(self._poll())
+            self._workers = [
+                asyncio.create_task(self._work()) for _ in range(self._worker_count)
+            ]
+
+    async def stop(self) -> None:
+        """Stops the poller and the workers.
+
+        Deliveries not acknowledged yet are made again once their lease expires.
+        """
+        tasks = [self._poller, *self._workers] if self._poller else []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._poller = None
+        self._workers = []
+
+    async def dispatch(self) -> int:
+        """Leases a batch of pending events and queues them for the workers.
+
+        Waits for room in the queue first, so no more events are leased than the
+        workers can take.
+
+        Returns:
+            int: The number of deliveries queued.
+        """
+        await self._wait_for_room()
+        room = self._queue.maxsize - self._queue.qsize()
+        deliveries = await self._outbox.claim(
+            min(self._batch_size, room), self._lease_duration
+        )
+        for delivery in deliveries:
+            self._queue.put_nowait(delivery)
+        return len(deliveries)
+
+    async def deliver(self, delivery: OutboxDelivery) -> bool:
+        """Hands the events of an order to the handler, then acknowledges them.
+
+        Returns:
+            bool: Whether the events were handled and acknowledged.
+        """
+        try:
+            for event in delivery.events:
+                await self._handler.handle(event)
+            acknowledged = await self._outbox.acknowledge(delivery)
+        except Exception:
+            acknowledged = False
+
+        if acknowledged:
+            self._delivered += len(delivery.events)
+        else:
+            self._failed += 1
+        return acknowledged
+
+    def collect_metrics(self) -> List[Metric]:
+        """Returns the delivery counters as metric samples."""
+        return [
+            Metric(
+                "order_outbox_delivered_events_total",
+                self._delivered,
+                "Order events handled and acknowledged.",
+            ),
+            Metric(
+                "order_outbox_failed_deliveries_total",
+                self._failed,
+                "Deliveries of order events left to be made again.",
+            ),
+            Metric(
+                "order_outbox_queue_depth",
+                self._queue.qsize(),
+                "Leased deliveries waiting for a worker.",
+                type="gauge",
+            ),
+        ]
+
+    async def _poll(self) -> None:
+        while True:
+            try:
+                queued = await self.dispatch()
+            except Exception:
+                queued = 0
+            if not queued:
+                await asyncio.sleep(self._poll_interval)
+
+    async def _work(self) -> None:
+        while True:
+            delivery = await self._queue.get()
+            self._room.set()
+            try:
+                await self.deliver(delivery)
+            finally:
+                self._queue.task_done()
+
+    async def _wait_for_room(self) -> None:
+        while self._queue.full():
+            self._room.clear()
+            await self._room.wait()
+
+
+@asynccontextmanager
+async def initialize_outbox_dispatcher(
+    outbox_dispatcher: OutboxDispatcher,
+) -> AsyncGenerator[OutboxDispatcher, None]:
+    """Deliver the pending order events for the duration of the context.
+
+    The database must be available for the whole context.
+
+    Args:
+        outbox_dispatcher: The dispatcher of the order events.
+
+    Yields:
+        OutboxDispatcher: The started dispatcher.
+    """
+    await outbox_dispatcher.start()
+    try:
+        yield outbox_dispatcher
+    finally:
+        await outbox_dispatcher.stop()
+
+
+__all__ = ["OutboxDispatcher", "initialize_outbox_dispatcher"]
@@ -0,0 +1,3 @@
+from .hmac_quote_signer import HmacQuoteSigner
+
+__all__ = ["HmacQuoteSigner"]
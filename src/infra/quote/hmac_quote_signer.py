@@ -0,0 +1,86 @@
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from src.domain.__shared.interfaces.product_service import Product
+from src.domain.order.quote import IQuoteSigner, PriceQuote
+
+
+class HmacQuoteSigner(IQuoteSigner):
+    """Signs price quotes with HMAC-SHA256.
+
+    A token is the URL-safe base64 of the JSON quote, followed by a dot and the
+    URL-safe base64 of its signature. The quote is readable by anyone, but cannot be
+    changed without the secret.
+
+    Every worker verifying the tokens must share the secret.
+    """
+
+    def __init__(
+        self,
+        secret: bytes,
+        clock: Callable[[], datetime] = lambda: datetime.now(timezone.utc),
+    ) -> None:
+        """Initializes a new instance of the HmacQuoteSigner class.
+
+        Args:
+            secret: The key the quotes are signed with.
+            clock: The clock the quotes are expired with.
+        """
+        if not secret:
+            raise ValueError("The secret must not be empty")
+
+        self._secret = secret
+        self._clock = clock
+
+    def sign(self, quote: PriceQuote) -> str:
+        payload = json.dumps(
+            {
+                "products": [
+                    [product.id, product.name, product.price]
+                    for product in quote.products.values()
+                ],
+                "expires_at": quote.expires_at.timestamp(),
+            },
+            separators=(",", ":"),
+        ).encode()
+        return f"{self._encode(payload)}.{self._encode(self._digest(payload))}"
+
+    def verify(self, token: str) -> Optional[PriceQuote]:
+        try:
+            encoded_payload, encoded_signature = token.split(".")
+            payload = self._decode(encoded_payload)
+            signature = self._decode(encoded_signature)
+        except (ValueError, binascii.Error):
+            return None
+
+        if not hmac.compare_digest(signature, self._digest(payload)):
+            return None
+
+        content = json.loads(payload)
+        quote = PriceQuote(
+            products={
+                product_id: Product(id=product_id, name=name, price=price)
+                for product_id, name, price in content["products"]
+            },
+            expires_at=datetime.fromtimestamp(content["expires_at"], timezone.utc),
+        )
+        return quote if quote.expires_at > self._clock() else None
+
+    def _digest(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()
+
+    @staticmethod
+    def _encode(data: bytes) -> str:
+        return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+    @staticmethod
+    def _decode(data: str) -> bytes:
+        return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+__all__ = ["HmacQuoteSigner"]
@@ -0,0 +1,4 @@
+from .circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from .hedging import RequestHedger
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "CircuitState", "RequestHedger"]
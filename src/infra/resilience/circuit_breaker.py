@@ -0,0 +1,152 @@
+import time
+from collections import deque
+from enum import StrEnum
+from typing import Callable, Deque, Tuple
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open."""
+
+
+class CircuitBreaker:
+    """Stops calling a dependency that keeps failing or answering slowly.
+
+    The outcome of the latest calls is kept in a rolling window. Once the window holds
+    enough calls and either the failure rate or the slow call rate reaches its
+    threshold, the circuit opens and calls are rejected right away, without waiting for
+    the dependency to time out.
+
+    After `open_duration` seconds the circuit becomes half-open and lets a single probe
+    call through: the circuit closes again if it succeeds, and reopens otherwise.
+
+    The breaker is not thread-safe. It is meant to be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float = 2.0,
+        slow_call_rate_threshold: float = 1.0,
+        open_duration: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initializes a new instance of the CircuitBreaker class.
+
+        Args:
+            window_size: The number of latest calls whose outcome is considered.
+            minimum_calls: The number of calls needed before the circuit may open.
+            failure_rate_threshold: The failure rate, from 0 to 1, opening the circuit.
+            slow_call_duration: The duration, in seconds, above which a call is slow.
+            slow_call_rate_threshold: The slow call rate, from 0 to 1, opening the
+             circuit.
+            open_duration: For how long, in seconds, the circuit stays open before
+             letting a probe call through.
+            clock: The monotonic clock used to time the open state.
+        """
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._minimum_calls = minimum_calls
+        self._failure_rate_threshold = failure_rate_threshold
+        self._slow_call_duration = slow_call_duration
+        self._slow_call_rate_threshold = slow_call_rate_threshold
+        self._open_duration = open_duration
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.rejected_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state of the circuit."""
+        if (
+            self._state == CircuitState.OPEN
+            and self._clock() - self._opened_at >= self._open_duration
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+    def acquire(self) -> bool:
+        """Asks permission to make a call.
+
+        Every permitted call must have its outcome reported with `record`, or be
+        reported as abandoned with `release`.
+
+        Returns:
+            bool: Whether the call is the probe of a half-open circuit.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with its probe call
+             already in flight.
+        """
+        state = self.state
+
+        if state == CircuitState.CLOSED:
+            return False
+        if state == CircuitState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        self.rejected_calls += 1
+        raise CircuitOpenError("The circuit is open")
+
+    def record(self, duration: float, failed: bool, probe: bool = False) -> None:
+        """Reports the outcome of a permitted call.
+
+        Args:
+            duration: How long the call took, in seconds.
+            failed: Whether the call failed.
+            probe: Whether the call was the probe of a half-open circuit.
+        """
+        slow = duration >= self._slow_call_duration
+
+        if probe:
+            self._probing = False
+            if failed or slow:
+                self._open()
+            else:
+                self._close()
+            return
+
+        self._outcomes.append((failed, slow))
+        if self._state == CircuitState.CLOSED and self._should_open():
+            self._open()
+
+    def release(self, probe: bool = False) -> None:
+        """Reports that a permitted call was abandoned before its outcome was known.
+
+        Args:
+            probe: Whether the call was the probe of a half-open circuit.
+        """
+        if probe:
+            self._probing = False
+
+    def _should_open(self) -> bool:
+        calls = len(self._outcomes)
+        if calls < self._minimum_calls:
+            return False
+
+        failures = sum(failed for failed, _ in self._outcomes)
+        slow_calls = sum(slow for _, slow in self._outcomes)
+        return (
+            failures / calls >= self._failure_rate_threshold
+            or slow_calls / calls >= self._slow_call_rate_threshold
+        )
+
+    def _open(self) -> None:
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock()
+
+    def _close(self) -> None:
+        self._state = CircuitState.CLOSED
+        self._outcomes.clear()
+
+
+__all__ = ["CircuitBreaker", "CircuitOpenError", "CircuitState"]
@@ -0,0 +1,115 @@
+import asyncio
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional, Set
+
+
+class RequestHedger:
+    """Sends a duplicate of a slow request and keeps the first response.
+
+    The latency of the latest requests is kept in a rolling window. A request still
+    running once the configured percentile of that window has elapsed is sent again,
+    and whichever copy answers first wins; the other one is cancelled. Hedging only
+    starts once the window holds enough samples, and must only be used for idempotent
+    requests.
+
+    The duplicate takes a slot of the concurrency limiter of the caller, if given, so
+    hedging never exceeds it: no duplicate is sent while the limiter is full.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        window_size: int = 200,
+        min_samples: int = 20,
+    ) -> None:
+        """Initializes a new instance of the RequestHedger class.
+
+        Args:
+            percentile: The latency percentile, from 0 to 1, after which a request is
+             hedged.
+            min_delay: The minimum delay, in seconds, before a request is hedged.
+            window_size: The number of latest latencies considered.
+            min_samples: The number of latencies needed before requests are hedged.
+        """
+        self._latencies: Deque[float] = deque(maxlen=window_size)
+        self._percentile = percentile
+        self._min_delay = min_delay
+        self._min_samples = min_samples
+        self.hedged_requests = 0
+
+    def record(self, latency: float) -> None:
+        """Records the latency of a request, in seconds."""
+        self._latencies.append(latency)
+
+    @property
+    def delay(self) -> Optional[float]:
+        """The delay before a request is hedged, or None without enough samples."""
+        if len(self._latencies) < self._min_samples:
+            return None
+
+        latencies = sorted(self._latencies)
+        index = min(int(len(latencies) * self._percentile), len(latencies) - 1)
+        return max(latencies[index], self._min_delay)
+
+    async def run[T](
+        self,
+        send: Callable[[], Awaitable[T]],
+        limiter: Optional[asyncio.Semaphore] = None,
+    ) -> T:
+        """Sends the request, hedging it if it is slower than usual.
+
+        Args:
+            send: Sends one copy of the request.
+            limiter: The concurrency limiter the request holds a slot of, if any.
+             The duplicate waits for a slot of its own.
+
+        Returns:
+            T: The first successful response, or the error of the last copy to fail.
+        """
+        if (delay := self.delay) is None:
+            return await send()
+
+        tasks: Set[asyncio.Task[T]] = {asyncio.ensure_future(send())}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done and (limiter is None or not limiter.locked()):
+                self.hedged_requests += 1
+                tasks.add(asyncio.ensure_future(self._send_limited(send, limiter)))
+            return await self._first_success(tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+                # The losing copies are never awaited: their errors are retrieved
+                # here, instead of being logged as never retrieved.
+                task.add_done_callback(_retrieve_exception)
+
+    @staticmethod
+    async def _send_limited[T](
+        send: Callable[[], Awaitable[T]], limiter: Optional[asyncio.Semaphore]
+    ) -> T:
+        if limiter is None:
+            return await send()
+        async with limiter:
+            return await send()
+
+    @staticmethod
+    async def _first_success[T](tasks: Set[asyncio.Task[T]]) -> T:
+        pending = set(tasks)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+            if not pending:
+                return done.pop().result()
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+__all__ = ["RequestHedger"]
@@ -0,0 +1,27 @@
+import asyncio
+
+import httpx
+from fastapi import FastAPI
+
+from src.application.api.middlewares import setup_server_timing
+from src.application.instrumentation import measure_stage
+
+
+async def test_server_timing_header_lists_every_stage():
+    app = FastAPI()
+    setup_server_timing(app)
+
+    @app.get("/")
+    async def handler() -> dict:
+        async with asyncio.TaskGroup() as group:
+            group.create_task(measure_stage("first", asyncio.sleep(0.01)))
+            group.create_task(measure_stage("second", asyncio.sleep(0)))
+        return {}
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/")
+
+    metrics = [m.split(";")[0] for m in response.headers["Server-Timing"].split(", ")]
+    assert sorted(metrics) == ["first", "second", "total"]
@@ -6,22 +6,21 @@ from src.application.use_cases.customer.get_by_cpf.get_customer_by_cpf_use_case
     GetCustomerByCpfUseCase,
 )
 from src.application.use_cases.customer.get_by_cpf.dto import CustomerDTO
-from src.domain.__shared.value_objects import CPF, EmailAddress
-from src.domain.customer import Customer, ICustomerRepository
+from src.domain.__shared.value_objects import CPF, ExternalEntityId
+from src.domain.customer import CustomerIdentity, ICustomerRepository
 from src.domain.customer_error import CustomerNotFoundError
-from tests.__providers import UniqueEntityIdProvider
 
 
 async def test_execute_returns_customer_dto_when_customer_found():
-    customer = Customer(
-        _id=UniqueEntityIdProvider().generate_unique_entity_id(),
+    customer = CustomerIdentity(
+        external_id=str(ExternalEntityId()),
         name="John Doe",
-        email=EmailAddress(address="some@example.com"),
-        cpf=CPF(number="10856446696"),
+        email="some@example.com",
+        cpf="10856446696",
         created_at=datetime.now(),
     )
     mock_repository = AsyncMock(ICustomerRepository)
-    mock_repository.get_by_cpf.return_value = customer
+    mock_repository.find_identity_by_cpf.return_value = customer
 
     use_case = GetCustomerByCpfUseCase(customer_repository=mock_repository)
     result = await use_case.execute(cpf="10856446696")
@@ -31,13 +30,16 @@ async def test_execute_returns_customer_dto_when_customer_found():
         cpf=customer.cpf,
         email=customer.email,
         created_at=customer.created_at,
-        external_id=str(customer.external_id),
+        external_id=customer.external_id,
+    )
+    mock_repository.find_identity_by_cpf.assert_awaited_once_with(
+        CPF(number="10856446696")
     )
 
 
 async def test_execute_raises_customer_not_found_error_when_customer_not_found():
     mock_repository = AsyncMock(ICustomerRepository)
-    mock_repository.get_by_cpf.return_value = None
+    mock_repository.find_identity_by_cpf.return_value = None
 
     use_case = GetCustomerByCpfUseCase(customer_repository=mock_repository)
 
@@ -0,0 +1,198 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.order.checkout.checkout import CheckoutUseCase
+from src.application.use_cases.order.checkout.checkout_dispatcher import (
+    CheckoutDispatcher,
+    CheckoutQueueFullError,
+    initialize_checkout_dispatcher,
+)
+from src.application.use_cases.order.checkout.dto import (
+    CheckedOutOrderDTO,
+    CheckoutItemDTO,
+    CheckoutOrderDTO,
+    CheckoutProgress,
+)
+from src.domain.__shared.interfaces import IProductService
+from src.domain.__shared.interfaces.product_service import Product
+from src.domain.__shared.value_objects import ExternalEntityId
+from src.domain.customer import ICustomerIdResolver
+from src.domain.customer_error import CustomerNotFoundError
+from src.domain.order import Order
+from src.domain.order.error import EmptyOrderError
+from src.domain.order.order_item import OrderItem
+from src.domain.order.quote import PriceQuote
+from src.domain.order.repository import IOrderRepository
+from src.infra.cache import TTLCache
+from src.infra.quote import HmacQuoteSigner
+from tests.__providers import UniqueEntityIdProvider
+
+
+def create_order(external_id: ExternalEntityId) -> Order:
+    return Order(
+        external_id=external_id,
+        customer_id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        items=[OrderItem(product_id="1", quantity=2, value=25.0)],
+    )
+
+
+def create_dispatcher(
+    release: asyncio.Event | None = None,
+    **kwargs,  # noqa: ANN003
+) -> CheckoutDispatcher:
+    async def checkout(request, idempotency_key, external_id):  # noqa: ANN001, ANN202
+        if release is not None:
+            await release.wait()
+        return CheckedOutOrderDTO.from_entity(create_order(external_id))
+
+    checkout_use_case_mock = AsyncMock(spec=CheckoutUseCase)
+    checkout_use_case_mock.assign_external_id.side_effect = (
+        lambda *_: ExternalEntityId()
+    )
+    checkout_use_case_mock.checkout.side_effect = checkout
+
+    return CheckoutDispatcher(
+        checkout_use_case=checkout_use_case_mock,
+        order_repository=AsyncMock(spec=IOrderRepository),
+        statuses=TTLCache(max_entries=100, ttl=60),
+        **kwargs,
+    )
+
+
+def create_request(*product_ids: str) -> CheckoutOrderDTO:
+    return CheckoutOrderDTO(
+        customer_id="customer",
+        items=[CheckoutItemDTO(product_id=i, quantity=2) for i in product_ids],
+    )
+
+
+async def test_submitted_checkout_is_performed_in_the_background():
+    release = asyncio.Event()
+    dispatcher = create_dispatcher(release)
+
+    async with initialize_checkout_dispatcher(dispatcher):
+        accepted = await dispatcher.submit(create_request("1"))
+        await asyncio.sleep(0)
+        processing = await dispatcher.get_status(accepted.external_id)
+        release.set()
+
+    completed = await dispatcher.get_status(accepted.external_id)
+
+    assert accepted.progress == CheckoutProgress.ACCEPTED
+    assert processing.progress == CheckoutProgress.PROCESSING
+    assert completed.progress == CheckoutProgress.COMPLETED
+    assert completed.order.external_id == accepted.external_id
+    assert completed.order.total_value == 50.0
+
+
+async def test_quoted_checkout_is_priced_from_its_quote():
+    quote_signer = HmacQuoteSigner(secret=b"secret")
+    burger = Product(id="1", name="X-Burger", price=20.0)
+    quote_token = quote_signer.sign(
+        PriceQuote(
+            products={burger.id: burger},
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=60),
+        )
+    )
+    order_repository_mock = AsyncMock(spec=IOrderRepository)
+    order_repository_mock.insert.side_effect = lambda order: order
+    product_service_mock = AsyncMock(spec=IProductService)
+    customer_id_resolver_mock = AsyncMock(spec=ICustomerIdResolver)
+    customer_id_resolver_mock.resolve.return_value = (
+        UniqueEntityIdProvider.generate_unique_entity_id()
+    )
+    dispatcher = CheckoutDispatcher(
+        checkout_use_case=CheckoutUseCase(
+            order_repository=order_repository_mock,
+            customer_id_resolver=customer_id_resolver_mock,
+            product_service=product_service_mock,
+            quote_signer=quote_signer,
+        ),
+        order_repository=order_repository_mock,
+        statuses=TTLCache(max_entries=100, ttl=60),
+    )
+    request = CheckoutOrderDTO(
+        customer_id="customer",
+        items=[CheckoutItemDTO(product_id="1", quantity=2)],
+        quote_token=quote_token,
+    )
+
+    async with initialize_checkout_dispatcher(dispatcher):
+        accepted = await dispatcher.submit(request)
+
+    completed = await dispatcher.get_status(accepted.external_id)
+
+    assert completed.progress == CheckoutProgress.COMPLETED
+    assert completed.order.total_value == 40.0
+    product_service_mock.fetch_product_map.assert_not_awaited()
+
+
+async def test_failed_checkout_reports_its_error():
+    dispatcher = create_dispatcher()
+    error = CustomerNotFoundError(search_params={"external_id": "customer"})
+    dispatcher._checkout_use_case.checkout.side_effect = error
+
+    async with initialize_checkout_dispatcher(dispatcher):
+        accepted = await dispatcher.submit(create_request("1"))
+
+    failed = await dispatcher.get_status(accepted.external_id)
+
+    assert failed.progress == CheckoutProgress.FAILED
+    assert failed.error is error
+
+
+async def test_submit_validates_the_request_before_accepting_it():
+    dispatcher = create_dispatcher()
+
+    async with initialize_checkout_dispatcher(dispatcher):
+        with pytest.raises(EmptyOrderError):
+            await dispatcher.submit(create_request())
+
+    dispatcher._checkout_use_case.checkout.assert_not_awaited()
+
+
+async def test_submit_refuses_checkouts_when_the_queue_is_full():
+    release = asyncio.Event()
+    dispatcher = create_dispatcher(release, workers=1, queue_size=1)
+
+    async with initialize_checkout_dispatcher(dispatcher):
+        await dispatcher.submit(create_request("1"))
+        await asyncio.sleep(0)
+        await dispatcher.submit(create_request("1"))
+
+        with pytest.raises(CheckoutQueueFullError):
+            await dispatcher.submit(create_request("1"))
+        release.set()
+
+    assert {m.name: m.value for m in dispatcher.collect_metrics()} == {
+        "checkout_queue_depth": 0,
+        "checkout_queue_rejected_total": 1,
+    }
+
+
+async def test_get_status_reads_completed_orders_from_the_repository():
+    dispatcher = create_dispatcher()
+    external_id = ExternalEntityId()
+    summary = CheckedOutOrderDTO.from_entity(create_order(external_id)).summarize()
+    dispatcher._order_repository.find_summary_by_external_id.return_value = summary
+
+    status = await dispatcher.get_status(str(external_id))
+
+    assert status.progress == CheckoutProgress.COMPLETED
+    assert status.order == summary
+    dispatcher._order_repository.find_by_external_id.assert_not_awaited()
+
+
+async def test_get_status_returns_none_for_unknown_checkouts():
+    dispatcher = create_dispatcher()
+    dispatcher._order_repository.find_summary_by_external_id.return_value = None
+
+    assert await dispatcher.get_status(str(ExternalEntityId())) is None
+
+
+async def test_submit_requires_the_workers_to_be_started():
+    with pytest.raises(RuntimeError):
+        await create_dispatcher().submit(create_request("1"))
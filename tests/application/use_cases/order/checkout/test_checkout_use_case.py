@@ -0,0 +1,424 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.instrumentation import collect_stage_timings
+from src.application.use_cases.order.checkout.checkout import CheckoutUseCase
+from src.application.use_cases.order.checkout.dto import (
+    CheckoutItemDTO,
+    CheckoutOrderDTO,
+)
+from src.domain.__shared.error.external_service_error import ProductLookupError
+from src.domain.__shared.error import DeadlineExceededError
+from src.domain.__shared.error.repository_error import DuplicateKeyError
+from src.domain.__shared.interfaces import (
+    IdempotencyRecord,
+    IIdempotencyStore,
+    IProductService,
+)
+from src.domain.__shared.interfaces.product_service import Product
+from src.domain.__shared.value_objects import (
+    CPF,
+    EmailAddress,
+    ExternalEntityId,
+    UniqueEntityId,
+)
+from src.domain.customer import Customer
+from src.domain.customer import ICustomerIdResolver
+from src.domain.customer_error import CustomerNotFoundError
+from src.domain.order.error import (
+    EmptyOrderError,
+    IdempotencyKeyReusedError,
+    OrderCreationFailedDueToMissingProductsError,
+)
+from src.domain.order import Order
+from src.domain.order.order_item import OrderItem
+from src.domain.order.quote import PriceQuote
+from src.domain.order.repository import IOrderRepository
+from src.infra.deadline import deadline_scope
+from src.infra.quote import HmacQuoteSigner
+from tests.__providers import CPFProvider, UniqueEntityIdProvider
+
+BURGER = Product(id="1", name="X-Burger", price=25.0)
+FRIES = Product(id="2", name="Fries", price=12.5)
+
+
+def create_customer() -> Customer:
+    return Customer(
+        _id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        name="John Doe",
+        email=EmailAddress(address="john@example.com"),
+        cpf=CPF(number=CPFProvider.generate_cpf_number()),
+    )
+
+
+def create_use_case(
+    customer: Customer | None = None,
+    products: Dict[str, Product] | None = None,
+    delay: float = 0.0,
+) -> CheckoutUseCase:
+    async def resolve(external_id: str) -> UniqueEntityId | None:
+        await asyncio.sleep(delay)
+        return customer.id if customer else None
+
+    async def fetch_product_map(ids: List[str]) -> Dict[str, Product]:
+        await asyncio.sleep(delay)
+        return {i: products[i] for i in ids if i in (products or {})}
+
+    async def resolve_many(external_ids: List[str]) -> Dict[str, UniqueEntityId]:
+        await asyncio.sleep(delay)
+        return {i: customer.id for i in external_ids if customer and i != "unknown"}
+
+    orders: Dict[str, Order] = {}
+
+    async def insert(order):  # noqa: ANN001, ANN202
+        orders[str(order.external_id)] = order
+        return order
+
+    async def find_by_external_id(external_id):  # noqa: ANN001, ANN202
+        return orders.get(str(external_id))
+
+    async def insert_many(orders):  # noqa: ANN001, ANN202
+        return list(orders)
+
+    customer_id_resolver_mock = AsyncMock(spec=ICustomerIdResolver)
+    customer_id_resolver_mock.resolve.side_effect = resolve
+    customer_id_resolver_mock.resolve_many.side_effect = resolve_many
+    product_service_mock = AsyncMock(spec=IProductService)
+    product_service_mock.fetch_product_map.side_effect = fetch_product_map
+    order_repository_mock = AsyncMock(spec=IOrderRepository)
+    order_repository_mock.insert.side_effect = insert
+    order_repository_mock.find_by_external_id.side_effect = find_by_external_id
+    order_repository_mock.insert_many.side_effect = insert_many
+
+    return CheckoutUseCase(
+        order_repository=order_repository_mock,
+        customer_id_resolver=customer_id_resolver_mock,
+        product_service=product_service_mock,
+        idempotency_store=create_idempotency_store(),
+        quote_signer=HmacQuoteSigner(secret=b"secret"),
+    )
+
+
+def create_idempotency_store() -> IIdempotencyStore:
+    records: Dict[str, IdempotencyRecord] = {}
+
+    async def get(key: str) -> IdempotencyRecord | None:
+        return records.get(key)
+
+    async def save(record: IdempotencyRecord) -> IdempotencyRecord:
+        return records.setdefault(record.key, record)
+
+    idempotency_store_mock = AsyncMock(spec=IIdempotencyStore)
+    idempotency_store_mock.get.side_effect = get
+    idempotency_store_mock.save.side_effect = save
+    return idempotency_store_mock
+
+
+def create_request(
+    *product_ids: str, customer_id: str = "customer", quote_token: str | None = None
+) -> CheckoutOrderDTO:
+    return CheckoutOrderDTO(
+        customer_id=customer_id,
+        items=[CheckoutItemDTO(product_id=i, quantity=2) for i in product_ids],
+        quote_token=quote_token,
+    )
+
+
+def create_quote_token(*products: Product, ttl: float = 60) -> str:
+    return HmacQuoteSigner(secret=b"secret").sign(
+        PriceQuote(
+            products={product.id: product for product in products},
+            expires_at=datetime.now(timezone.utc) + timedelta(seconds=ttl),
+        )
+    )
+
+
+async def test_checkout_prices_the_order():
+    customer = create_customer()
+    use_case = create_use_case(customer, {"1": BURGER, "2": FRIES})
+
+    result = await use_case.checkout(create_request("1", "2"))
+
+    assert result.customer_id == str(customer.id)
+    assert result.total_value == 75.0
+    assert [item.unit_price for item in result.items] == [25.0, 12.5]
+
+
+async def test_checkout_looks_up_customer_and_products_concurrently():
+    use_case = create_use_case(create_customer(), {"1": BURGER}, delay=0.05)
+
+    with collect_stage_timings() as timings:
+        started = asyncio.get_running_loop().time()
+        await use_case.checkout(create_request("1"))
+        elapsed = asyncio.get_running_loop().time() - started
+
+    assert set(timings) == {"customer", "products", "insert"}
+    assert elapsed < 0.09
+
+
+async def test_missing_customer_takes_precedence_over_missing_products():
+    use_case = create_use_case(None, {})
+
+    with pytest.raises(CustomerNotFoundError):
+        await use_case.checkout(create_request("1"))
+
+
+async def test_missing_customer_takes_precedence_over_empty_order():
+    use_case = create_use_case(None, {})
+
+    with pytest.raises(CustomerNotFoundError):
+        await use_case.checkout(create_request())
+
+
+async def test_checkout_raises_when_order_is_empty():
+    use_case = create_use_case(create_customer(), {})
+
+    with pytest.raises(EmptyOrderError):
+        await use_case.checkout(create_request())
+
+
+async def test_checkout_raises_when_products_are_missing():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+
+    with pytest.raises(OrderCreationFailedDueToMissingProductsError) as exc_info:
+        await use_case.checkout(create_request("1", "3", "4", "3"))
+
+    assert exc_info.value.missing_product_ids == ["3", "4"]
+
+
+async def test_failed_product_lookup_cancels_the_customer_lookup():
+    cancelled = asyncio.Event()
+
+    async def slow_resolve(external_id: str) -> UniqueEntityId | None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    use_case = create_use_case()
+    use_case._customer_id_resolver.resolve.side_effect = slow_resolve
+    use_case._product_service.fetch_product_map.side_effect = ProductLookupError(
+        failed_ids=["1"], status_code=503
+    )
+
+    with pytest.raises(ProductLookupError):
+        await use_case.checkout(create_request("1"))
+
+    assert cancelled.is_set()
+
+
+async def test_checkout_many_shares_the_lookups_between_orders():
+    customer = create_customer()
+    use_case = create_use_case(customer, {"1": BURGER, "2": FRIES})
+
+    outcomes = await use_case.checkout_many(
+        [create_request("1", "2"), create_request("2"), create_request("1")]
+    )
+
+    assert [outcome.order.total_value for outcome in outcomes] == [75.0, 25.0, 50.0]
+    assert all(outcome.error is None for outcome in outcomes)
+    use_case._customer_id_resolver.resolve_many.assert_awaited_once()
+    use_case._product_service.fetch_product_map.assert_awaited_once_with(["1", "2"])
+    use_case._order_repository.insert_many.assert_awaited_once()
+
+
+async def test_checkout_many_reports_the_error_of_each_failed_order():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+
+    outcomes = await use_case.checkout_many(
+        [
+            create_request("1", customer_id="unknown"),
+            create_request(),
+            create_request("1", "3"),
+            create_request("1"),
+        ]
+    )
+
+    assert isinstance(outcomes[0].error, CustomerNotFoundError)
+    assert isinstance(outcomes[1].error, EmptyOrderError)
+    assert isinstance(outcomes[2].error, OrderCreationFailedDueToMissingProductsError)
+    assert outcomes[3].order.total_value == 50.0
+    assert [outcome.order for outcome in outcomes[:3]] == [None] * 3
+    (orders,) = use_case._order_repository.insert_many.await_args.args
+    assert len(orders) == 1
+
+
+async def test_checkout_many_reports_orders_that_could_not_be_persisted():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+    duplicate = DuplicateKeyError()
+
+    async def insert_many(orders):  # noqa: ANN001, ANN202
+        return [duplicate, orders[1]]
+
+    use_case._order_repository.insert_many.side_effect = insert_many
+
+    outcomes = await use_case.checkout_many([create_request("1"), create_request("1")])
+
+    assert outcomes[0].error is duplicate
+    assert outcomes[1].order.total_value == 50.0
+
+
+async def test_checkout_retry_returns_the_original_order():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+    orders = {}
+
+    async def insert(order):  # noqa: ANN001, ANN202
+        orders[str(order.external_id)] = order
+        return order
+
+    async def find_order(external_id: str):  # noqa: ANN202
+        return orders.get(str(external_id))
+
+    use_case._order_repository.insert.side_effect = insert
+    use_case._order_repository.find_by_external_id.side_effect = find_order
+
+    first = await use_case.checkout(create_request("1"), idempotency_key="key")
+    retry = await use_case.checkout(create_request("1"), idempotency_key="key")
+
+    assert retry == first
+    use_case._order_repository.insert.assert_awaited_once()
+    use_case._product_service.fetch_product_map.assert_awaited_once()
+
+
+async def test_checkout_reserves_the_order_number_with_the_idempotency_key():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+
+    first = await use_case.checkout(create_request("1"), idempotency_key="key")
+    second = await use_case.checkout(create_request("1"), idempotency_key="key")
+    other = await use_case.checkout(create_request("1"), idempotency_key="other")
+
+    assert first.external_id == second.external_id != other.external_id
+
+
+async def test_concurrent_retry_returns_the_order_created_first():
+    customer = create_customer()
+    first_use_case = create_use_case(customer, {"1": BURGER})
+    existing = await first_use_case.checkout(create_request("1"), idempotency_key="key")
+    use_case = create_use_case(customer, {"1": BURGER})
+    use_case._idempotency_store = first_use_case._idempotency_store
+    use_case._order_repository.insert.side_effect = DuplicateKeyError()
+    # The order is not created yet when looked up, but is by the time it is inserted.
+    use_case._order_repository.find_by_external_id.side_effect = [
+        None,
+        Order(
+            customer_id=customer.id,
+            items=[OrderItem(product_id="1", quantity=2, value=25.0)],
+            external_id=ExternalEntityId(existing.external_id),
+        ),
+    ]
+
+    result = await use_case.checkout(create_request("1"), idempotency_key="key")
+
+    assert result.external_id == existing.external_id
+
+
+async def test_checkout_raises_when_idempotency_key_is_reused():
+    use_case = create_use_case(create_customer(), {"1": BURGER, "2": FRIES})
+    await use_case.checkout(create_request("1"), idempotency_key="key")
+
+    with pytest.raises(IdempotencyKeyReusedError):
+        await use_case.checkout(create_request("2"), idempotency_key="key")
+
+
+async def test_checkout_creates_the_order_once_the_reserved_key_expired():
+    use_case = create_use_case(create_customer(), {"1": BURGER, "2": FRIES})
+    first = await use_case.checkout(create_request("1"), idempotency_key="key")
+    # The record of the key expired, and was purged.
+    use_case._idempotency_store = create_idempotency_store()
+
+    result = await use_case.checkout(create_request("2"), idempotency_key="key")
+
+    assert result.external_id != first.external_id
+    assert result.items[0].product_id == "2"
+    assert use_case._order_repository.insert.await_count == 2
+
+
+async def test_concurrent_request_reusing_the_key_does_not_fail_the_first_one():
+    use_case = create_use_case(create_customer(), {"1": BURGER, "2": FRIES}, delay=0.01)
+
+    first, reused = await asyncio.gather(
+        use_case.checkout(create_request("1"), idempotency_key="key"),
+        use_case.checkout(create_request("2"), idempotency_key="key"),
+        return_exceptions=True,
+    )
+
+    assert first.items[0].product_id == "1"
+    assert isinstance(reused, IdempotencyKeyReusedError)
+    use_case._order_repository.insert.assert_awaited_once()
+
+
+async def test_checkout_creates_the_order_with_the_assigned_external_id():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+    external_id = await use_case.assign_external_id(create_request("1"))
+
+    result = await use_case.checkout(create_request("1"), external_id=external_id)
+
+    assert result.external_id == str(external_id)
+
+
+async def test_assigned_external_id_matches_the_idempotency_key():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+    external_id = await use_case.assign_external_id(create_request("1"), "key")
+
+    result = await use_case.checkout(create_request("1"), idempotency_key="key")
+
+    assert result.external_id == str(external_id)
+
+
+async def test_checkout_is_priced_from_a_valid_quote():
+    use_case = create_use_case(create_customer(), {"1": BURGER, "2": FRIES})
+    quote_token = create_quote_token(BURGER, Product(id="2", name="Fries", price=10.0))
+
+    result = await use_case.checkout(create_request("1", "2", quote_token=quote_token))
+
+    assert result.total_value == 70.0
+    use_case._product_service.fetch_product_map.assert_not_awaited()
+
+
+@pytest.mark.parametrize(
+    "quote_token",
+    [
+        create_quote_token(BURGER, ttl=-1),
+        create_quote_token(BURGER),
+        create_quote_token(BURGER, FRIES)[:-2],
+        HmacQuoteSigner(secret=b"other").sign(
+            PriceQuote(
+                products={"1": BURGER, "2": FRIES},
+                expires_at=datetime.now(timezone.utc) + timedelta(seconds=60),
+            )
+        ),
+    ],
+    ids=["expired", "partial", "tampered", "foreign"],
+)
+async def test_checkout_is_priced_again_without_a_usable_quote(quote_token: str):
+    use_case = create_use_case(create_customer(), {"1": BURGER, "2": FRIES})
+
+    result = await use_case.checkout(create_request("1", "2", quote_token=quote_token))
+
+    assert result.total_value == 75.0
+    use_case._product_service.fetch_product_map.assert_awaited_once()
+
+
+async def test_quoted_checkout_raises_when_customer_is_missing():
+    use_case = create_use_case(None, {"1": BURGER})
+
+    with pytest.raises(CustomerNotFoundError):
+        await use_case.checkout(
+            create_request("1", quote_token=create_quote_token(BURGER))
+        )
+
+
+async def test_checkout_stops_once_the_deadline_expired():
+    use_case = create_use_case(create_customer(), {"1": BURGER})
+
+    with deadline_scope(0), pytest.raises(DeadlineExceededError):
+        await use_case.checkout(create_request("1"))
+
+    use_case._customer_id_resolver.resolve.assert_not_awaited()
+    use_case._product_service.fetch_product_map.assert_not_awaited()
+    use_case._order_repository.insert.assert_not_awaited()
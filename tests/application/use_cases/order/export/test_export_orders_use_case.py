@@ -0,0 +1,59 @@
+from datetime import datetime
+from typing import AsyncIterator
+from unittest.mock import MagicMock
+
+from src.application.use_cases.order.export import (
+    ExportedOrderDTO,
+    ExportedOrderItemDTO,
+    ExportOrdersUseCase,
+)
+from src.domain.order import Order, OrderStatus
+from src.domain.order.order_item import OrderItem
+from src.domain.order.repository import IOrderRepository
+from tests.__providers import UniqueEntityIdProvider
+
+
+def create_order() -> Order:
+    return Order(
+        customer_id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        items=[OrderItem(product_id="1", quantity=2, value=25.0)],
+    )
+
+
+async def iterate(*orders: Order) -> AsyncIterator[Order]:
+    for order in orders:
+        yield order
+
+
+async def test_export_maps_the_orders_of_the_period():
+    orders = [create_order(), create_order()]
+    order_repository_mock = MagicMock(spec=IOrderRepository)
+    order_repository_mock.iter_all.return_value = iterate(*orders)
+    use_case = ExportOrdersUseCase(order_repository_mock, batch_size=50)
+    created_from, created_until = datetime(2024, 5, 1), datetime(2024, 6, 1)
+
+    exported = [order async for order in use_case.export(created_from, created_until)]
+
+    order_repository_mock.iter_all.assert_called_once_with(
+        batch_size=50, created_from=created_from, created_until=created_until
+    )
+    assert exported == [
+        ExportedOrderDTO(
+            external_id=str(order.external_id),
+            customer_id=str(order.customer_id),
+            status=OrderStatus.PAYMENT_PENDING,
+            total_value=50.0,
+            created_at=order.created_at,
+            items=[ExportedOrderItemDTO(product_id="1", quantity=2, value=25.0)],
+        )
+        for order in orders
+    ]
+
+
+async def test_export_does_not_read_the_orders_before_being_consumed():
+    order_repository_mock = MagicMock(spec=IOrderRepository)
+    use_case = ExportOrdersUseCase(order_repository_mock, batch_size=50)
+
+    use_case.export()
+
+    order_repository_mock.iter_all.assert_not_called()
@@ -0,0 +1,69 @@
+from typing import Dict, List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.use_cases.order.checkout.dto import CheckoutItemDTO
+from src.application.use_cases.order.quote.quote import QuoteUseCase
+from src.domain.__shared.interfaces import IProductService
+from src.domain.__shared.interfaces.product_service import Product
+from src.domain.order.error import (
+    EmptyOrderError,
+    OrderCreationFailedDueToMissingProductsError,
+)
+from src.infra.quote import HmacQuoteSigner
+
+BURGER = Product(id="1", name="X-Burger", price=25.0)
+FRIES = Product(id="2", name="Fries", price=12.5)
+
+
+def create_use_case(products: Dict[str, Product]) -> QuoteUseCase:
+    async def fetch_product_map(ids: List[str]) -> Dict[str, Product]:
+        return {i: products[i] for i in ids if i in products}
+
+    product_service_mock = AsyncMock(spec=IProductService)
+    product_service_mock.fetch_product_map.side_effect = fetch_product_map
+
+    return QuoteUseCase(
+        product_service=product_service_mock,
+        quote_signer=HmacQuoteSigner(secret=b"secret"),
+        ttl=60,
+    )
+
+
+def create_items(*product_ids: str) -> List[CheckoutItemDTO]:
+    return [CheckoutItemDTO(product_id=i, quantity=2) for i in product_ids]
+
+
+async def test_quote_prices_the_cart():
+    use_case = create_use_case({"1": BURGER, "2": FRIES})
+
+    result = await use_case.quote(create_items("1", "2", "1"))
+
+    assert [item.unit_price for item in result.items] == [25.0, 12.5, 25.0]
+    assert result.total_value == 125.0
+    use_case._product_service.fetch_product_map.assert_awaited_once_with(["1", "2"])
+
+
+async def test_quote_token_carries_the_quoted_prices():
+    use_case = create_use_case({"1": BURGER, "2": FRIES})
+
+    result = await use_case.quote(create_items("1", "2"))
+
+    quote = use_case._quote_signer.verify(result.quote_token)
+    assert quote.products == {"1": BURGER, "2": FRIES}
+    assert quote.expires_at == result.expires_at
+
+
+async def test_quote_raises_when_cart_is_empty():
+    with pytest.raises(EmptyOrderError):
+        await create_use_case({}).quote([])
+
+
+async def test_quote_raises_when_products_are_missing():
+    use_case = create_use_case({"1": BURGER})
+
+    with pytest.raises(OrderCreationFailedDueToMissingProductsError) as exc_info:
+        await use_case.quote(create_items("1", "3"))
+
+    assert exc_info.value.missing_product_ids == ["3"]
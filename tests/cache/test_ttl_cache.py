@@ -0,0 +1,90 @@
+import pytest
+
+from src.infra.cache import CacheStats, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_cached_value() -> None:
+    cache = TTLCache[str, int](max_entries=2, ttl=10)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.stats == CacheStats(
+        hits=1, stale_hits=0, misses=0, evictions=0, size=1
+    )
+
+
+def test_get_returns_none_when_absent() -> None:
+    cache = TTLCache[str, int](max_entries=2, ttl=10)
+
+    assert cache.get("a") is None
+    assert cache.stats.misses == 1
+
+
+def test_entries_expire_after_ttl() -> None:
+    clock = FakeClock()
+    cache = TTLCache[str, int](max_entries=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+    cache.put("b", 2, ttl=20)
+
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+    clock.now = 20
+    assert cache.get("b") is None
+
+
+def test_get_stale_serves_expired_value_within_grace_period() -> None:
+    clock = FakeClock()
+    cache = TTLCache[str, int](max_entries=2, ttl=10, clock=clock)
+    cache.put("a", 1)
+
+    assert cache.get_stale("a", grace=5) == (1, False)
+
+    clock.now = 12
+    assert cache.get_stale("a", grace=5) == (1, True)
+    assert cache.get("a") is None
+
+    clock.now = 15
+    assert cache.get_stale("a", grace=5) == (None, False)
+    assert cache.stats.stale_hits == 1
+
+
+def test_put_evicts_least_recently_used_entry() -> None:
+    cache = TTLCache[str, int](max_entries=2, ttl=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats.evictions == 1
+    assert len(cache) == 2
+
+
+def test_invalidate_removes_entries() -> None:
+    cache = TTLCache[str, int](max_entries=3, ttl=10)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("c", 3)
+
+    cache.invalidate("a", "b", "unknown")
+
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_must_hold_at_least_one_entry() -> None:
+    with pytest.raises(ValueError):
+        TTLCache(max_entries=0, ttl=10)
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from src.infra.concurrency import Batcher
+
+
+def create_batcher(batches: list, **kwargs) -> Batcher[int, int]:  # noqa: ANN003
+    async def flush(items: list) -> list:
+        batches.append(items)
+        return [ValueError(i) if i < 0 else i * 10 for i in items]
+
+    return Batcher(flush=flush, **{"max_batch_size": 10, "max_delay": 0.01, **kwargs})
+
+
+async def test_concurrent_items_are_flushed_together():
+    batches = []
+    batcher = create_batcher(batches)
+
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+    assert results == [0, 10, 20]
+    assert batches == [[0, 1, 2]]
+
+
+async def test_full_batch_is_flushed_right_away():
+    batches = []
+    batcher = create_batcher(batches, max_batch_size=2, max_delay=10)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+    )
+
+    assert results == [0, 10, 20, 30]
+    assert batches == [[0, 1], [2, 3]]
+
+
+async def test_failed_item_does_not_affect_its_batch():
+    batcher = create_batcher([])
+
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(-1), return_exceptions=True
+    )
+
+    assert results[0] == 10
+    assert isinstance(results[1], ValueError)
+
+
+async def test_failed_flush_fails_every_item():
+    async def flush(items: list) -> list:
+        raise ConnectionError()
+
+    batcher = Batcher(flush=flush, max_batch_size=10, max_delay=0)
+
+    results = await asyncio.gather(
+        batcher.submit(1), batcher.submit(2), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ConnectionError) for result in results)
+
+
+async def test_cancelled_caller_does_not_withdraw_its_item():
+    batches = []
+    batcher = create_batcher(batches)
+
+    cancelled = asyncio.create_task(batcher.submit(1))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await batcher.submit(2) == 20
+
+    assert batches == [[1, 2]]
+    assert batcher.batches == 1
+    assert batcher.items == 2
+
+
+async def test_drain_flushes_pending_items():
+    batches = []
+    batcher = create_batcher(batches, max_delay=10)
+
+    pending = asyncio.create_task(batcher.submit(1))
+    await asyncio.sleep(0)
+    await batcher.drain()
+
+    assert batches == [[1]]
+    assert await pending == 10
+
+
+def test_batch_must_hold_an_item():
+    with pytest.raises(ValueError):
+        Batcher(flush=None, max_batch_size=0, max_delay=0)
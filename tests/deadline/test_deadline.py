@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from src.domain.__shared.error import DeadlineExceededError
+from src.infra.deadline import (
+    bounded_by_deadline,
+    check_deadline,
+    current_deadline,
+    deadline_scope,
+    detached_context,
+    start_deadline,
+)
+
+
+def test_deadline_is_only_brought_forward():
+    with deadline_scope(1) as first:
+        assert start_deadline(10) is first
+        second = start_deadline(0.5)
+
+        assert second.expires_at < first.expires_at
+        assert current_deadline() is second
+
+
+def test_deadline_scope_restores_the_previous_deadline():
+    with deadline_scope(1) as outer:
+        with deadline_scope(0.5):
+            pass
+
+        assert current_deadline() is outer
+
+    assert current_deadline() is None
+
+
+def test_check_deadline_raises_once_expired():
+    with deadline_scope(0):
+        with pytest.raises(DeadlineExceededError) as exc_info:
+            check_deadline("insert")
+
+    assert exc_info.value.stage == "insert"
+
+
+async def test_work_is_not_bounded_without_deadline():
+    async with bounded_by_deadline("products") as remaining:
+        await asyncio.sleep(0.01)
+
+    assert remaining is None
+
+
+async def test_work_is_cancelled_once_the_deadline_expires():
+    cancelled = asyncio.Event()
+
+    async def slow_work() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with deadline_scope(0.01), pytest.raises(DeadlineExceededError) as exc_info:
+        async with bounded_by_deadline("products"):
+            await slow_work()
+
+    assert exc_info.value.stage == "products"
+    assert cancelled.is_set()
+
+
+async def test_work_does_not_start_once_the_deadline_expired():
+    started = False
+
+    with deadline_scope(0), pytest.raises(DeadlineExceededError):
+        async with bounded_by_deadline("insert"):
+            started = True
+
+    assert not started
+
+
+async def test_other_timeouts_are_not_reported_as_deadlines():
+    with deadline_scope(10), pytest.raises(TimeoutError):
+        async with bounded_by_deadline("products"), asyncio.timeout(0.01):
+            await asyncio.sleep(1)
+
+
+async def test_detached_tasks_have_no_deadline():
+    async def get_deadline():  # noqa: ANN202
+        return current_deadline()
+
+    with deadline_scope(1) as deadline:
+        inherited = await asyncio.create_task(get_deadline())
+        detached = await asyncio.create_task(get_deadline(), context=detached_context())
+
+    assert inherited is deadline
+    assert detached is None
@@ -10,7 +10,7 @@ from src.domain.__shared.validator import (
     ValidationErrorDetails,
     ValidationResult,
 )
-from src.domain.__shared.value_objects import ExternalEntityId
+from src.domain.__shared.value_objects import ExternalEntityId, UniqueEntityId
 
 
 @dataclass(slots=True)
@@ -96,3 +96,19 @@ def test_aggregate_root_raises_exception_on_invalid_unique_id() -> None:
 def test_aggregate_root_raises_exception_on_invalid_external_id() -> None:
     with pytest.raises(ValidationError):
         StubEntity(external_id="invalid")  # type: ignore
+
+
+def test_assign_id_sets_the_generated_id() -> None:
+    aggregate_root = StubEntity()
+    identifier = UniqueEntityId("507f1f77bcf86cd799439011")
+
+    aggregate_root.assign_id(identifier)
+
+    assert aggregate_root.id == identifier
+
+
+def test_assign_id_does_not_replace_another_id() -> None:
+    aggregate_root = StubEntity(_id=UniqueEntityId("507f1f77bcf86cd799439011"))
+
+    with pytest.raises(ValueError):
+        aggregate_root.assign_id(UniqueEntityId("507f1f77bcf86cd799439012"))
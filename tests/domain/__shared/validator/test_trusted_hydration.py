@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+
+import pytest
+
+from src.domain.__shared.entity import AggregateRoot
+from src.domain.__shared.validator import (
+    ValidationError,
+    ValidationErrorDetails,
+    ValidationResult,
+    is_hydration_trusted,
+    trusted_hydration,
+)
+from src.domain.__shared.value_objects import CPF, EmailAddress, UniqueEntityId
+from src.domain.__shared.value_objects.cpf import InvalidCPFError
+
+
+@dataclass(kw_only=True, slots=True)
+class InvalidEntity(AggregateRoot):
+    def validate(self) -> ValidationResult:  # noqa: D102
+        return ValidationResult(
+            is_valid=False,
+            errors=[ValidationErrorDetails(msg="Validation error", loc=("field",))],
+        )
+
+
+def test_entities_built_within_trusted_hydration_are_not_validated() -> None:
+    with trusted_hydration():
+        InvalidEntity()
+        EmailAddress(address="not-an-email")
+        UniqueEntityId("not-an-id")
+
+
+def test_normalizations_still_apply_within_trusted_hydration() -> None:
+    with trusted_hydration():
+        cpf = CPF(number="529.982.247-25")
+
+    assert cpf.number == "52998224725"
+
+
+def test_disabled_trusted_hydration_validates_as_usual() -> None:
+    with trusted_hydration(enabled=False), pytest.raises(ValidationError):
+        InvalidEntity()
+
+
+def test_trusted_hydration_ends_with_its_context() -> None:
+    with pytest.raises(InvalidCPFError), trusted_hydration():
+        assert is_hydration_trusted()
+        raise InvalidCPFError(cpf="00000000000")
+
+    assert not is_hydration_trusted()
+    with pytest.raises(ValidationError):
+        InvalidEntity()
@@ -1,5 +1,8 @@
 from datetime import datetime
 
+from unittest.mock import patch
+
+import pytest
 from bson import ObjectId
 
 from src.domain.__shared.value_objects import (
@@ -8,7 +11,9 @@ from src.domain.__shared.value_objects import (
     EmailAddress,
     CPF,
 )
+from src.domain.__shared.value_objects.email_address import InvalidEmailError
 from src.domain.customer import Customer
+from src.infra.config import settings
 from src.infra.gateways.database.models.customer_persistence_model import (
     CustomerPersistenceModel,
 )
@@ -88,3 +93,34 @@ async def test_from_entity_handles_none_id(initialize_database_fx):
         assert persistence_model.email == "test@example.com"
         assert persistence_model.name == "John Doe"
         assert persistence_model.cpf == cpf.number
+
+
+def create_customer_document(email: str) -> CustomerPersistenceModel:
+    return CustomerPersistenceModel(
+        id=ObjectId("507f1f77bcf86cd799439011"),
+        external_id=str(ExternalEntityId()),
+        created_at=datetime.now(),
+        email=email,
+        name="John Doe",
+        cpf=CPFProvider.generate_cpf_number(),
+    )
+
+
+async def test_to_entity_trusts_the_stored_customer(initialize_database_fx):
+    async with initialize_database_fx:
+        customer = create_customer_document("not-an-email").to_entity()
+
+        assert customer.email.address == "not-an-email"
+
+
+async def test_to_entity_validates_again_when_revalidating_on_load(
+    initialize_database_fx,
+):
+    async with initialize_database_fx:
+        document = create_customer_document("not-an-email")
+
+        with (
+            patch.object(settings, "DB_REVALIDATE_ON_LOAD", True),
+            pytest.raises(InvalidEmailError),
+        ):
+            document.to_entity()
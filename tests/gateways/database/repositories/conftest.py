@@ -0,0 +1,22 @@
+import pytest
+
+from src.infra.gateways.database.repositories.customer_repository_impl import (
+    MongoCustomerRepository,
+    RawMongoCustomerRepository,
+)
+from src.infra.gateways.database.repositories.order_repository_impl import (
+    MongoOrderRepository,
+    RawMongoOrderRepository,
+)
+
+
+@pytest.fixture(params=[MongoOrderRepository, RawMongoOrderRepository])
+def order_repository(request: pytest.FixtureRequest) -> MongoOrderRepository:
+    """The order repository of each backend: Beanie, and raw Motor reads."""
+    return request.param()
+
+
+@pytest.fixture(params=[MongoCustomerRepository, RawMongoCustomerRepository])
+def customer_repository(request: pytest.FixtureRequest) -> MongoCustomerRepository:
+    """The customer repository of each backend: Beanie, and raw Motor reads."""
+    return request.param()
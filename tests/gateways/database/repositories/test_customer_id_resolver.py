@@ -0,0 +1,100 @@
+from unittest.mock import patch
+
+from src.domain.__shared.value_objects import CPF, EmailAddress
+from src.domain.customer import Customer
+from src.infra.cache import TTLCache
+from src.infra.gateways.database.models import CustomerPersistenceModel
+from src.infra.gateways.database.repositories import (
+    MongoCustomerIdResolver,
+    MongoCustomerRepository,
+)
+from tests.__providers import CPFProvider
+
+
+def create_customer(email: str) -> Customer:
+    return Customer(
+        name="John Doe",
+        email=EmailAddress(address=email),
+        cpf=CPF(number=CPFProvider.generate_cpf_number()),
+    )
+
+
+async def test_resolve_returns_the_internal_id_of_the_customer(
+    initialize_database_fx,
+):
+    async with initialize_database_fx:
+        customer = await MongoCustomerRepository().insert(
+            create_customer("john@example.com")
+        )
+
+        resolved = await MongoCustomerIdResolver().resolve(customer.external_id)
+        unknown = await MongoCustomerIdResolver().resolve("unknown")
+
+    assert resolved == customer.id
+    assert unknown is None
+
+
+async def test_resolve_does_not_load_the_customer(initialize_database_fx):
+    async with initialize_database_fx:
+        customer = await MongoCustomerRepository().insert(
+            create_customer("john@example.com")
+        )
+
+        with patch.object(CustomerPersistenceModel, "to_entity") as to_entity:
+            resolved = await MongoCustomerIdResolver().resolve(customer.external_id)
+
+    assert resolved == customer.id
+    to_entity.assert_not_called()
+
+
+async def test_resolve_many_leaves_unknown_customers_out(initialize_database_fx):
+    async with initialize_database_fx:
+        repository = MongoCustomerRepository()
+        john = await repository.insert(create_customer("john@example.com"))
+        jane = await repository.insert(create_customer("jane@example.com"))
+
+        resolved = await MongoCustomerIdResolver().resolve_many(
+            [john.external_id, "unknown", jane.external_id, john.external_id]
+        )
+
+    assert resolved == {str(john.external_id): john.id, str(jane.external_id): jane.id}
+
+
+async def test_resolved_ids_are_served_from_the_cache(initialize_database_fx):
+    async with initialize_database_fx:
+        customer = await MongoCustomerRepository().insert(
+            create_customer("john@example.com")
+        )
+        resolver = MongoCustomerIdResolver(cache=TTLCache(max_entries=10, ttl=60))
+
+        await resolver.resolve(customer.external_id)
+        await CustomerPersistenceModel.find_all().delete()
+        resolved = await resolver.resolve(customer.external_id)
+
+    assert resolved == customer.id
+    metrics = {m.name: m.value for m in resolver.collect_metrics()}
+    assert metrics["customer_id_cache_hits_total"] == 1
+
+
+async def test_unknown_customers_are_not_cached(initialize_database_fx):
+    async with initialize_database_fx:
+        resolver = MongoCustomerIdResolver(cache=TTLCache(max_entries=10, ttl=60))
+        customer = create_customer("john@example.com")
+
+        assert await resolver.resolve(customer.external_id) is None
+        await MongoCustomerRepository().insert(customer)
+        resolved = await resolver.resolve(customer.external_id)
+
+    assert resolved is not None
+
+
+async def test_inserted_customers_are_invalidated(initialize_database_fx):
+    async with initialize_database_fx:
+        cache = TTLCache(max_entries=10, ttl=60)
+        resolver = MongoCustomerIdResolver(cache=cache)
+        customer = create_customer("john@example.com")
+        cache.put(str(customer.external_id), "stale")
+
+        await MongoCustomerRepository(id_resolver=resolver).insert(customer)
+
+    assert cache.get(str(customer.external_id)) is None
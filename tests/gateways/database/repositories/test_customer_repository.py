@@ -10,17 +10,16 @@ from src.domain.__shared.value_objects import (
     CPF,
     EmailAddress,
 )
-from src.domain.customer import Customer
-from src.infra.gateways.database.repositories.customer_repository_impl import (
-    MongoCustomerRepository,
-)
+from src.domain.customer import Customer, CustomerIdentity
 
 
 @time_machine.travel(
     datetime(2024, 2, 3, 5, 18, 29, 00, tzinfo=ZoneInfo("America/Sao_Paulo")),
     tick=False,
 )
-async def test_insert_returns_inserted_customer(initialize_database_fx):
+async def test_insert_returns_inserted_customer(
+    initialize_database_fx, customer_repository
+):
     async with initialize_database_fx:
         customer = Customer(
             _id=UniqueEntityId("507f1f77bcf86cd799439011"),
@@ -29,28 +28,44 @@ async def test_insert_returns_inserted_customer(initialize_database_fx):
             cpf=CPF(number=CPFProvider.generate_cpf_number()),
         )
 
-        repository = MongoCustomerRepository()
-        result = await repository.insert(customer)
+        result = await customer_repository.insert(customer)
         assert result == customer
 
 
-async def test_find_raises_value_error_when_no_criteria_provided():
-    repository = MongoCustomerRepository()
+async def test_insert_assigns_the_generated_id(
+    initialize_database_fx, customer_repository
+):
+    async with initialize_database_fx:
+        customer = Customer(
+            email=EmailAddress(address="test@example.com"),
+            name="John Doe",
+            cpf=CPF(number=CPFProvider.generate_cpf_number()),
+        )
+
+        result = await customer_repository.insert(customer)
+
+        assert result is customer
+        assert customer.id is not None
+        found = await customer_repository.find(cpf=None, email=customer.email)
+        assert found.id == customer.id
+
+
+async def test_find_raises_value_error_when_no_criteria_provided(customer_repository):
     with pytest.raises(
         ValueError,
         match="At least one search criteria \\(CPF or email\\) must be provided",
     ):
-        await repository.find(cpf=None, email=None)
+        await customer_repository.find(cpf=None, email=None)
 
 
 @time_machine.travel(
     datetime(2024, 2, 3, 5, 18, 29, 00, tzinfo=ZoneInfo("America/Sao_Paulo")),
     tick=False,
 )
-async def test_find_returns_customer_when_cpf_is_provided(initialize_database_fx):
+async def test_find_returns_customer_when_cpf_is_provided(
+    initialize_database_fx, customer_repository
+):
     async with initialize_database_fx:
-        repository = MongoCustomerRepository()
-
         cpf = CPF(number=CPFProvider.generate_cpf_number())
         customer = Customer(
             _id=UniqueEntityId("507f1f77bcf86cd799439011"),
@@ -59,9 +74,9 @@ async def test_find_returns_customer_when_cpf_is_provided(initialize_database_fx
             cpf=cpf,
         )
 
-        await repository.insert(customer)
+        await customer_repository.insert(customer)
 
-        result = await repository.find(cpf=cpf, email=None)
+        result = await customer_repository.find(cpf=cpf, email=None)
         assert result == customer
 
 
@@ -69,7 +84,9 @@ async def test_find_returns_customer_when_cpf_is_provided(initialize_database_fx
     datetime(2024, 2, 3, 5, 18, 29, 00, tzinfo=ZoneInfo("America/Sao_Paulo")),
     tick=False,
 )
-async def test_find_by_id_returns_customer_when_found(initialize_database_fx):
+async def test_find_by_id_returns_customer_when_found(
+    initialize_database_fx, customer_repository
+):
     async with initialize_database_fx:
         customer = Customer(
             _id=UniqueEntityId("507f1f77bcf86cd799439011"),
@@ -78,10 +95,9 @@ async def test_find_by_id_returns_customer_when_found(initialize_database_fx):
             cpf=CPF(number=CPFProvider.generate_cpf_number()),
         )
 
-        repository = MongoCustomerRepository()
-        await repository.insert(customer)
+        await customer_repository.insert(customer)
 
-        result = await repository.find_by_id("507f1f77bcf86cd799439011")
+        result = await customer_repository.find_by_id("507f1f77bcf86cd799439011")
         assert result == customer
 
 
@@ -89,7 +105,9 @@ async def test_find_by_id_returns_customer_when_found(initialize_database_fx):
     datetime(2024, 2, 3, 5, 18, 29, 00, tzinfo=ZoneInfo("America/Sao_Paulo")),
     tick=False,
 )
-async def test_find_by_external_id_returns_customer_when_found(initialize_database_fx):
+async def test_find_by_external_id_returns_customer_when_found(
+    initialize_database_fx, customer_repository
+):
     async with initialize_database_fx:
         customer = Customer(
             _id=UniqueEntityId("507f1f77bcf86cd799439011"),
@@ -98,8 +116,64 @@ async def test_find_by_external_id_returns_customer_when_found(initialize_databa
             cpf=CPF(number=CPFProvider.generate_cpf_number()),
         )
 
-        repository = MongoCustomerRepository()
-        await repository.insert(customer)
+        await customer_repository.insert(customer)
 
-        result = await repository.find_by_external_id(customer.external_id)
+        result = await customer_repository.find_by_external_id(customer.external_id)
         assert result == customer
+
+
+async def test_find_by_external_ids_returns_the_customers_found(
+    initialize_database_fx, customer_repository
+):
+    async with initialize_database_fx:
+        customers = [
+            await customer_repository.insert(
+                Customer(
+                    email=EmailAddress(address=f"customer{i}@example.com"),
+                    name="John Doe",
+                    cpf=CPF(number=CPFProvider.generate_cpf_number()),
+                )
+            )
+            for i in range(2)
+        ]
+        external_ids = [str(customer.external_id) for customer in customers]
+
+        result = await customer_repository.find_by_external_ids(
+            [*external_ids, "missing"]
+        )
+
+        assert {i: customer.id for i, customer in result.items()} == {
+            i: customer.id for i, customer in zip(external_ids, customers)
+        }
+
+
+async def test_find_identity_by_cpf_reads_the_identity_only(
+    initialize_database_fx, customer_repository
+):
+    async with initialize_database_fx:
+        customer = Customer(
+            email=EmailAddress(address="test@example.com"),
+            name="John Doe",
+            cpf=CPF(number=CPFProvider.generate_cpf_number()),
+            created_at=datetime(2024, 2, 3, 5, 18, 29),
+        )
+        await customer_repository.insert(customer)
+
+        identity = await customer_repository.find_identity_by_cpf(customer.cpf)
+
+        assert identity == CustomerIdentity(
+            external_id=str(customer.external_id),
+            name="John Doe",
+            cpf=customer.cpf.number,
+            email="test@example.com",
+            created_at=customer.created_at,
+        )
+
+
+async def test_find_identity_by_cpf_returns_none_when_not_found(
+    initialize_database_fx, customer_repository
+):
+    async with initialize_database_fx:
+        cpf = CPF(number=CPFProvider.generate_cpf_number())
+
+        assert await customer_repository.find_identity_by_cpf(cpf) is None
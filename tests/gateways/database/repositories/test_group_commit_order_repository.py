@@ -0,0 +1,77 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.__shared.error import DeadlineExceededError
+from src.domain.__shared.error.repository_error import DuplicateKeyError
+from src.domain.order import Order
+from src.domain.order.order_item import OrderItem
+from src.domain.order.repository import IOrderRepository
+from src.infra.gateways.database.repositories.group_commit_order_repository import (
+    GroupCommitOrderRepository,
+)
+from src.infra.deadline import current_deadline, deadline_scope
+from tests.__providers import UniqueEntityIdProvider
+
+
+def create_order() -> Order:
+    return Order(
+        customer_id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        items=[OrderItem(product_id="1", quantity=1, value=10.0)],
+    )
+
+
+async def test_concurrent_inserts_share_a_bulk_insert():
+    order_repository_mock = AsyncMock(spec=IOrderRepository)
+    order_repository_mock.insert_many.side_effect = lambda orders: list(orders)
+    repository = GroupCommitOrderRepository(order_repository_mock, max_delay=0.01)
+    orders = [create_order() for _ in range(3)]
+
+    result = await asyncio.gather(*(repository.insert(order) for order in orders))
+
+    assert result == orders
+    order_repository_mock.insert_many.assert_awaited_once_with(orders)
+    order_repository_mock.insert.assert_not_awaited()
+    assert {m.name: m.value for m in repository.collect_metrics()} == {
+        "order_insert_batches_total": 1,
+        "order_insert_batched_total": 3,
+    }
+
+
+async def test_insert_raises_its_own_duplicate_key_error():
+    duplicate = DuplicateKeyError()
+    order_repository_mock = AsyncMock(spec=IOrderRepository)
+    order_repository_mock.insert_many.side_effect = lambda orders: [
+        orders[0],
+        duplicate,
+    ]
+    repository = GroupCommitOrderRepository(order_repository_mock, max_delay=0.01)
+    first, second = create_order(), create_order()
+
+    results = await asyncio.gather(
+        repository.insert(first), repository.insert(second), return_exceptions=True
+    )
+
+    assert results == [first, duplicate]
+
+
+async def test_batches_are_written_regardless_of_the_deadline_of_an_insert():
+    written = asyncio.Event()
+    deadlines = []
+
+    async def insert_many(orders):  # noqa: ANN001, ANN202
+        deadlines.append(current_deadline())
+        await asyncio.sleep(0.05)
+        written.set()
+        return list(orders)
+
+    order_repository_mock = AsyncMock(spec=IOrderRepository)
+    order_repository_mock.insert_many.side_effect = insert_many
+    repository = GroupCommitOrderRepository(order_repository_mock, max_delay=0)
+
+    with deadline_scope(0.01), pytest.raises(DeadlineExceededError):
+        await repository.insert(create_order())
+
+    await asyncio.wait_for(written.wait(), timeout=1)
+    assert deadlines == [None]
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+from src.domain.__shared.interfaces import IdempotencyRecord
+from src.infra.cache import TTLCache
+from src.infra.gateways.database.models import IdempotencyKeyPersistenceModel
+from src.infra.gateways.database.repositories.idempotency_store_impl import (
+    MongoIdempotencyStore,
+)
+
+RECORD = IdempotencyRecord(key="customer:key", fingerprint="abc", order_external_id="1")
+
+
+async def test_get_returns_saved_record(initialize_database_fx):
+    async with initialize_database_fx:
+        store = MongoIdempotencyStore(ttl=60)
+        await store.save(RECORD)
+
+        assert await store.get(RECORD.key) == RECORD
+        assert await store.get("customer:other") is None
+
+
+async def test_save_keeps_the_first_record_of_a_key(initialize_database_fx):
+    async with initialize_database_fx:
+        store = MongoIdempotencyStore(ttl=60)
+        await store.save(RECORD)
+
+        other = IdempotencyRecord(
+            key=RECORD.key, fingerprint="def", order_external_id="2"
+        )
+        assert await store.save(other) == RECORD
+
+
+async def test_get_ignores_expired_records(initialize_database_fx):
+    async with initialize_database_fx:
+        expired = IdempotencyKeyPersistenceModel.from_record(RECORD)
+        expired.created_at = datetime.now(timezone.utc) - timedelta(seconds=120)
+        await expired.insert()
+
+        assert await MongoIdempotencyStore(ttl=60).get(RECORD.key) is None
+
+
+async def test_save_replaces_an_expired_record(initialize_database_fx):
+    async with initialize_database_fx:
+        expired = IdempotencyKeyPersistenceModel.from_record(RECORD)
+        expired.created_at = datetime.now(timezone.utc) - timedelta(seconds=120)
+        await expired.insert()
+        store = MongoIdempotencyStore(ttl=60)
+
+        other = IdempotencyRecord(
+            key=RECORD.key, fingerprint="def", order_external_id="2"
+        )
+        assert await store.save(other) == other
+        assert await store.get(RECORD.key) == other
+
+
+async def test_get_serves_recent_records_in_process(initialize_database_fx):
+    async with initialize_database_fx:
+        cache = TTLCache(max_entries=10, ttl=60)
+        store = MongoIdempotencyStore(ttl=60, cache=cache)
+        await store.save(RECORD)
+        await IdempotencyKeyPersistenceModel.find_all().delete()
+
+        assert await store.get(RECORD.key) == RECORD
+        assert {m.name: m.value for m in store.collect_metrics()} == {
+            "idempotency_cache_hits_total": 1,
+            "idempotency_cache_misses_total": 0,
+        }
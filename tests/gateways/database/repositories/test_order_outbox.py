@@ -0,0 +1,79 @@
+from src.domain.order import Order
+from src.domain.order.events import OrderEventType
+from src.domain.order.order_item import OrderItem
+from src.infra.gateways.database.repositories.order_outbox_impl import (
+    MongoOrderOutbox,
+)
+from src.infra.gateways.database.repositories.order_repository_impl import (
+    MongoOrderRepository,
+)
+from tests.__providers import UniqueEntityIdProvider
+
+
+def create_order() -> Order:
+    return Order(
+        customer_id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        items=[OrderItem(product_id="1", quantity=1, value=10.0)],
+    )
+
+
+async def test_inserted_order_is_written_with_its_creation_event(
+    initialize_database_fx,
+):
+    async with initialize_database_fx:
+        order = await MongoOrderRepository().insert(create_order())
+
+        (delivery,) = await MongoOrderOutbox().claim(limit=10, lease_duration=30)
+
+    assert delivery.order_id == str(order.id)
+    assert [event.type for event in delivery.events] == [OrderEventType.ORDER_CREATED]
+    assert delivery.events[0].order_external_id == str(order.external_id)
+
+
+async def test_orders_are_written_without_events_when_the_outbox_is_disabled(
+    initialize_database_fx,
+):
+    async with initialize_database_fx:
+        await MongoOrderRepository(outbox_enabled=False).insert_many(
+            [create_order(), create_order()]
+        )
+
+        assert await MongoOrderOutbox().claim(limit=10, lease_duration=30) == []
+
+
+async def test_claimed_events_are_leased(initialize_database_fx):
+    async with initialize_database_fx:
+        await MongoOrderRepository().insert_many([create_order(), create_order()])
+        outbox = MongoOrderOutbox()
+
+        first = await outbox.claim(limit=1, lease_duration=30)
+        second = await outbox.claim(limit=10, lease_duration=30)
+        third = await outbox.claim(limit=10, lease_duration=30)
+
+    assert len(first) == len(second) == 1
+    assert first[0].order_id != second[0].order_id
+    assert third == []
+
+
+async def test_acknowledged_events_are_not_delivered_again(initialize_database_fx):
+    async with initialize_database_fx:
+        await MongoOrderRepository().insert(create_order())
+        outbox = MongoOrderOutbox()
+
+        (delivery,) = await outbox.claim(limit=10, lease_duration=0)
+        assert await outbox.acknowledge(delivery)
+
+        assert await outbox.claim(limit=10, lease_duration=0) == []
+
+
+async def test_expired_lease_is_taken_over(initialize_database_fx):
+    async with initialize_database_fx:
+        await MongoOrderRepository().insert(create_order())
+        outbox = MongoOrderOutbox()
+
+        (expired,) = await outbox.claim(limit=10, lease_duration=0)
+        (current,) = await outbox.claim(limit=10, lease_duration=30)
+
+        assert current.events == expired.events
+        assert not await outbox.acknowledge(expired)
+        assert await outbox.acknowledge(current)
@@ -1,13 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import List, Optional
 from unittest.mock import patch, AsyncMock
 
 import pytest
 from beanie import PydanticObjectId
 
+from src.domain.__shared.error import DeadlineExceededError
 from src.domain.__shared.error.repository_error import DuplicateKeyError
-from src.domain.__shared.value_objects import ExternalEntityId
+from src.domain.__shared.value_objects import ExternalEntityId, UniqueEntityId
 from src.domain.order import OrderStatus, Order
+from src.domain.order.error import InvalidPageTokenError
+from src.domain.order.read_models import OrderSummary
 from src.domain.order.order_item import OrderItem
+from src.infra.deadline import deadline_scope
 from src.infra.gateways.database.models.order_persistence_model import (
     OrderPersistenceModel,
     OrderItemPersistenceModel,
@@ -16,9 +21,10 @@ from src.infra.gateways.database.repositories.order_repository_impl import (
     MongoOrderRepository,
 )
 from tests.__providers import UniqueEntityIdProvider
-from pymongo.errors import DuplicateKeyError as MongoDuplicateKeyError
+from pymongo.errors import DuplicateKeyError as MongoDuplicateKeyError, ExecutionTimeout
 
 
+# Beanie backend only: patches its documents.
 async def test_list_all_returns_orders(initialize_database_fx):
     async with initialize_database_fx:
         # noinspection PyArgumentList
@@ -69,6 +75,7 @@ async def test_list_all_returns_orders(initialize_database_fx):
             assert len(result) == len(orders)
 
 
+# Beanie backend only: patches its documents.
 async def test_insert_saves_order(initialize_database_fx):
     async with initialize_database_fx:
         order = Order(
@@ -87,6 +94,7 @@ async def test_insert_saves_order(initialize_database_fx):
         )
 
         persisted_order = OrderPersistenceModel.from_entity(order)
+        persisted_order.id = PydanticObjectId()
 
         with patch.object(
             OrderPersistenceModel,
@@ -95,9 +103,11 @@ async def test_insert_saves_order(initialize_database_fx):
         ):
             repo = MongoOrderRepository()
             result = await repo.insert(order)
-            assert result == order
+            assert result is order
+            assert result.id == UniqueEntityId(str(persisted_order.id))
 
 
+# Beanie backend only: patches its documents.
 async def test_insert_raises_duplicate_key_error(initialize_database_fx):
     async with initialize_database_fx:
         order = Order(
@@ -125,6 +135,7 @@ async def test_insert_raises_duplicate_key_error(initialize_database_fx):
                 await repo.insert(order)
 
 
+# Beanie backend only: patches its documents.
 async def test_find_by_id_returns_order(initialize_database_fx):
     async with initialize_database_fx:
         order_id = UniqueEntityIdProvider.generate_unique_entity_id()
@@ -155,6 +166,7 @@ async def test_find_by_id_returns_order(initialize_database_fx):
             assert result == found_order.to_entity()
 
 
+# Beanie backend only: patches its documents.
 async def test_find_by_id_returns_none(initialize_database_fx):
     async with initialize_database_fx:
         order_id = UniqueEntityIdProvider.generate_unique_entity_id()
@@ -165,6 +177,7 @@ async def test_find_by_id_returns_none(initialize_database_fx):
             assert result is None
 
 
+# Beanie backend only: patches its documents.
 async def test_find_by_external_id_returns_order(initialize_database_fx):
     async with initialize_database_fx:
         external_id = ExternalEntityId()
@@ -196,6 +209,7 @@ async def test_find_by_external_id_returns_order(initialize_database_fx):
             assert result == found_order.to_entity()
 
 
+# Beanie backend only: patches its documents.
 async def test_find_by_external_id_returns_none(initialize_database_fx):
     async with initialize_database_fx:
         external_id = ExternalEntityId()
@@ -205,3 +219,232 @@ async def test_find_by_external_id_returns_none(initialize_database_fx):
             repo = MongoOrderRepository()
             result = await repo.find_by_external_id(external_id)
             assert result is None
+
+
+def create_order(created_at: Optional[datetime] = None) -> Order:
+    return Order(
+        customer_id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        items=[OrderItem(product_id="12313", quantity=2, value=50.0)],
+        created_at=created_at or datetime.now(),
+    )
+
+
+async def test_insert_many_saves_orders(initialize_database_fx, order_repository):
+    async with initialize_database_fx:
+        orders = [create_order(), create_order()]
+
+        result = await order_repository.insert_many(orders)
+
+        assert all(order.id is not None for order in result)
+        assert [order.external_id for order in result] == [
+            order.external_id for order in orders
+        ]
+        found = await order_repository.find_by_id(result[1].id)
+        assert found.external_id == result[1].external_id
+
+
+async def test_insert_many_reports_each_failed_order(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        existing = await order_repository.insert(create_order())
+        duplicate = create_order()
+        duplicate.external_id = existing.external_id
+
+        result = await order_repository.insert_many(
+            [create_order(), duplicate, create_order()]
+        )
+
+        assert isinstance(result[1], DuplicateKeyError)
+        assert isinstance(result[0], Order)
+        assert isinstance(result[2], Order)
+        assert len(await order_repository.list_all()) == 3
+
+
+async def test_insert_is_not_written_once_the_deadline_expired(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        with deadline_scope(0), pytest.raises(DeadlineExceededError):
+            await order_repository.insert(create_order())
+
+        assert await order_repository.list_all() == []
+
+
+# Beanie backend only: patches its documents.
+async def test_pymongo_timeouts_are_reported_as_deadlines(initialize_database_fx):
+    async with initialize_database_fx:
+        with (
+            deadline_scope(10),
+            patch.object(
+                OrderPersistenceModel,
+                "find_one",
+                side_effect=ExecutionTimeout("operation exceeded time limit"),
+            ),
+            pytest.raises(DeadlineExceededError) as exc_info,
+        ):
+            await MongoOrderRepository().find_by_external_id(ExternalEntityId())
+
+    assert exc_info.value.stage == "find"
+
+
+async def create_orders_by_creation(repo: MongoOrderRepository) -> List[Order]:
+    """Creates five orders, the last three created at the same time."""
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    orders = [
+        create_order(now + timedelta(seconds=2)),
+        create_order(now),
+        create_order(now + timedelta(seconds=1)),
+        create_order(now + timedelta(seconds=1)),
+        create_order(now + timedelta(seconds=1)),
+    ]
+    await repo.insert_many(orders)
+    return sorted(orders, key=lambda order: (order.created_at, order.id.id))
+
+
+async def test_list_page_pages_through_the_orders_by_creation(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        orders = await create_orders_by_creation(order_repository)
+
+        first = await order_repository.list_page(page_size=2)
+        second = await order_repository.list_page(
+            page_size=2, page_token=first.next_page_token
+        )
+        last = await order_repository.list_page(
+            page_size=2, page_token=second.next_page_token
+        )
+
+        listed = first.orders + second.orders + last.orders
+        assert [order.id for order in listed] == [order.id for order in orders]
+        assert last.next_page_token is None
+
+
+async def test_list_page_has_no_next_page_when_the_last_one_is_full(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        await create_orders_by_creation(order_repository)
+
+        page = await order_repository.list_page(page_size=5)
+
+        assert len(page.orders) == 5
+        assert page.next_page_token is None
+
+
+async def test_list_page_rejects_malformed_page_tokens(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        with pytest.raises(InvalidPageTokenError):
+            await order_repository.list_page(page_token="not-a-token")
+
+
+@pytest.mark.parametrize("page_size", [0, 1001])
+async def test_list_page_rejects_out_of_bounds_page_sizes(page_size, order_repository):
+    with pytest.raises(ValueError):
+        await order_repository.list_page(page_size=page_size)
+
+
+# Beanie backend only: patches its documents.
+async def test_iter_all_reads_the_orders_in_batches(initialize_database_fx):
+    async with initialize_database_fx:
+        repo = MongoOrderRepository()
+        orders = await create_orders_by_creation(repo)
+
+        with patch.object(
+            OrderPersistenceModel, "find", wraps=OrderPersistenceModel.find
+        ) as find:
+            iterated = [order async for order in repo.iter_all(batch_size=2)]
+
+        assert [order.id for order in iterated] == [order.id for order in orders]
+        assert find.call_count == 3
+
+
+async def test_iter_all_starts_from_the_page_token(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        orders = await create_orders_by_creation(order_repository)
+        page = await order_repository.list_page(page_size=3)
+
+        iterated = [
+            order
+            async for order in order_repository.iter_all(
+                batch_size=2, page_token=page.next_page_token
+            )
+        ]
+
+        assert [order.id for order in iterated] == [order.id for order in orders[3:]]
+
+
+async def test_iter_all_only_reads_the_orders_created_within_the_period(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        orders = await create_orders_by_creation(order_repository)
+
+        iterated = [
+            order
+            async for order in order_repository.iter_all(
+                batch_size=1,
+                created_from=datetime(2024, 5, 1, 12, 0, 1),
+                created_until=datetime(2024, 5, 1, 12, 0, 2),
+            )
+        ]
+
+        assert [order.id for order in iterated] == [order.id for order in orders[1:4]]
+
+
+async def test_find_summary_by_external_id_reads_the_summary_only(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        order = await order_repository.insert(
+            create_order(datetime(2024, 5, 1, 12, 0, 0))
+        )
+
+        with patch.object(OrderPersistenceModel, "to_entity") as to_entity:
+            summary = await order_repository.find_summary_by_external_id(
+                order.external_id
+            )
+
+        to_entity.assert_not_called()
+        assert summary == OrderSummary(
+            external_id=str(order.external_id),
+            status=OrderStatus.PAYMENT_PENDING,
+            total_value=100.0,
+            created_at=order.created_at,
+        )
+
+
+async def test_find_summary_by_external_id_returns_none_when_not_found(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        assert (
+            await order_repository.find_summary_by_external_id(ExternalEntityId())
+            is None
+        )
+
+
+async def test_list_summaries_pages_like_list_page(
+    initialize_database_fx, order_repository
+):
+    async with initialize_database_fx:
+        orders = await create_orders_by_creation(order_repository)
+
+        first = await order_repository.list_summaries(page_size=2)
+        second = await order_repository.list_page(
+            page_size=2, page_token=first.next_page_token
+        )
+        last = await order_repository.list_summaries(
+            page_size=2, page_token=second.next_page_token
+        )
+
+        listed = first.summaries + second.orders + last.summaries
+        assert [str(order.external_id) for order in listed] == [
+            str(order.external_id) for order in orders
+        ]
+        assert last.next_page_token is None
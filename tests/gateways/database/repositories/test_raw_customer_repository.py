@@ -0,0 +1,57 @@
+import pytest
+
+from __providers import CPFProvider
+from src.domain.__shared.value_objects import CPF, EmailAddress, ExternalEntityId
+from src.domain.customer import Customer
+from src.infra.gateways.database.repositories.customer_repository_impl import (
+    MongoCustomerRepository,
+    RawMongoCustomerRepository,
+)
+
+
+async def insert_customer(email: str) -> Customer:
+    customer = Customer(
+        email=EmailAddress(address=email),
+        name="John Doe",
+        cpf=CPF(number=CPFProvider.generate_cpf_number()),
+    )
+    return await MongoCustomerRepository().insert(customer)
+
+
+async def test_reads_the_same_customers_as_the_beanie_repository(
+    initialize_database_fx,
+):
+    async with initialize_database_fx:
+        customer = await insert_customer("test@example.com")
+        other = await insert_customer("other@example.com")
+        beanie, raw = MongoCustomerRepository(), RawMongoCustomerRepository()
+
+        found = await raw.find(cpf=customer.cpf, email=None)
+        assert found.external_id == customer.external_id
+        assert found == await beanie.find(cpf=customer.cpf, email=None)
+        assert await raw.find(cpf=None, email=customer.email) == found
+        assert await raw.find_by_id(customer.id) == found
+        assert await raw.find_by_external_id(customer.external_id) == found
+        assert await raw.find_by_external_ids(
+            [customer.external_id, other.external_id, ExternalEntityId()]
+        ) == await beanie.find_by_external_ids(
+            [customer.external_id, other.external_id, ExternalEntityId()]
+        )
+
+
+async def test_returns_none_when_the_customer_is_not_found(initialize_database_fx):
+    async with initialize_database_fx:
+        raw = RawMongoCustomerRepository()
+
+        assert await raw.find_by_external_id(ExternalEntityId()) is None
+        assert (
+            await raw.find(
+                cpf=CPF(number=CPFProvider.generate_cpf_number()), email=None
+            )
+            is None
+        )
+
+
+async def test_find_raises_value_error_when_no_criteria_provided():
+    with pytest.raises(ValueError, match="At least one search criteria"):
+        await RawMongoCustomerRepository().find(cpf=None, email=None)
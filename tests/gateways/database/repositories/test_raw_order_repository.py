@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from src.domain.__shared.error import DeadlineExceededError
+from src.domain.__shared.value_objects import ExternalEntityId
+from src.domain.order import Order
+from src.domain.order.order_item import OrderItem
+from src.infra.deadline import deadline_scope
+from src.infra.gateways.database.repositories.order_repository_impl import (
+    MongoOrderRepository,
+    RawMongoOrderRepository,
+)
+from tests.__providers import UniqueEntityIdProvider
+
+
+def create_order(created_at: datetime) -> Order:
+    return Order(
+        customer_id=UniqueEntityIdProvider.generate_unique_entity_id(),
+        items=[
+            OrderItem(product_id="12313", quantity=2, value=50.0),
+            OrderItem(product_id="89787", quantity=1, value=12.5),
+        ],
+        created_at=created_at,
+    )
+
+
+async def insert_orders() -> List[Order]:
+    """Inserts five orders, the last three created at the same time."""
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    orders = [
+        create_order(now + timedelta(seconds=2)),
+        create_order(now),
+        create_order(now + timedelta(seconds=1)),
+        create_order(now + timedelta(seconds=1)),
+        create_order(now + timedelta(seconds=1)),
+    ]
+    await MongoOrderRepository().insert_many(orders)
+    return orders
+
+
+async def test_reads_the_same_orders_as_the_beanie_repository(
+    initialize_database_fx,
+):
+    async with initialize_database_fx:
+        orders = await insert_orders()
+        beanie, raw = MongoOrderRepository(), RawMongoOrderRepository()
+
+        assert await raw.list_all() == await beanie.list_all()
+        for order in orders:
+            found = await raw.find_by_id(order.id)
+            assert found == await beanie.find_by_id(order.id)
+            assert [item.external_id for item in found.items] == [
+                item.external_id for item in order.items
+            ]
+            assert await raw.find_by_external_id(order.external_id) == found
+
+
+async def test_returns_none_when_the_order_is_not_found(initialize_database_fx):
+    async with initialize_database_fx:
+        raw = RawMongoOrderRepository()
+
+        assert await raw.find_by_external_id(ExternalEntityId()) is None
+        assert (
+            await raw.find_by_id(UniqueEntityIdProvider.generate_unique_entity_id())
+            is None
+        )
+
+
+async def test_pages_like_the_beanie_repository(initialize_database_fx):
+    async with initialize_database_fx:
+        await insert_orders()
+        beanie, raw = MongoOrderRepository(), RawMongoOrderRepository()
+
+        first = await raw.list_page(page_size=2)
+        assert first == await beanie.list_page(page_size=2)
+        second = await raw.list_page(page_size=2, page_token=first.next_page_token)
+        assert second == await beanie.list_page(
+            page_size=2, page_token=first.next_page_token
+        )
+        assert [order async for order in raw.iter_all(batch_size=2)] == [
+            order async for order in beanie.iter_all(batch_size=2)
+        ]
+
+
+async def test_reads_are_bounded_by_the_deadline(initialize_database_fx):
+    async with initialize_database_fx:
+        with deadline_scope(0), pytest.raises(DeadlineExceededError) as exc_info:
+            await RawMongoOrderRepository().find_by_external_id(ExternalEntityId())
+
+    assert exc_info.value.stage == "find"
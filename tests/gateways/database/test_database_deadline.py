@@ -0,0 +1,27 @@
+import asyncio
+
+import pytest
+from pymongo import _csot
+
+from src.domain.__shared.error import DeadlineExceededError
+from src.infra.deadline import deadline_scope
+from src.infra.gateways.database.deadline import database_deadline
+
+
+async def test_client_timeout_is_reset_when_the_deadline_expires():
+    with deadline_scope(0.01), pytest.raises(DeadlineExceededError) as exc_info:
+        async with database_deadline("find"):
+            assert _csot.get_timeout() is not None
+            await asyncio.sleep(1)
+
+    assert exc_info.value.stage == "find"
+    assert _csot.get_timeout() is None
+    assert _csot.get_deadline() == float("inf")
+
+
+async def test_client_timeout_is_reset_when_done():
+    with deadline_scope(1):
+        async with database_deadline("find"):
+            assert _csot.get_timeout() is not None
+
+    assert _csot.get_timeout() is None
@@ -0,0 +1,218 @@
+import asyncio
+from typing import Dict, List
+from unittest.mock import AsyncMock
+
+from src.domain.__shared.interfaces.product_service import IProductService, Product
+from src.infra.cache import TTLCache
+from src.infra.gateways.external_services.cached_product_service import (
+    CachedProductService,
+)
+from src.infra.gateways.external_services.product_snapshot import (
+    ProductSnapshot,
+    write_product_snapshot,
+)
+
+BURGER = Product(id="1", name="X-Burger", price=25.0)
+FRIES = Product(id="2", name="Fries", price=12.5)
+
+
+def create_product_service_mock(*products: Product) -> AsyncMock:
+    catalog = {product.id: product for product in products}
+
+    async def fetch_product_map(ids: List[str]) -> Dict[str, Product]:
+        return {i: catalog[i] for i in ids if i in catalog}
+
+    product_service_mock = AsyncMock(spec=IProductService)
+    product_service_mock.fetch_product_map.side_effect = fetch_product_map
+    return product_service_mock
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_cached_product_service(
+    product_service: IProductService, max_entries: int = 10
+) -> CachedProductService:
+    return CachedProductService(
+        product_service=product_service,
+        cache=TTLCache(max_entries=max_entries, ttl=60),
+    )
+
+
+async def test_fetch_product_map_serves_cached_products():
+    product_service_mock = create_product_service_mock(BURGER, FRIES)
+    service = create_cached_product_service(product_service_mock)
+
+    first = await service.fetch_product_map(["1", "2"])
+    second = await service.fetch_product_map(["2", "1"])
+
+    assert first == second == {"1": BURGER, "2": FRIES}
+    product_service_mock.fetch_product_map.assert_awaited_once_with(["1", "2"])
+    assert service.stats.hits == 2
+    assert service.stats.misses == 2
+
+
+async def test_fetch_product_map_fetches_only_missed_products():
+    product_service_mock = create_product_service_mock(BURGER, FRIES)
+    service = create_cached_product_service(product_service_mock)
+
+    await service.fetch_product_map(["1"])
+    result = await service.fetch_product_map(["1", "2"])
+
+    assert result == {"1": BURGER, "2": FRIES}
+    assert product_service_mock.fetch_product_map.await_args.args == (["2"],)
+
+
+async def test_fetch_products_by_ids_uses_the_cache():
+    product_service_mock = create_product_service_mock(BURGER)
+    service = create_cached_product_service(product_service_mock)
+
+    await service.fetch_products_by_ids(["1"])
+    result = await service.fetch_products_by_ids(["1"])
+
+    assert result == [BURGER]
+    product_service_mock.fetch_product_map.assert_awaited_once()
+
+
+async def test_invalidate_forces_product_to_be_fetched_again():
+    product_service_mock = create_product_service_mock(BURGER)
+    service = create_cached_product_service(product_service_mock)
+
+    await service.fetch_product_map(["1"])
+    service.invalidate("1")
+    await service.fetch_product_map(["1"])
+
+    assert product_service_mock.fetch_product_map.await_count == 2
+
+
+async def test_collect_metrics_reports_cache_counters():
+    product_service_mock = create_product_service_mock(BURGER, FRIES)
+    service = create_cached_product_service(product_service_mock, max_entries=1)
+
+    await service.fetch_product_map(["1", "2"])
+    await service.fetch_product_map(["2"])
+
+    metrics = {metric.name: metric.value for metric in service.collect_metrics()}
+
+    assert metrics == {
+        "product_cache_hits_total": 1,
+        "product_cache_stale_hits_total": 0,
+        "product_cache_misses_total": 2,
+        "product_cache_evictions_total": 1,
+        "product_cache_entries": 1,
+        "product_cache_negative_hits_total": 0,
+        "product_cache_refresh_failures_total": 0,
+    }
+
+
+async def test_expired_product_is_served_while_refreshed_in_background():
+    clock = FakeClock()
+    release = asyncio.Event()
+    updated_burger = Product(id="1", name="X-Burger", price=27.0)
+    product_service_mock = create_product_service_mock(BURGER)
+    service = CachedProductService(
+        product_service=product_service_mock,
+        cache=TTLCache(max_entries=10, ttl=60, clock=clock),
+        stale_grace=30,
+    )
+    await service.fetch_product_map(["1"])
+
+    async def slow_fetch_product_map(ids: List[str]) -> Dict[str, Product]:
+        await release.wait()
+        return {"1": updated_burger}
+
+    product_service_mock.fetch_product_map.side_effect = slow_fetch_product_map
+    clock.now = 70
+
+    first = await service.fetch_product_map(["1"])
+    second = await service.fetch_product_map(["1"])
+    release.set()
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    assert first == second == {"1": BURGER}
+    assert product_service_mock.fetch_product_map.await_count == 2
+    assert await service.fetch_product_map(["1"]) == {"1": updated_burger}
+    assert service.stats.stale_hits == 2
+
+
+async def test_product_expired_beyond_the_grace_period_is_fetched_again():
+    clock = FakeClock()
+    product_service_mock = create_product_service_mock(BURGER)
+    service = CachedProductService(
+        product_service=product_service_mock,
+        cache=TTLCache(max_entries=10, ttl=60, clock=clock),
+        stale_grace=30,
+    )
+    await service.fetch_product_map(["1"])
+    clock.now = 90
+
+    assert await service.fetch_product_map(["1"]) == {"1": BURGER}
+    assert product_service_mock.fetch_product_map.await_count == 2
+    assert service.stats.stale_hits == 0
+
+
+async def test_failed_refresh_keeps_serving_the_expired_product():
+    clock = FakeClock()
+    product_service_mock = create_product_service_mock(BURGER)
+    service = CachedProductService(
+        product_service=product_service_mock,
+        cache=TTLCache(max_entries=10, ttl=60, clock=clock),
+        stale_grace=30,
+    )
+    await service.fetch_product_map(["1"])
+    product_service_mock.fetch_product_map.side_effect = RuntimeError("unavailable")
+    clock.now = 70
+
+    await service.fetch_product_map(["1"])
+    await asyncio.sleep(0)
+
+    assert await service.fetch_product_map(["1"]) == {"1": BURGER}
+    metrics = {metric.name: metric.value for metric in service.collect_metrics()}
+    assert metrics["product_cache_refresh_failures_total"] == 1
+
+
+async def test_products_not_found_are_remembered():
+    clock = FakeClock()
+    product_service_mock = create_product_service_mock(BURGER)
+    service = CachedProductService(
+        product_service=product_service_mock,
+        cache=TTLCache(max_entries=10, ttl=60),
+        missing_cache=TTLCache(max_entries=10, ttl=5, clock=clock),
+    )
+
+    await service.fetch_product_map(["1", "404"])
+    result = await service.fetch_product_map(["1", "404"])
+
+    assert result == {"1": BURGER}
+    product_service_mock.fetch_product_map.assert_awaited_once()
+
+    clock.now = 5
+    await service.fetch_product_map(["404"])
+
+    assert product_service_mock.fetch_product_map.await_args.args == (["404"],)
+
+
+async def test_products_missing_from_the_cache_are_read_from_the_snapshot(tmp_path):
+    path = tmp_path / "products.snapshot"
+    write_product_snapshot(path, [BURGER])
+    snapshot = ProductSnapshot(path)
+    snapshot.load()
+    product_service_mock = create_product_service_mock(BURGER, FRIES)
+    service = CachedProductService(
+        product_service=product_service_mock,
+        cache=TTLCache(max_entries=10, ttl=60),
+        snapshot=snapshot,
+    )
+
+    result = await service.fetch_product_map(["1", "2"])
+
+    assert result == {"1": BURGER, "2": FRIES}
+    assert product_service_mock.fetch_product_map.await_args.args == (["2"],)
+    assert service._cache.get("1") is None
+    snapshot.close()
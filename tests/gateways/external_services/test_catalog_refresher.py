@@ -0,0 +1,174 @@
+import asyncio
+from typing import List
+
+import httpx
+
+from src.domain.__shared.interfaces.product_service import Product
+from src.infra.cache import TTLCache
+from src.infra.gateways.external_services.cached_product_service import (
+    CachedProductService,
+)
+from src.infra.gateways.external_services.catalog_refresher import CatalogRefresher
+from src.infra.gateways.external_services.product_service import ProductServiceImpl
+from src.infra.gateways.external_services.product_snapshot import ProductSnapshot
+from src.infra.gateways.external_services.setup import (
+    initialize_product_catalog,
+    initialize_product_service,
+)
+
+
+class CatalogServer:
+    def __init__(self, *products: dict) -> None:
+        self.products = list(products)
+        self.version = 1
+        self.requests: List[httpx.Request] = []
+
+    def set_products(self, *products: dict) -> None:
+        self.products = list(products)
+        self.version += 1
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = f'"v{self.version}"'
+        if request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        return httpx.Response(200, json=self.products, headers={"ETag": etag})
+
+
+BURGER = {"id": "1", "name": "X-Burger", "price": 25.0}
+FRIES = {"id": "2", "name": "Fries", "price": 12.5}
+
+
+def create_refresher(
+    handler,  # noqa: ANN001
+    **kwargs,  # noqa: ANN003
+) -> CatalogRefresher:
+    product_service = ProductServiceImpl(
+        base_url="http://products.test", transport=httpx.MockTransport(handler)
+    )
+    return CatalogRefresher(
+        product_service=product_service,
+        product_cache=CachedProductService(
+            product_service=product_service,
+            cache=TTLCache(max_entries=10, ttl=60),
+            snapshot=kwargs.get("snapshot"),
+        ),
+        **kwargs,
+    )
+
+
+async def test_warm_up_loads_the_catalog_into_the_cache():
+    server = CatalogServer(BURGER, FRIES)
+    refresher = create_refresher(server, warm_up_timeout=1)
+
+    async with (
+        initialize_product_service(refresher._product_service),
+        initialize_product_catalog(refresher),
+    ):
+        result = await refresher._product_cache.fetch_product_map(["1", "2"])
+
+    assert result == {
+        "1": Product(id="1", name="X-Burger", price=25.0),
+        "2": Product(id="2", name="Fries", price=12.5),
+    }
+    assert len(server.requests) == 1
+
+
+async def test_refresh_of_unchanged_catalog_is_conditional():
+    server = CatalogServer(BURGER)
+    refresher = create_refresher(server)
+
+    async with initialize_product_service(refresher._product_service):
+        assert await refresher.refresh() is True
+        assert await refresher.refresh() is False
+
+    assert server.requests[1].headers["If-None-Match"] == '"v1"'
+    assert refresher._product_cache.stats.size == 1
+
+
+async def test_refresh_drops_products_removed_from_the_catalog():
+    server = CatalogServer(BURGER, FRIES)
+    refresher = create_refresher(server)
+
+    async with initialize_product_service(refresher._product_service):
+        await refresher.refresh()
+        server.set_products(FRIES)
+        assert await refresher.refresh() is True
+
+    assert refresher._product_cache.stats.size == 1
+    assert refresher._product_cache._cache.get("1") is None
+
+
+async def test_failed_warm_up_does_not_prevent_startup():
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(503)
+
+    refresher = create_refresher(failing_handler, warm_up_timeout=1)
+
+    async with (
+        initialize_product_service(refresher._product_service),
+        initialize_product_catalog(refresher),
+    ):
+        metrics = {m.name: m.value for m in refresher.collect_metrics()}
+
+    assert metrics["product_catalog_refresh_failures_total"] == 1
+    assert metrics["product_catalog_products"] == 0
+
+
+async def test_catalog_is_refreshed_periodically():
+    server = CatalogServer(BURGER)
+    refresher = create_refresher(server, refresh_interval=0.01)
+
+    async with (
+        initialize_product_service(refresher._product_service),
+        initialize_product_catalog(refresher),
+    ):
+        await asyncio.sleep(0.05)
+
+    assert len(server.requests) >= 2
+    assert all(request.url.path == "/products" for request in server.requests)
+
+
+async def test_catalog_is_persisted_and_restored_from_the_snapshot(tmp_path):
+    server = CatalogServer(BURGER, FRIES)
+    path = tmp_path / "products.snapshot"
+    refresher = create_refresher(server, snapshot=ProductSnapshot(path))
+
+    async with initialize_product_service(refresher._product_service):
+        await refresher.refresh()
+
+    restarted = create_refresher(
+        server, warm_up_timeout=1, snapshot=ProductSnapshot(path)
+    )
+    async with (
+        initialize_product_service(restarted._product_service),
+        initialize_product_catalog(restarted),
+    ):
+        result = await restarted._product_cache.fetch_product_map(["1", "2"])
+
+    assert set(result) == {"1", "2"}
+    assert server.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert restarted._product_cache.stats.size == 0
+    restarted._snapshot.close()
+    refresher._snapshot.close()
+
+
+async def test_changed_catalog_is_read_from_the_new_snapshot(tmp_path):
+    server = CatalogServer(BURGER, FRIES)
+    refresher = create_refresher(
+        server, snapshot=ProductSnapshot(tmp_path / "products.snapshot")
+    )
+    cache = refresher._product_cache
+
+    async with initialize_product_service(refresher._product_service):
+        await refresher.refresh()
+        cache.load([Product(id="2", name="Fries", price=12.5)])
+        server.set_products(BURGER, {**FRIES, "price": 14.0})
+        await refresher.refresh()
+
+        result = await cache.fetch_product_map(["1", "2"])
+
+    assert result["2"].price == 14.0
+    assert cache.stats.size == 0
+    assert len(server.requests) == 2
+    refresher._snapshot.close()
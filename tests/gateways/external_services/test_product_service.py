@@ -0,0 +1,461 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.domain.__shared.error.external_service_error import (
+    ExternalServiceError,
+    ProductLookupError,
+)
+from src.domain.__shared.error import DeadlineExceededError
+from src.domain.__shared.interfaces.product_service import Product
+from src.infra.deadline import deadline_scope
+from src.infra.gateways.external_services.product_service import ProductServiceImpl
+from src.infra.gateways.external_services.setup import initialize_product_service
+from src.infra.resilience import CircuitBreaker, RequestHedger
+
+CATALOG = {
+    "1": {"id": "1", "name": "X-Burger", "price": 25.0},
+    "2": {"id": "2", "name": "Fries", "price": 12.5},
+    "3": {"id": "3", "name": "Soda", "price": 8.0},
+}
+
+
+def catalog_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/products":
+        ids = request.url.params["ids"].split(",")
+        return httpx.Response(200, json=[CATALOG[i] for i in ids if i in CATALOG])
+
+    product_id = request.url.path.rsplit("/", 1)[-1]
+    if product := CATALOG.get(product_id):
+        return httpx.Response(200, json=product)
+    return httpx.Response(404, json={"detail": "Not found"})
+
+
+def single_product_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/products":
+        return httpx.Response(404, text="Not Found")
+    return catalog_handler(request)
+
+
+def create_product_service(
+    handler=catalog_handler,  # noqa: ANN001
+    **kwargs,  # noqa: ANN003
+) -> ProductServiceImpl:
+    return ProductServiceImpl(
+        base_url="http://products.test",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+async def test_fetch_products_by_ids_returns_products():
+    async with initialize_product_service(create_product_service()) as service:
+        result = await service.fetch_products_by_ids(["1", "2"])
+
+    assert result == [
+        Product(id="1", name="X-Burger", price=25.0),
+        Product(id="2", name="Fries", price=12.5),
+    ]
+
+
+async def test_fetch_products_by_ids_raises_when_product_is_not_found():
+    async with initialize_product_service(create_product_service()) as service:
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await service.fetch_products_by_ids(["1", "4"])
+
+    assert exc_info.value.status_code == 404
+
+
+async def test_fetch_products_by_ids_raises_on_transport_error():
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("Connection refused", request=request)
+
+    async with initialize_product_service(
+        create_product_service(failing_handler)
+    ) as service:
+        with pytest.raises(ExternalServiceError) as exc_info:
+            await service.fetch_products_by_ids(["1"])
+
+    assert exc_info.value.status_code == 500
+
+
+async def test_fetch_products_by_ids_reuses_pooled_client():
+    service = create_product_service()
+
+    async with initialize_product_service(service):
+        client = service._http
+        await service.fetch_products_by_ids(["1"])
+        await service.fetch_products_by_ids(["2"])
+        assert service._http is client
+
+    with pytest.raises(RuntimeError):
+        await service.fetch_products_by_ids(["1"])
+
+
+async def test_fetch_products_by_ids_collapses_repeated_ids():
+    requests = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return catalog_handler(request)
+
+    async with initialize_product_service(
+        create_product_service(recording_handler)
+    ) as service:
+        result = await service.fetch_products_by_ids(["1", "2", "1", "1"])
+
+    assert [product.id for product in result] == ["1", "2"]
+    assert len(requests) == 1
+    assert requests[0].url.params["ids"] == "1,2"
+
+
+async def test_fetch_products_by_ids_caps_in_flight_requests():
+    in_flight = 0
+    peak = 0
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        product_id = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(
+            200, json={"id": product_id, "name": product_id, "price": 1.0}
+        )
+
+    service = create_product_service(
+        slow_handler,
+        max_concurrency=4,
+        max_concurrency_per_call=3,
+        batch_enabled=False,
+    )
+
+    async with initialize_product_service(service):
+        await asyncio.gather(
+            service.fetch_products_by_ids([str(i) for i in range(12)]),
+            service.fetch_products_by_ids([str(i) for i in range(12, 24)]),
+        )
+
+    assert peak == 4
+
+
+async def test_fetch_products_by_ids_lists_every_missing_id():
+    async with initialize_product_service(create_product_service()) as service:
+        with pytest.raises(ProductLookupError) as exc_info:
+            await service.fetch_products_by_ids(["1", "4", "5"])
+
+    assert exc_info.value.missing_ids == ["4", "5"]
+    assert exc_info.value.failed_ids == []
+    assert exc_info.value.status_code == 404
+
+
+async def test_fetch_products_by_ids_cancels_remaining_lookups_on_failure():
+    cancelled = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/slow"):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(503)
+
+    service = create_product_service(handler, batch_enabled=False)
+    async with initialize_product_service(service):
+        with pytest.raises(ProductLookupError) as exc_info:
+            await service.fetch_products_by_ids(["slow", "broken"])
+
+    assert cancelled.is_set()
+    assert exc_info.value.failed_ids == ["broken"]
+    assert exc_info.value.missing_ids == []
+    assert exc_info.value.status_code == 503
+
+
+async def test_fetch_product_map_splits_large_id_sets_in_chunks():
+    requests = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return catalog_handler(request)
+
+    max_url_length = len("http://products.test/products?ids=") + 20
+    service = create_product_service(
+        recording_handler, batch_max_url_length=max_url_length
+    )
+    ids = [f"id-{i}" for i in range(7)] + ["1", "2", "3"]
+
+    async with initialize_product_service(service):
+        result = await service.fetch_product_map(ids)
+
+    assert set(result) == {"1", "2", "3"}
+    assert len(requests) > 1
+    assert all(len(str(request.url)) <= max_url_length for request in requests)
+    assert all(request.url.path == "/products" for request in requests)
+    assert sorted(i for r in requests for i in r.url.params["ids"].split(",")) == (
+        sorted(ids)
+    )
+
+
+async def test_fetch_product_map_falls_back_to_single_lookups():
+    requests = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return single_product_handler(request)
+
+    async with initialize_product_service(
+        create_product_service(recording_handler)
+    ) as service:
+        first = await service.fetch_product_map(["1", "2", "4"])
+        second = await service.fetch_product_map(["2", "3"])
+
+    assert set(first) == {"1", "2"}
+    assert set(second) == {"2", "3"}
+    assert requests.count("/products") == 1
+
+
+async def test_fetch_product_map_keeps_batching_after_a_json_not_found():
+    requests = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/products" and len(requests) == 1:
+            return httpx.Response(404, json={"detail": "Not found"})
+        return catalog_handler(request)
+
+    async with initialize_product_service(
+        create_product_service(recording_handler)
+    ) as service:
+        first = await service.fetch_product_map(["1", "2"])
+        second = await service.fetch_product_map(["2", "3"])
+
+    assert set(first) == {"1", "2"}
+    assert set(second) == {"2", "3"}
+    assert requests == ["/products", "/products/1", "/products/2", "/products"]
+
+
+async def test_fetch_product_map_retries_batching_after_the_retry_interval():
+    requests = []
+
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/products" and len(requests) == 1:
+            return httpx.Response(405)
+        return catalog_handler(request)
+
+    async with initialize_product_service(
+        create_product_service(recording_handler, batch_retry_interval=0.05)
+    ) as service:
+        await service.fetch_product_map(["1", "2"])
+        await service.fetch_product_map(["2", "3"])
+        await asyncio.sleep(0.05)
+        result = await service.fetch_product_map(["3", "4"])
+
+    assert set(result) == {"3"}
+    assert requests.count("/products") == 2
+    assert requests[-1] == "/products"
+
+
+async def test_concurrent_lookups_share_in_flight_requests():
+    requests = []
+    release = asyncio.Event()
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.params.get("ids", request.url.path))
+        await release.wait()
+        return catalog_handler(request)
+
+    service = create_product_service(slow_handler)
+    async with initialize_product_service(service):
+        first = asyncio.create_task(service.fetch_product_map(["1", "2"]))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(service.fetch_product_map(["2", "1", "3"]))
+        await asyncio.sleep(0.01)
+        release.set()
+
+        assert set(await first) == {"1", "2"}
+        assert set(await second) == {"1", "2", "3"}
+
+    assert requests == ["1,2", "/products/3"]
+
+
+async def test_concurrent_lookups_share_the_same_error():
+    release = asyncio.Event()
+
+    async def failing_handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return httpx.Response(503)
+
+    service = create_product_service(failing_handler)
+    async with initialize_product_service(service):
+        lookups = [
+            asyncio.create_task(service.fetch_product_map(["1", "2"])) for _ in range(3)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+
+    assert isinstance(results[0], ProductLookupError)
+    assert all(result is results[0] for result in results)
+    assert results[0].status_code == 503
+
+
+async def test_concurrent_lookups_share_an_unexpected_error_unwrapped():
+    release = asyncio.Event()
+
+    async def failing_handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        raise RuntimeError("The client was closed")
+
+    service = create_product_service(failing_handler)
+    async with initialize_product_service(service):
+        lookups = [
+            asyncio.create_task(service.fetch_product_map(["1", "2"])) for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        release.set()
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+async def test_cancelled_lookup_does_not_affect_the_lookups_sharing_it():
+    release = asyncio.Event()
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return catalog_handler(request)
+
+    service = create_product_service(slow_handler)
+    async with initialize_product_service(service):
+        leader = asyncio.create_task(service.fetch_product_map(["1"]))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(service.fetch_product_map(["1"]))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert set(await follower) == {"1"}
+
+    assert leader.cancelled()
+
+
+async def test_lookup_is_cancelled_once_every_caller_is_gone():
+    cancelled = asyncio.Event()
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    service = create_product_service(slow_handler)
+    async with initialize_product_service(service):
+        lookups = [
+            asyncio.create_task(service.fetch_product_map(["1"])) for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        for lookup in lookups:
+            lookup.cancel()
+        await asyncio.gather(*lookups, return_exceptions=True)
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+        assert service._flights.in_flight == 0
+
+
+async def test_lookup_waits_no_longer_than_the_deadline():
+    release = asyncio.Event()
+
+    async def slow_handler(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return catalog_handler(request)
+
+    service = create_product_service(slow_handler)
+    async with initialize_product_service(service):
+        follower = asyncio.create_task(service.fetch_product_map(["1"]))
+        await asyncio.sleep(0)
+        with deadline_scope(0.01), pytest.raises(DeadlineExceededError) as exc_info:
+            await service.fetch_product_map(["1"])
+        release.set()
+
+        assert set(await follower) == {"1"}
+
+    assert exc_info.value.stage == "products"
+
+
+async def test_open_circuit_rejects_requests_without_reaching_the_service():
+    requests = []
+
+    def failing_handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(503)
+
+    service = create_product_service(
+        failing_handler,
+        circuit_breaker=CircuitBreaker(window_size=2, minimum_calls=2),
+    )
+    async with initialize_product_service(service):
+        for product_id in ("1", "2", "3"):
+            with pytest.raises(ProductLookupError) as exc_info:
+                await service.fetch_products_by_ids([product_id])
+
+    assert len(requests) == 2
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.failed_ids == ["3"]
+    assert {m.name: m.value for m in service.collect_metrics()} == {
+        "product_service_circuit_open": 1,
+        "product_service_rejected_requests_total": 1,
+    }
+
+
+async def test_probe_is_released_when_it_fails_unrelated_to_the_service():
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) <= 2:
+            return httpx.Response(503)
+        if len(requests) == 3:
+            raise RuntimeError("The client was closed")
+        return catalog_handler(request)
+
+    service = create_product_service(
+        handler,
+        circuit_breaker=CircuitBreaker(window_size=2, minimum_calls=2, open_duration=0),
+    )
+    async with initialize_product_service(service):
+        for product_id in ("1", "2"):
+            with pytest.raises(ProductLookupError):
+                await service.fetch_products_by_ids([product_id])
+        with pytest.raises(RuntimeError):
+            await service.fetch_products_by_ids(["1"])
+        result = await service.fetch_products_by_ids(["1"])
+
+    assert result == [Product(id="1", name="X-Burger", price=25.0)]
+    assert len(requests) == 4
+
+
+async def test_slow_request_is_hedged():
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 6:
+            await asyncio.sleep(10)
+        return catalog_handler(request)
+
+    hedger = RequestHedger(min_delay=0.01, min_samples=5)
+    service = create_product_service(handler, hedger=hedger)
+    async with initialize_product_service(service):
+        for _ in range(5):
+            await service.fetch_products_by_ids(["1"])
+        result = await service.fetch_products_by_ids(["1"])
+
+    assert result == [Product(id="1", name="X-Burger", price=25.0)]
+    assert len(requests) == 7
+    assert hedger.hedged_requests == 1
@@ -0,0 +1,74 @@
+import random
+
+import httpx
+import pytest
+
+from src.domain.__shared.error.external_service_error import ProductLookupError
+from src.infra.gateways.external_services.product_service import ProductServiceImpl
+from src.infra.gateways.external_services.product_service_stand_in import (
+    StandInBehavior,
+    create_product_service_stand_in,
+    generate_catalog,
+)
+from src.infra.gateways.external_services.setup import initialize_product_service
+
+
+def create_product_service(**behavior) -> ProductServiceImpl:  # noqa: ANN003
+    stand_in = create_product_service_stand_in(
+        catalog_size=20,
+        behavior=StandInBehavior(latency=0, seed=1, **behavior),
+    )
+    return ProductServiceImpl(
+        base_url="http://products.test",
+        transport=httpx.ASGITransport(app=stand_in),
+    )
+
+
+async def test_stand_in_serves_the_generated_catalog():
+    catalog = {product.id: product for product in generate_catalog(20, seed=1)}
+
+    async with initialize_product_service(create_product_service()) as service:
+        result = await service.fetch_product_map(["1", "20", "21"])
+
+    assert result == {"1": catalog["1"], "20": catalog["20"]}
+
+
+async def test_stand_in_without_batch_support_is_queried_per_product():
+    async with initialize_product_service(
+        create_product_service(batch_enabled=False)
+    ) as service:
+        result = await service.fetch_product_map(["1", "2"])
+
+    assert set(result) == {"1", "2"}
+    assert service._batch_supported is False
+
+
+async def test_stand_in_injects_errors():
+    async with initialize_product_service(
+        create_product_service(error_rate=1.0)
+    ) as service:
+        with pytest.raises(ProductLookupError) as exc_info:
+            await service.fetch_product_map(["1"])
+
+    assert exc_info.value.status_code == 503
+
+
+async def test_stand_in_answers_unchanged_catalog_with_not_modified():
+    async with initialize_product_service(create_product_service()) as service:
+        catalog = await service.fetch_catalog()
+        unchanged = await service.fetch_catalog(catalog.etag)
+
+    assert len(catalog.products) == 20
+    assert unchanged is None
+
+
+@pytest.mark.parametrize(
+    "distribution", ["constant", "uniform", "exponential", "lognormal"]
+)
+def test_sampled_latency_is_never_negative(distribution) -> None:  # noqa: ANN001
+    behavior = StandInBehavior(
+        latency_distribution=distribution, latency=0.01, latency_spread=0.05
+    )
+    rng = random.Random(1)
+
+    assert all(behavior.sample_latency(rng) >= 0 for _ in range(100))
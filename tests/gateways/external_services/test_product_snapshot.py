@@ -0,0 +1,81 @@
+import pytest
+
+from src.domain.__shared.interfaces.product_service import Product
+from src.infra.gateways.external_services.product_snapshot import (
+    ProductSnapshot,
+    SnapshotFormatError,
+    write_product_snapshot,
+)
+
+PRODUCTS = [
+    Product(id="2", name="Fries", price=12.5),
+    Product(id="1", name="X-Burger", price=25.0),
+    Product(id="10", name="Pão de queijo", price=6.0),
+]
+
+
+def test_snapshot_round_trips_the_catalog(tmp_path) -> None:  # noqa: ANN001
+    path = tmp_path / "products.snapshot"
+    write_product_snapshot(path, PRODUCTS, etag='"v1"')
+
+    snapshot = ProductSnapshot(path)
+
+    assert snapshot.load() is True
+    assert len(snapshot) == 3
+    assert snapshot.etag == '"v1"'
+    assert snapshot.get("10") == Product(id="10", name="Pão de queijo", price=6.0)
+    assert snapshot.get("3") is None
+    assert [product.id for product in snapshot] == ["1", "10", "2"]
+    assert snapshot.get_many(["2", "3", "1"]) == {
+        "2": PRODUCTS[0],
+        "1": PRODUCTS[1],
+    }
+    snapshot.close()
+
+
+def test_missing_snapshot_is_not_available(tmp_path) -> None:  # noqa: ANN001
+    snapshot = ProductSnapshot(tmp_path / "products.snapshot")
+
+    assert snapshot.load() is False
+    assert snapshot.get("1") is None
+    assert len(snapshot) == 0
+
+
+def test_reload_maps_the_replaced_snapshot(tmp_path) -> None:  # noqa: ANN001
+    path = tmp_path / "products.snapshot"
+    write_product_snapshot(path, PRODUCTS[:1])
+    snapshot = ProductSnapshot(path)
+    snapshot.load()
+
+    write_product_snapshot(path, PRODUCTS[1:], etag='"v2"')
+
+    assert snapshot.get("2") == PRODUCTS[0]
+    snapshot.load()
+    assert snapshot.get("2") is None
+    assert snapshot.get("1") == PRODUCTS[1]
+    assert list(tmp_path.iterdir()) == [path]
+    snapshot.close()
+
+
+def test_mapping_is_replaced_only_once_installed(tmp_path) -> None:  # noqa: ANN001
+    path = tmp_path / "products.snapshot"
+    write_product_snapshot(path, PRODUCTS[:1])
+    snapshot = ProductSnapshot(path)
+    snapshot.load()
+    write_product_snapshot(path, PRODUCTS[1:])
+
+    mapped = snapshot.map_current()
+
+    assert snapshot.get("2") == PRODUCTS[0]
+    assert snapshot.install(mapped) is True
+    assert snapshot.get("2") is None
+    assert snapshot.get("1") == PRODUCTS[1]
+    snapshot.close()
+
+
+def test_invalid_snapshot_is_rejected(tmp_path) -> None:  # noqa: ANN001
+    path = tmp_path / "products.snapshot"
+    path.write_bytes(b"not a product snapshot")
+
+    with pytest.raises(SnapshotFormatError):
+        ProductSnapshot(path).load()
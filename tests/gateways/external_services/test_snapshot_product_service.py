@@ -0,0 +1,73 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.__shared.error.external_service_error import ProductLookupError
+from src.domain.__shared.interfaces.product_service import IProductService, Product
+from src.infra.gateways.external_services.product_snapshot import (
+    ProductSnapshot,
+    write_product_snapshot,
+)
+from src.infra.gateways.external_services.snapshot_product_service import (
+    SnapshotFallbackProductService,
+)
+
+BURGER = Product(id="1", name="X-Burger", price=25.0)
+FRIES = Product(id="2", name="Fries", price=12.5)
+
+
+@pytest.fixture
+def snapshot(tmp_path) -> ProductSnapshot:  # noqa: ANN001
+    path = tmp_path / "products.snapshot"
+    write_product_snapshot(path, [BURGER, FRIES])
+    snapshot = ProductSnapshot(path)
+    snapshot.load()
+    yield snapshot
+    snapshot.close()
+
+
+def create_service(error: Exception, snapshot: ProductSnapshot):  # noqa: ANN201
+    product_service_mock = AsyncMock(spec=IProductService)
+    product_service_mock.fetch_product_map.side_effect = error
+    return SnapshotFallbackProductService(product_service_mock, snapshot)
+
+
+async def test_products_are_served_from_snapshot_when_service_fails(snapshot):
+    service = create_service(
+        ProductLookupError(failed_ids=["1", "2"], status_code=503), snapshot
+    )
+
+    result = await service.fetch_products_by_ids(["1", "2"])
+
+    assert result == [BURGER, FRIES]
+    assert service.collect_metrics()[0].value == 1
+
+
+async def test_products_not_found_are_not_served_from_snapshot(snapshot):
+    service = create_service(ProductLookupError(missing_ids=["1"]), snapshot)
+
+    with pytest.raises(ProductLookupError) as exc_info:
+        await service.fetch_products_by_ids(["1"])
+
+    assert exc_info.value.status_code == 404
+
+
+async def test_products_not_found_fail_the_lookup_when_others_failed(snapshot):
+    error = ProductLookupError(missing_ids=["1"], failed_ids=["2"], status_code=503)
+    service = create_service(error, snapshot)
+
+    with pytest.raises(ProductLookupError) as exc_info:
+        await service.fetch_products_by_ids(["1", "2"])
+
+    assert exc_info.value is error
+    assert service.collect_metrics()[0].value == 0
+
+
+async def test_failure_is_raised_when_product_is_absent_from_snapshot(snapshot):
+    error = ProductLookupError(failed_ids=["1", "3"], status_code=503)
+    service = create_service(error, snapshot)
+
+    with pytest.raises(ProductLookupError) as exc_info:
+        await service.fetch_products_by_ids(["1", "3"])
+
+    assert exc_info.value is error
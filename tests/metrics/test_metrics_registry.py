@@ -0,0 +1,28 @@
+from src.infra.metrics import Metric, MetricsRegistry
+
+
+def test_render_outputs_prometheus_text_format() -> None:
+    registry = MetricsRegistry()
+    registry.register(lambda: [Metric("requests_total", 3, "Requests served.")])
+    registry.register(
+        lambda: [Metric("queue_size", 1, "Queued requests.", type="gauge")]
+    )
+
+    assert registry.render() == (
+        "# HELP requests_total Requests served.\n"
+        "# TYPE requests_total counter\n"
+        "requests_total 3\n"
+        "# HELP queue_size Queued requests.\n"
+        "# TYPE queue_size gauge\n"
+        "queue_size 1\n"
+    )
+
+
+def test_collectors_are_called_at_collection_time() -> None:
+    registry = MetricsRegistry()
+    counter = {"value": 0}
+    registry.register(lambda: [Metric("calls_total", counter["value"], "Calls.")])
+
+    counter["value"] = 5
+
+    assert registry.collect() == [Metric("calls_total", 5, "Calls.")]
@@ -0,0 +1,109 @@
+import asyncio
+from typing import List
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.domain.order.events import OrderEvent, OrderEventType
+from src.domain.order.outbox import IOrderEventHandler, IOrderOutbox, OutboxDelivery
+from src.infra.outbox import OutboxDispatcher, initialize_outbox_dispatcher
+
+
+def create_delivery(order_id: str) -> OutboxDelivery:
+    return OutboxDelivery(
+        order_id=order_id,
+        events=[
+            OrderEvent(type=OrderEventType.ORDER_CREATED, order_external_id=order_id)
+        ],
+        lease_token="token",
+    )
+
+
+def create_dispatcher(
+    deliveries: List[OutboxDelivery],
+    **kwargs,  # noqa: ANN003
+) -> OutboxDispatcher:
+    async def claim(limit: int, lease_duration: float) -> List[OutboxDelivery]:
+        claimed = deliveries[:limit]
+        del deliveries[:limit]
+        return claimed
+
+    outbox_mock = AsyncMock(spec=IOrderOutbox)
+    outbox_mock.claim.side_effect = claim
+    outbox_mock.acknowledge.return_value = True
+
+    return OutboxDispatcher(
+        outbox=outbox_mock,
+        handler=AsyncMock(spec=IOrderEventHandler),
+        **{"poll_interval": 0.01, **kwargs},
+    )
+
+
+def metrics(dispatcher: OutboxDispatcher) -> dict:
+    return {m.name: m.value for m in dispatcher.collect_metrics()}
+
+
+async def test_pending_events_are_handled_and_acknowledged():
+    deliveries = [create_delivery(str(i)) for i in range(5)]
+    dispatcher = create_dispatcher(list(deliveries), batch_size=2)
+
+    async with initialize_outbox_dispatcher(dispatcher):
+        await asyncio.sleep(0.05)
+
+    handled = [c.args[0] for c in dispatcher._handler.handle.await_args_list]
+    assert sorted(handled, key=lambda e: e.order_external_id) == [
+        d.events[0] for d in deliveries
+    ]
+    assert dispatcher._outbox.acknowledge.await_count == 5
+    assert metrics(dispatcher)["order_outbox_delivered_events_total"] == 5
+
+
+async def test_failed_delivery_is_not_acknowledged():
+    dispatcher = create_dispatcher([])
+    dispatcher._handler.handle.side_effect = ConnectionError()
+
+    assert not await dispatcher.deliver(create_delivery("1"))
+
+    dispatcher._outbox.acknowledge.assert_not_awaited()
+    assert metrics(dispatcher)["order_outbox_failed_deliveries_total"] == 1
+
+
+async def test_dispatch_leases_no_more_than_the_queue_holds():
+    release = asyncio.Event()
+    dispatcher = create_dispatcher(
+        [create_delivery(str(i)) for i in range(10)],
+        workers=1,
+        batch_size=10,
+        queue_size=3,
+    )
+
+    async def handle(event: OrderEvent) -> None:
+        await release.wait()
+
+    dispatcher._handler.handle.side_effect = handle
+
+    assert await dispatcher.dispatch() == 3
+    dispatch = asyncio.create_task(dispatcher.dispatch())
+    await asyncio.sleep(0.01)
+    assert not dispatch.done()
+
+    async with initialize_outbox_dispatcher(dispatcher):
+        assert await asyncio.wait_for(dispatch, timeout=1) >= 1
+        release.set()
+
+    limits = [c.args[0] for c in dispatcher._outbox.claim.await_args_list]
+    assert all(limit <= 3 for limit in limits)
+
+
+async def test_idle_dispatcher_does_not_read_the_outbox():
+    dispatcher = create_dispatcher([], workers=0)
+
+    async with initialize_outbox_dispatcher(dispatcher):
+        await asyncio.sleep(0.02)
+
+    dispatcher._outbox.claim.assert_not_awaited()
+
+
+def test_queue_must_hold_a_delivery():
+    with pytest.raises(ValueError):
+        create_dispatcher([], queue_size=0)
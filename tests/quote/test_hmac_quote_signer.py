@@ -0,0 +1,60 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.domain.__shared.interfaces.product_service import Product
+from src.domain.order.quote import PriceQuote
+from src.infra.quote import HmacQuoteSigner
+
+NOW = datetime(2024, 2, 3, 8, 0, tzinfo=timezone.utc)
+QUOTE = PriceQuote(
+    products={
+        "1": Product(id="1", name="X-Burger", price=25.0),
+        "2": Product(id="2", name="Fries", price=12.5),
+    },
+    expires_at=NOW + timedelta(minutes=5),
+)
+
+
+def create_signer(secret: bytes = b"secret", now: datetime = NOW) -> HmacQuoteSigner:
+    return HmacQuoteSigner(secret=secret, clock=lambda: now)
+
+
+def test_verify_returns_the_signed_quote():
+    signer = create_signer()
+
+    assert signer.verify(signer.sign(QUOTE)) == QUOTE
+
+
+def test_verify_rejects_expired_quotes():
+    token = create_signer().sign(QUOTE)
+
+    assert create_signer(now=QUOTE.expires_at).verify(token) is None
+
+
+def test_verify_rejects_quotes_signed_with_another_secret():
+    token = create_signer(secret=b"other").sign(QUOTE)
+
+    assert create_signer().verify(token) is None
+
+
+def test_verify_rejects_tampered_quotes():
+    signer = create_signer()
+    cheaper = PriceQuote(
+        products={"1": Product(id="1", name="X-Burger", price=1.0)},
+        expires_at=QUOTE.expires_at,
+    )
+    payload, _ = signer.sign(cheaper).split(".")
+    _, signature = signer.sign(QUOTE).split(".")
+
+    assert signer.verify(f"{payload}.{signature}") is None
+
+
+@pytest.mark.parametrize("token", ["", "garbage", "a.b.c", "***.***"])
+def test_verify_rejects_malformed_tokens(token: str):
+    assert create_signer().verify(token) is None
+
+
+def test_secret_must_not_be_empty():
+    with pytest.raises(ValueError):
+        HmacQuoteSigner(secret=b"")
@@ -0,0 +1,102 @@
+import pytest
+
+from src.infra.resilience import CircuitBreaker, CircuitOpenError, CircuitState
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_circuit_breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        window_size=4,
+        minimum_calls=4,
+        failure_rate_threshold=0.5,
+        slow_call_duration=1.0,
+        slow_call_rate_threshold=0.75,
+        open_duration=10,
+        clock=clock,
+    )
+
+
+def test_circuit_opens_when_failure_rate_is_reached() -> None:
+    breaker = create_circuit_breaker(FakeClock())
+
+    for failed in (False, True, False, True):
+        breaker.acquire()
+        breaker.record(0.1, failed)
+
+    assert breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    assert breaker.rejected_calls == 1
+
+
+def test_circuit_opens_when_slow_call_rate_is_reached() -> None:
+    breaker = create_circuit_breaker(FakeClock())
+
+    for duration in (1.0, 2.0, 0.1, 1.5):
+        breaker.acquire()
+        breaker.record(duration, failed=False)
+
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_circuit_stays_closed_until_minimum_calls() -> None:
+    breaker = create_circuit_breaker(FakeClock())
+
+    for _ in range(3):
+        breaker.acquire()
+        breaker.record(0.1, failed=True)
+
+    assert breaker.state == CircuitState.CLOSED
+
+
+def test_half_open_circuit_lets_a_single_probe_through() -> None:
+    clock = FakeClock()
+    breaker = create_circuit_breaker(clock)
+    for _ in range(4):
+        breaker.record(0.1, failed=True)
+
+    clock.now = 10
+
+    assert breaker.state == CircuitState.HALF_OPEN
+    assert breaker.acquire() is True
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+
+    breaker.record(0.1, failed=False, probe=True)
+
+    assert breaker.state == CircuitState.CLOSED
+    assert breaker.acquire() is False
+
+
+def test_failed_probe_reopens_the_circuit() -> None:
+    clock = FakeClock()
+    breaker = create_circuit_breaker(clock)
+    for _ in range(4):
+        breaker.record(0.1, failed=True)
+    clock.now = 10
+
+    probe = breaker.acquire()
+    breaker.record(0.1, failed=True, probe=probe)
+
+    assert breaker.state == CircuitState.OPEN
+    clock.now = 19
+    assert breaker.state == CircuitState.OPEN
+
+
+def test_released_probe_lets_another_probe_through() -> None:
+    clock = FakeClock()
+    breaker = create_circuit_breaker(clock)
+    for _ in range(4):
+        breaker.record(0.1, failed=True)
+    clock.now = 10
+
+    breaker.release(breaker.acquire())
+
+    assert breaker.acquire() is True
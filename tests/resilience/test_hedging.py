@@ -0,0 +1,134 @@
+import asyncio
+import gc
+
+import pytest
+
+from src.infra.resilience import RequestHedger
+
+
+def create_warm_hedger(latency: float = 0.01) -> RequestHedger:
+    hedger = RequestHedger(percentile=0.95, min_delay=0, min_samples=5)
+    for _ in range(5):
+        hedger.record(latency)
+    return hedger
+
+
+async def test_delay_requires_enough_samples():
+    hedger = RequestHedger(min_samples=3, min_delay=0.05)
+    hedger.record(0.01)
+    hedger.record(0.2)
+
+    assert hedger.delay is None
+
+    hedger.record(0.02)
+
+    assert hedger.delay == 0.2
+
+
+async def test_fast_request_is_not_hedged():
+    hedger = create_warm_hedger()
+    calls = 0
+
+    async def send() -> str:
+        nonlocal calls
+        calls += 1
+        return "response"
+
+    assert await hedger.run(send) == "response"
+    assert calls == 1
+    assert hedger.hedged_requests == 0
+
+
+async def test_slow_request_is_hedged_and_first_response_is_kept():
+    hedger = create_warm_hedger()
+    calls = 0
+    cancelled = asyncio.Event()
+
+    async def send() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return f"response {calls}"
+
+    assert await hedger.run(send) == "response 2"
+    assert hedger.hedged_requests == 1
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+async def test_hedged_request_fails_only_when_every_copy_fails():
+    hedger = create_warm_hedger()
+
+    async def send() -> str:
+        await asyncio.sleep(0.02)
+        raise ConnectionError("unavailable")
+
+    with pytest.raises(ConnectionError):
+        await hedger.run(send)
+
+
+async def test_duplicate_takes_a_slot_of_the_limiter():
+    hedger = create_warm_hedger()
+    limiter = asyncio.Semaphore(2)
+    in_flight = []
+
+    async def send() -> str:
+        in_flight.append(2 - limiter._value)
+        await asyncio.sleep(0.05 if len(in_flight) == 1 else 0)
+        return "response"
+
+    async with limiter:
+        assert await hedger.run(send, limiter=limiter) == "response"
+
+    assert hedger.hedged_requests == 1
+    assert in_flight == [1, 2]
+
+
+async def test_request_is_not_hedged_while_the_limiter_is_full():
+    hedger = create_warm_hedger()
+    limiter = asyncio.Semaphore(1)
+    calls = 0
+
+    async def send() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return "response"
+
+    async with limiter:
+        assert await hedger.run(send, limiter=limiter) == "response"
+
+    assert calls == 1
+    assert hedger.hedged_requests == 0
+
+
+async def test_errors_of_the_losing_copies_are_retrieved():
+    hedger = create_warm_hedger()
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+    calls = 0
+
+    async def send() -> str:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(0.02)
+            return "response"
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            raise ConnectionError("closed") from None
+
+    try:
+        assert await hedger.run(send) == "response"
+        await asyncio.sleep(0)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unhandled == []